@@ -2,8 +2,13 @@ import os
 from flask import Flask, render_template_string, jsonify, request
 from scrapers import HackathonScraper
 from india_scrapers import IndiaHackathonScraper
+from orchestrator import scrape_all, iter_scraped
 from manual_sources import get_manual_hackathons
-from filters import apply_all_filters, get_statistics
+from filters import apply_all_filters
+from instrumentation import load_reports
+import records
+from search import MAX_PER_PAGE, PER_PAGE, SearchIndex
+from stats import HackathonStats
 from datetime import datetime, timedelta
 import threading
 import time
@@ -15,40 +20,37 @@ app = Flask(__name__)
 cached_hackathons = []
 last_updated = None
 update_history = []
-platform_stats = {}
+# Counters and search index over cached_hackathons, kept in step with it
+stats = HackathonStats()
+search_index = SearchIndex()
 
 def update_hackathons():
     """Background job to update hackathons"""
-    global cached_hackathons, last_updated, update_history, platform_stats
+    global cached_hackathons, last_updated, update_history
     
     while True:
         try:
             print(f"🔄 Updating hackathons at {datetime.now()}")
             
-            # Scrape all sources
-            hackathons = []
+            # Manual sources are ready right away
+            hackathons = get_manual_hackathons()
             
-            # International platforms
-            scraper = HackathonScraper()
-            hackathons.extend(scraper.get_all_hackathons())
-            
-            # India platforms
-            india_scraper = IndiaHackathonScraper()
-            hackathons.extend(india_scraper.get_all_india_hackathons())
-            
-            # Manual sources
-            hackathons.extend(get_manual_hackathons())
+            # International and India platforms stream in as each one finishes
+            for source, records in iter_scraped([HackathonScraper, IndiaHackathonScraper]):
+                hackathons.extend(records)
+                
+                # On first load, serve partial data instead of an empty dashboard
+                if last_updated is None:
+                    cached_hackathons = apply_all_filters(hackathons, live_only=True)
+                    stats.sync(cached_hackathons)
+                    search_index.sync(cached_hackathons)
             
             # Apply filters - LIVE only
             hackathons = apply_all_filters(hackathons, live_only=True)
             
-            # Calculate platform statistics
-            platform_stats = {}
-            for hack in hackathons:
-                platform = hack.get('platform', 'Unknown')
-                if platform not in platform_stats:
-                    platform_stats[platform] = 0
-                platform_stats[platform] += 1
+            # Update statistics and search (only what changed since the last snapshot)
+            stats.sync(hackathons)
+            search_index.sync(hackathons)
             
             # Store update history
             update_history.append({
@@ -547,6 +549,17 @@ DASHBOARD_HTML = """
             background: #e5e7eb;
         }
         
+        /* More search results */
+        .load-more {
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            gap: 15px;
+            margin-top: 30px;
+            color: var(--white);
+            font-weight: 500;
+        }
+        
         /* Platform Chart */
         .chart-section {
             background: rgba(255, 255, 255, 0.95);
@@ -833,6 +846,7 @@ DASHBOARD_HTML = """
                     <label class="filter-label">Sort By</label>
                     <select class="filter-select" id="sort-filter">
                         <option value="name">Name</option>
+                        <option value="relevance">Best Match</option>
                         <option value="platform">Platform</option>
                         <option value="prize">Prize Pool</option>
                     </select>
@@ -1115,30 +1129,85 @@ DASHBOARD_HTML = """
             
             container.innerHTML = `<div class="hackathons-grid">${hackathonsHTML}</div>`;
             
+            // A search with more matches than loaded so far pages in the rest on demand
+            if (searchResults && searchResults.page < searchResults.pages) {
+                container.insertAdjacentHTML('beforeend', `
+                    <div class="load-more">
+                        <span>Showing ${searchResults.hackathons.length} of ${searchResults.total}</span>
+                        <button class="btn btn-secondary" onclick="loadMoreResults()">
+                            <i class="fas fa-chevron-down"></i> Load More
+                        </button>
+                    </div>
+                `);
+            }
+            
             // Reinitialize AOS for new elements
             AOS.refresh();
         }
 
-        // Filter hackathons
+        // Filter hackathons; a search term is looked up on the server (/api/search)
+        let searchTimer = null;
+        let searchRequest = 0;
+        // The current search: its terms, the pages loaded so far and how many there are (null when not searching)
+        let searchResults = null;
+        
         function filterHackathons() {
-            const searchTerm = document.getElementById('search-input').value.toLowerCase();
+            clearTimeout(searchTimer);
+            const searchTerm = document.getElementById('search-input').value.trim();
             const platform = document.getElementById('platform-filter').value;
             const mode = document.getElementById('mode-filter').value;
-            const sortBy = document.getElementById('sort-filter').value;
             
-            filteredHackathons = allHackathons.filter(hack => {
-                const matchesSearch = !searchTerm || 
-                    hack.name.toLowerCase().includes(searchTerm) ||
-                    (hack.organizer && hack.organizer.toLowerCase().includes(searchTerm)) ||
-                    hack.platform.toLowerCase().includes(searchTerm);
-                
-                const matchesPlatform = !platform || hack.platform === platform;
-                const matchesMode = !mode || hack.mode === mode;
+            // One letter isn't a search yet (the server only matches it as a whole word)
+            if (searchTerm.length >= 2) {
+                // Wait for a pause in typing instead of searching on every keystroke
+                searchTimer = setTimeout(() => searchHackathons(searchTerm, platform, mode), 150);
+                return;
+            }
+            
+            searchRequest++;
+            searchResults = null;
+            showHackathons(allHackathons.filter(hack =>
+                (!platform || hack.platform === platform) && (!mode || hack.mode === mode)
+            ));
+        }
+        
+        async function searchHackathons(searchTerm, platform, mode, page = 1) {
+            const request = ++searchRequest;
+            const params = new URLSearchParams({ q: searchTerm, page: page, per_page: 100 });
+            if (platform) params.set('platform', platform);
+            if (mode) params.set('mode', mode);
+            
+            try {
+                const response = await fetch(`/api/search?${params}`);
+                const data = await response.json();
                 
-                return matchesSearch && matchesPlatform && matchesMode;
-            });
+                // Results of an older keystroke may arrive after newer ones
+                if (request === searchRequest) {
+                    const loaded = page > 1 && searchResults ? searchResults.hackathons : [];
+                    searchResults = {
+                        term: searchTerm, platform: platform, mode: mode,
+                        page: data.page, pages: data.pages, total: data.total,
+                        hackathons: loaded.concat(data.hackathons)
+                    };
+                    // A copy: sorting it must not lose the search ranking of the pages loaded
+                    showHackathons(searchResults.hackathons.slice());
+                }
+            } catch (error) {
+                console.error('Error searching hackathons:', error);
+            }
+        }
+        
+        function loadMoreResults() {
+            if (searchResults && searchResults.page < searchResults.pages) {
+                searchHackathons(searchResults.term, searchResults.platform, searchResults.mode, searchResults.page + 1);
+            }
+        }
+        
+        function showHackathons(hackathons) {
+            const sortBy = document.getElementById('sort-filter').value;
+            filteredHackathons = hackathons;
             
-            // Sort hackathons
+            // Sort hackathons ('relevance' keeps the search ranking)
             if (sortBy === 'platform') {
                 filteredHackathons.sort((a, b) => a.platform.localeCompare(b.platform));
             } else if (sortBy === 'prize') {
@@ -1147,7 +1216,7 @@ DASHBOARD_HTML = """
                     const prizeB = parseInt((b.prize_pool || '0').replace(/[^\d]/g, '') || '0');
                     return prizeB - prizeA;
                 });
-            } else {
+            } else if (sortBy === 'name') {
                 filteredHackathons.sort((a, b) => a.name.localeCompare(b.name));
             }
             
@@ -1240,45 +1309,60 @@ def index():
 @app.route('/api/hackathons')
 def api_hackathons():
     """API endpoint for hackathons"""
-    global cached_hackathons, last_updated, platform_stats
+    global cached_hackathons, last_updated
     
     if not cached_hackathons:
         # Initial load if cache is empty
-        hackathons = []
-        
         try:
-            scraper = HackathonScraper()
-            hackathons.extend(scraper.get_all_hackathons())
-            
-            india_scraper = IndiaHackathonScraper()
-            hackathons.extend(india_scraper.get_all_india_hackathons())
+            hackathons = scrape_all([HackathonScraper, IndiaHackathonScraper])
             
             hackathons.extend(get_manual_hackathons())
             hackathons = apply_all_filters(hackathons, live_only=True)
             
-            # Calculate platform stats
-            platform_stats = {}
-            for hack in hackathons:
-                platform = hack.get('platform', 'Unknown')
-                if platform not in platform_stats:
-                    platform_stats[platform] = 0
-                platform_stats[platform] += 1
-            
+            stats.sync(hackathons)
+            search_index.sync(hackathons)
             cached_hackathons = hackathons
             last_updated = datetime.now()
         except:
             pass
     
-    # Calculate additional stats
-    fresher_count = len([h for h in cached_hackathons if h.get('fresher_friendly', False)])
+    # Counters are kept up to date by stats.sync, nothing is counted per request
+    counts = stats.snapshot()
     
-    return jsonify({
+    # Each record's JSON is cached, only the envelope is encoded per request
+    return app.response_class(records.dumps({
         'hackathons': cached_hackathons,
         'total': len(cached_hackathons),
-        'platform_count': len(platform_stats),
-        'fresher_count': fresher_count,
-        'platform_stats': platform_stats,
+        'platform_count': counts['platforms'],
+        'fresher_count': counts['fresher_friendly'],
+        'platform_stats': counts['by_platform'],
         'last_updated': last_updated.isoformat() if last_updated else datetime.now().isoformat()
+    }), mimetype='application/json')
+
+@app.route('/api/search')
+def api_search():
+    """Search the cached hackathons by name, organizer and platform (word prefixes), best match first"""
+    query = request.args.get('q', '')
+    page = max(request.args.get('page', 1, type=int), 1)
+    per_page = min(max(request.args.get('per_page', PER_PAGE, type=int), 1), MAX_PER_PAGE)
+    results, total = search_index.search(query, page=page, per_page=per_page,
+                                         platform=request.args.get('platform'), mode=request.args.get('mode'))
+    
+    return app.response_class(records.dumps({
+        'query': query,
+        'hackathons': results,
+        'total': total,
+        'page': page,
+        'per_page': per_page,
+        'pages': -(-total // per_page),
+    }), mimetype='application/json')
+
+@app.route('/api/stats')
+def api_stats():
+    """Precomputed statistics of the cached hackathons"""
+    return jsonify({
+        **stats.snapshot(),
+        'last_updated': last_updated.isoformat() if last_updated else None
     })
 
 @app.route('/health')
@@ -1291,6 +1375,12 @@ def health():
         'time': datetime.now().isoformat()
     })
 
+@app.route('/health/runs')
+def health_runs():
+    """Per-source timing reports of the most recent scrape runs, newest first"""
+    limit = request.args.get('limit', 5, type=int)
+    return jsonify(load_reports(limit))
+
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
     app.run(host='0.0.0.0', port=port, debug=False)
\ No newline at end of file
@@ -0,0 +1,155 @@
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+from storage import cache_path
+
+# 'on': keep every fetched page body in .cache/archive/ for offline re-extraction
+# 'off': don't archive anything
+ARCHIVE_MODE = os.getenv('HACKATHON_ARCHIVE', 'on')
+
+# Runs kept in the archive; older ones, and the bodies only they used, are pruned
+ARCHIVE_KEEP_RUNS = int(os.getenv('HACKATHON_ARCHIVE_KEEP_RUNS', 10))
+
+
+class PageArchive:
+    """
+    Compressed, content-addressed store of every page body fetched.
+
+    Bodies are gzipped under objects/<hash[:2]>/<hash>.gz, named by their
+    SHA-256 (the same hash ResponseCache keeps), so a page that didn't
+    change between runs is stored once. index.jsonl records which URL
+    returned which body in which run, one JSON line per fetch, so several
+    processes can append to it safely. prune() keeps the last
+    ARCHIVE_KEEP_RUNS runs.
+    """
+
+    def __init__(self, root=None, run_id=None):
+        self.root = root or cache_path('archive')
+        # Web workers and the scheduler may start a run in the same second
+        self.run_id = run_id or f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+        self.index_path = os.path.join(self.root, 'index.jsonl')
+        self._lock = threading.Lock()
+
+    def _object_path(self, digest):
+        return os.path.join(self.root, 'objects', digest[:2], f"{digest}.gz")
+
+    def add(self, url, body=None, content_type=None, digest=None):
+        """
+        Archive what url returned in this run. Pass the body, or just the
+        digest of a body archived before (a 304 confirming an unchanged page).
+        Returns the digest, or None if there was nothing to point at.
+        """
+        if body is not None:
+            digest = hashlib.sha256(body).hexdigest()
+        path = self._object_path(digest) if digest else None
+        if body is not None and not os.path.exists(path):
+            self._write_object(path, body)
+        elif not path or not os.path.exists(path):
+            return None
+        else:
+            # In use again: prune() leaves recently touched objects alone
+            try:
+                os.utime(path)
+            except OSError:
+                return None
+
+        line = json.dumps({
+            'run': self.run_id,
+            'url': url,
+            'hash': digest,
+            'content_type': content_type,
+            'fetched_at': time.time(),
+        }, ensure_ascii=False)
+        with self._lock:
+            os.makedirs(self.root, exist_ok=True)
+            with open(self.index_path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+        return digest
+
+    def _write_object(self, path, body):
+        """Write a gzipped body atomically, so readers never see half an object"""
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                # mtime=0 keeps the compressed bytes identical for identical bodies
+                with gzip.GzipFile(fileobj=f, mode='wb', mtime=0) as gz:
+                    gz.write(body)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def read(self, digest):
+        """An archived body, or None if it isn't there"""
+        try:
+            with gzip.open(self._object_path(digest), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def entries(self):
+        """Every index line, oldest first (lines cut short by a crash are skipped)"""
+        entries = []
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        continue
+        except OSError:
+            pass
+        return entries
+
+    def runs(self):
+        """{run id: {url: index entry}} for every archived run, oldest first"""
+        runs = {}
+        for entry in self.entries():
+            # A URL fetched twice in a run counts with its last body
+            runs.setdefault(entry['run'], {})[entry['url']] = entry
+        return runs
+
+    def prune(self, keep=ARCHIVE_KEEP_RUNS):
+        """
+        Drop every run but the last keep from the index, then the bodies
+        no remaining run points at. Objects touched since the oldest kept
+        run started are left alone: another process may be archiving them.
+        Returns the number of runs dropped.
+        """
+        with self._lock:
+            entries = self.entries()
+            runs = list(dict.fromkeys(entry['run'] for entry in entries))
+            if len(runs) <= keep:
+                return 0
+            kept_runs = set(runs[-keep:]) if keep > 0 else set()
+            kept = [entry for entry in entries if entry['run'] in kept_runs]
+
+            fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    for entry in kept:
+                        f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                os.replace(tmp_path, self.index_path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+        referenced = {entry['hash'] for entry in kept}
+        cutoff = min((entry['fetched_at'] for entry in kept), default=time.time())
+        objects = os.path.join(self.root, 'objects')
+        for directory, _, names in os.walk(objects):
+            for name in names:
+                path = os.path.join(directory, name)
+                if name[:-len('.gz')] in referenced or os.path.getmtime(path) >= cutoff:
+                    continue
+                os.remove(path)
+        return len(runs) - len(kept_runs)
@@ -0,0 +1,138 @@
+"""
+Near-duplicate benchmark: how merge_duplicates scales with the number of records.
+
+Takes the synthetic records of the filter benchmark and lists some of
+them a second time the way another source would: a track suffix on the
+name, a trailing slash or tracking parameters on the link, the case
+changed. Reports the time per size, the time per record (flat when the
+index is linear) and how many of the planted duplicates were merged.
+
+First checks merge_duplicates on the real pairs it has to get right (or
+must leave apart), and exits non-zero if any comes out wrong.
+
+    python -m benchmarks.dedupe
+    python -m benchmarks.dedupe --sizes 1000 10000
+"""
+import argparse
+import random
+import sys
+import time
+
+from benchmarks.filters import synthetic_records
+from dedupe import merge_duplicates
+
+# Share of events listed a second time by "another source"
+VARIANT_RATE = 0.2
+
+# Event names are made of these, like the ones on the listings
+THEMES = ['AI', 'Climate', 'FinTech', 'HealthTech', 'Web3', 'Smart City', 'EdTech', 'Open Source', 'Cyber',
+          'Data', 'AgriTech', 'Space', 'Quantum', 'Mobility', 'Gaming', 'Cloud', 'Robotics', 'Social Good']
+KINDS = ['Hackathon', 'Challenge', 'Hack', 'Buildathon', 'Codefest', 'Sprint', 'Jam', 'Summit Hack']
+HOSTS = ['Google', 'Microsoft', 'Flipkart', 'IIT Bombay', 'NASA', 'Amazon', 'Devfolio', 'MLH', 'Tata', 'Infosys',
+         'BITS Pilani', 'Wells Fargo', 'ETHIndia', 'Red Bull', 'Schneider', 'IBM', 'Meta', 'Adobe']
+
+
+def _listing(name, link, platform, organizer=''):
+    return {'name': name, 'registration_link': link, 'platform': platform, 'organizer': organizer}
+
+
+# (what, records, how many events they are)
+KNOWN_CASES = [
+    ("manual_sources GRiD vs Unstop's listing of a track", [
+        _listing('Flipkart GRiD 6.0', 'https://unstop.com/hackathons/flipkart-grid', 'Other', 'Flipkart'),
+        _listing('Flipkart GRiD 6.0 - Software Development Track',
+                 'https://unstop.com/hackathons/flipkart-grid-60-software-development-track-flipkart-grid-60-flipkart-1024802',
+                 'Unstop', 'Flipkart'),
+    ], 1),
+    ("two tracks don't merge through the event's short name", [
+        _listing('Flipkart GRiD 6.0 - Software Development Track', 'https://unstop.com/hackathons/grid-sd', 'Unstop'),
+        _listing('Flipkart GRiD 6.0', 'https://devfolio.co/grid', 'Devfolio'),
+        _listing('Flipkart GRiD 6.0 - Robotics Track', 'https://unstop.com/hackathons/grid-robotics', 'Unstop'),
+    ], 2),
+    ("fallback names on different pages", [
+        _listing('GFG Event', 'https://practice.geeksforgeeks.org/events/a', 'GeeksforGeeks'),
+        _listing('GFG Event', 'https://practice.geeksforgeeks.org/events/b', 'GeeksforGeeks'),
+        _listing('Unstop Challenge', 'https://unstop.com/hackathons/a', 'Unstop'),
+        _listing('Unstop Challenge', 'https://unstop.com/hackathons/b', 'Unstop'),
+        _listing('HackerRank Contest', 'https://www.hackerrank.com/contests/a', 'HackerRank'),
+        _listing('HackerRank Contest', 'https://www.hackerrank.com/contests/b', 'HackerRank'),
+    ], 6),
+    ("a later season of a generic name", [
+        _listing('AI Hackathon', 'https://devpost.com/ai', 'Devpost'),
+        _listing('AI Hackathon Season Two', 'https://mlh.io/ai-2', 'MLH'),
+    ], 2),
+    ("one event, two sources, tracking parameters and case", [
+        _listing('Google Climate Hack 2025', 'https://devpost.com/climate', 'Devpost', 'Google'),
+        _listing('GOOGLE CLIMATE HACK 2025', 'http://www.devpost.com/climate/?utm_source=mlh', 'MLH'),
+    ], 1),
+]
+
+
+def check_known_cases():
+    """Print how merge_duplicates handles KNOWN_CASES; the number that came out wrong"""
+    wrong = 0
+    for what, records, events in KNOWN_CASES:
+        merged = len(merge_duplicates(records))
+        ok = merged == events
+        wrong += not ok
+        print(f"   {'✅' if ok else '❌'} {what}: {len(records)} records -> {merged} (expected {events})")
+    return wrong
+
+
+def variant(hack, rng):
+    """The same event as another source would list it"""
+    name, link = hack['name'], hack['registration_link']
+    change = rng.randrange(4)
+    if change == 0:
+        name = f"{name} - {rng.choice(['Software Development', 'Online', 'Student'])} Track"
+    elif change == 1:
+        link = f"{link}/?utm_source={rng.choice(['devfolio', 'mlh', 'newsletter'])}"
+    elif change == 2:
+        name = name.upper()
+        link = link.replace('https://', 'http://www.')
+    else:
+        link = f"{link}/"
+    return hack.replace(name=name, registration_link=link, platform='Other', prize_pool='N/A')
+
+
+def with_variants(size, seed=0):
+    """size records, about VARIANT_RATE of them variants of earlier ones; and how many"""
+    rng = random.Random(seed)
+    records = [hack.replace(name=f"{rng.choice(HOSTS)} {rng.choice(THEMES)} {rng.choice(KINDS)} "
+                                 f"{rng.randrange(2015, 2027)} #{i}")
+               for i, hack in enumerate(synthetic_records(int(size / (1 + VARIANT_RATE)), seed))]
+    # Only distinct events get a variant, the synthetic records already repeat some
+    unique = list({hack.dedupe_key: hack for hack in records}.values())
+    variants = [variant(hack, rng) for hack in rng.sample(unique, size - len(records))]
+    events = len(unique)
+    records += variants
+    rng.shuffle(records)
+    return records, events
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000])
+    args = parser.parse_args()
+
+    print("\n🔎 KNOWN CASES\n")
+    wrong = check_known_cases()
+
+    print("\n📊 NEAR-DUPLICATE BENCHMARK (merge_duplicates)\n")
+    print(f"{'records':>10}{'events':>10}{'merged to':>11}{'seconds':>10}{'µs/record':>11}")
+
+    for size in args.sizes:
+        records, events = with_variants(size)
+        start = time.perf_counter()
+        merged = merge_duplicates(records)
+        seconds = time.perf_counter() - start
+        print(f"{size:>10}{events:>10}{len(merged):>11}{seconds:>10.2f}{seconds / size * 1e6:>11.1f}")
+    print()
+
+    if wrong:
+        print(f"❌ {wrong} known case(s) merged wrong\n")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
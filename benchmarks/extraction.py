@@ -0,0 +1,300 @@
+"""
+Extraction benchmark: replays recorded pages through every scraper.
+
+Each source's listing (HTML or JSON), and the JSON API response for
+sources that have one, is stored gzipped in benchmarks/fixtures/ and
+served to the real scraper method by an offline fetcher, so the exact
+extraction code in scrapers.py and india_scrapers.py is measured without
+touching the network. Reports records/second, parse
+time and peak memory per source, and exits non-zero when a source extracts
+a different number of records than the baseline or its throughput drops
+by more than the threshold. Throughput is compared relative to a fixed
+calibration workload timed in the same run, so a baseline recorded on
+another (or a busier) machine still compares.
+
+    python -m benchmarks.extraction                    # compare with baseline
+    python -m benchmarks.extraction --update-baseline  # accept current numbers
+    python -m benchmarks.extraction --record           # re-record fixtures from the live sites
+"""
+import argparse
+import contextlib
+import gzip
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import github_search
+import json_sources
+import storage
+from fetcher import HttpFetcher, OfflineFetcher
+from instrumentation import RunReport
+from scrapers import HackathonScraper
+from india_scrapers import IndiaHackathonScraper
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+SCRAPER_CLASSES = [HackathonScraper, IndiaHackathonScraper]
+
+REPEATS = 5
+MIN_TIMING = 0.2
+
+# Allowed drop in records/second across all sources before the run counts
+# as a regression (single sources may drop twice as much)
+DEFAULT_THRESHOLD = 0.25
+
+# Sources extracted faster than this are timer noise: only their record
+# counts are checked, and they still count towards the overall throughput
+MIN_GATED_SECONDS = 0.005
+
+# Where the baseline keeps the calibration time it was recorded with
+CALIBRATION_KEY = '_calibration'
+
+
+class FixtureFetcher(OfflineFetcher):
+    """Offline fetcher answering a source's URLs with its recorded bodies"""
+
+    def stored(self, url):
+        # Every page of a paginated listing gets the same recording
+        content = self.bodies.get(url.split('?')[0])
+        return None if content is None else (200, content, None)
+
+
+def fixture_path(name, api=False):
+    """Recorded listing page (or JSON API response) of a source, None if there is none"""
+    if api:
+        path = os.path.join(FIXTURES_DIR, f"{name.lower()}.api.json.gz")
+        return path if os.path.exists(path) else None
+    for kind in ('html', 'json'):
+        path = os.path.join(FIXTURES_DIR, f"{name.lower()}.{kind}.gz")
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def fixture_sources():
+    """
+    (label, scraper class, registry entry, {url: fixture path}, source mode)
+    for every recorded source. Sources with a JSON API fixture are listed
+    twice: JSON-first as the scrapers run by default, and HTML only.
+    """
+    sources = []
+    for scraper_class in SCRAPER_CLASSES:
+        for source in scraper_class.SOURCES:
+            page = source.get('url') and fixture_path(source['name'])
+            if not page:
+                continue
+            api = source.get('api') and fixture_path(source['name'], api=True)
+            if api:
+                paths = {source['url']: page, source['api']['url']: api}
+                sources.append((source['name'], scraper_class, source, paths, 'json'))
+                sources.append((f"{source['name']} (html)", scraper_class, source, {source['url']: page}, 'html'))
+            else:
+                sources.append((source['name'], scraper_class, source, {source['url']: page}, 'json'))
+    return sources
+
+
+def read_fixture(path):
+    with gzip.open(path, 'rb') as f:
+        return f.read()
+
+
+def calibrate():
+    """
+    CPU seconds of a fixed pure-Python workload (string building, dict
+    updates, a sort): how fast this machine runs Python right now. Timed
+    between sources all through the run, the fastest time is the one kept,
+    like the sources' own best-of timings.
+    """
+    start = time.process_time()
+    counts = {}
+    for i in range(200_000):
+        key = f"card-{i % 2000}"
+        counts[key] = counts.get(key, 0) + len(key)
+    sorted(counts.items(), key=lambda item: item[1])
+    return time.process_time() - start
+
+
+def run_source(scraper_class, source, bodies, mode):
+    """One scrape of a source against its fixtures; returns (records, parse seconds)"""
+    json_sources.SOURCE_MODE = mode
+    scraper = scraper_class(fetcher=FixtureFetcher(bodies))
+    report = RunReport()
+    with contextlib.redirect_stdout(io.StringIO()):
+        with report.span(source['name']) as span:
+            getattr(scraper, source['method'])()
+    return scraper.hackathons, span['parse_seconds']
+
+
+def measure(scraper_class, source, bodies, mode):
+    """Best-of-N throughput, parse time and peak traced memory for one source"""
+    # Fast sources are looped so every timing covers at least MIN_TIMING seconds
+    start = time.process_time()
+    run_source(scraper_class, source, bodies, mode)
+    number = max(1, int(MIN_TIMING / (time.process_time() - start)))
+
+    best = float('inf')
+    best_parse = 0.0
+    for _ in range(REPEATS):
+        parse_total = 0.0
+        start = time.process_time()
+        for _ in range(number):
+            records, parse_seconds = run_source(scraper_class, source, bodies, mode)
+            parse_total += parse_seconds
+        elapsed = (time.process_time() - start) / number
+        if elapsed < best:
+            best, best_parse = elapsed, parse_total / number
+
+    tracemalloc.start()
+    run_source(scraper_class, source, bodies, mode)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        'records': len(records),
+        'records_per_sec': round(len(records) / best, 1),
+        'seconds': round(best, 4),
+        'parse_seconds': round(best_parse, 4),
+        'peak_kb': round(peak / 1024),
+    }
+
+
+def throughput(results):
+    """Records per second across all sources, as if run back to back"""
+    seconds = sum(result['seconds'] for result in results.values())
+    return sum(result['records'] for result in results.values()) / seconds if seconds else 0
+
+
+def save_fixture(fetcher, label, url, path, **kwargs):
+    """Fetch one live response and store it gzipped at path"""
+    try:
+        response = fetcher.get(url, **kwargs)
+    except Exception as e:
+        print(f"❌ {label}: {e}")
+        return
+    if response.status_code != 200:
+        print(f"⚠️  {label}: Status code {response.status_code}, fixture kept")
+        return
+    with gzip.open(path, 'wb') as f:
+        f.write(response.content)
+    print(f"💾 {label}: {len(response.content) / 1024:.0f} KB recorded")
+
+
+def record():
+    """Re-record every source's listing (and JSON API response) from the live sites"""
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    fetcher = HttpFetcher()
+    try:
+        for scraper_class in SCRAPER_CLASSES:
+            for source in scraper_class.SOURCES:
+                if not source.get('url'):
+                    continue
+                name = source['name']
+                kind = 'json' if source['url'].endswith(('.list', '/repositories')) else 'html'
+                save_fixture(fetcher, name, source['url'], os.path.join(FIXTURES_DIR, f"{name.lower()}.{kind}.gz"),
+                             params=source.get('params'), timeout=source['timeout'])
+
+                api = source.get('api')
+                if api:
+                    kwargs = {'params': api.get('params'), 'timeout': source['timeout']}
+                    if api.get('auth_env'):
+                        kwargs['auth'] = tuple(os.getenv(var) for var in api['auth_env'])
+                    save_fixture(fetcher, f"{name} API", api['url'],
+                                 os.path.join(FIXTURES_DIR, f"{name.lower()}.api.json.gz"), **kwargs)
+    finally:
+        fetcher.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='allowed overall throughput drop vs baseline (default %(default)s)')
+    parser.add_argument('--update-baseline', action='store_true', help='write the current results as the baseline')
+    parser.add_argument('--record', action='store_true', help='re-record fixtures from the live sites')
+    args = parser.parse_args()
+
+    if args.record:
+        record()
+        return
+
+    # Keep the scrapers' persisted state (GitHub cache, Codeforces state) out of the way
+    storage.CACHE_DIR = tempfile.mkdtemp(prefix='hackathon-bench-')
+    github_search.CACHE_TTL = 0
+    # The Kaggle API is only tried with a token; the fixtures don't check it
+    os.environ.setdefault('KAGGLE_USERNAME', 'benchmark')
+    os.environ.setdefault('KAGGLE_KEY', 'benchmark')
+
+    baseline = storage.load_json(BASELINE_PATH, {})
+    base_calibration = baseline.pop(CALIBRATION_KEY, {}).get('seconds')
+
+    print(f"\n📊 EXTRACTION BENCHMARK (recorded fixtures, best of {REPEATS})\n")
+    measured = []
+    calibrations = []
+    for name, scraper_class, source, paths, mode in fixture_sources():
+        bodies = {url: read_fixture(path) for url, path in paths.items()}
+        measured.append((name, source, mode, bodies, measure(scraper_class, source, bodies, mode)))
+        calibrations.append(calibrate())
+
+    calibration = min(calibrations)
+    # Below 1 when this machine runs Python slower than the baseline's did
+    speed = calibration / base_calibration if base_calibration else 1.0
+    if base_calibration:
+        print(f"Machine runs the calibration workload at {1 / speed:.2f}x the baseline's speed; "
+              f"rec/s below are as measured, 'vs base' is adjusted for it\n")
+    print(f"{'Source':<20}{'KB':>6}{'records':>9}{'rec/s':>10}{'parse ms':>10}{'peak KB':>9}{'vs base':>9}")
+
+    results = {}
+    regressions = []
+    for name, source, mode, bodies, result in measured:
+        results[name] = result
+
+        # Size of what this mode actually downloads
+        fetched = source['api']['url'] if mode == 'json' and source.get('api') else source['url']
+        size = len(bodies.get(fetched) or bodies[source['url']])
+
+        base = baseline.get(name)
+        change = ''
+        if base:
+            ratio = result['records_per_sec'] * speed / base['records_per_sec'] if base['records_per_sec'] else 1
+            change = f"{(ratio - 1) * 100:+.0f}%"
+            if result['records'] != base['records']:
+                regressions.append(f"{name}: {result['records']} records, baseline has {base['records']}")
+            elif ratio < 1 - 2 * args.threshold and base['seconds'] >= MIN_GATED_SECONDS:
+                regressions.append(f"{name}: {result['records_per_sec'] * speed:.1f} rec/s (speed-adjusted), "
+                                   f"baseline {base['records_per_sec']}")
+
+        print(f"{name:<20}{size / 1024:>6.0f}{result['records']:>9}{result['records_per_sec']:>10.0f}"
+              f"{result['parse_seconds'] * 1000:>10.1f}{result['peak_kb']:>9}{change:>9}")
+
+    # Single sources are noisy on shared machines, so they get twice the
+    # threshold; the run as a whole has to stay within it
+    total = throughput(results) * speed
+    total_base = throughput({name: baseline[name] for name in results if name in baseline})
+    if total_base:
+        print(f"{'All sources':<20}{'':>6}{'':>9}{total:>10.0f}{'':>10}{'':>9}{(total / total_base - 1) * 100:>+8.0f}%")
+        if total < total_base * (1 - args.threshold):
+            regressions.append(f"all sources: {total:.1f} rec/s (speed-adjusted), baseline {total_base:.1f}")
+
+    if args.update_baseline:
+        with open(BASELINE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(dict(results, **{CALIBRATION_KEY: {'seconds': round(calibration, 4)}}),
+                      f, indent=2, sort_keys=True)
+        print(f"\n💾 Baseline updated ({len(results)} sources)\n")
+        return
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s):")
+        for regression in regressions:
+            print(f"   {regression}")
+        print()
+        sys.exit(1)
+
+    print(f"\n✅ No regressions beyond {args.threshold:.0%}\n")
+
+
+if __name__ == "__main__":
+    main()
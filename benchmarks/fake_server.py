@@ -0,0 +1,169 @@
+"""
+Local stand-in for every site the scrapers fetch.
+
+Serves the recorded pages and API responses from benchmarks/fixtures/ at
+http://127.0.0.1:<port>/<host><path>, the layout HttpFetcher uses when
+SCRAPE_BASE_URL is set, with configurable latency, jitter, 5xx errors,
+429s and hung requests. Which requests fail is derived from the seed and
+the path, so a given configuration misbehaves the same way every run.
+
+    python -m benchmarks.fake_server --port 8765 --latency 0.3 --error-rate 0.1
+    SCRAPE_BASE_URL=http://127.0.0.1:8765 python main.py
+"""
+import argparse
+import random
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit
+
+from benchmarks.extraction import fixture_sources, read_fixture
+
+
+def load_routes():
+    """/<host><path> -> (content type, body) for every recorded page and API response"""
+    routes = {}
+    for label, scraper_class, source, paths, mode in fixture_sources():
+        for url, path in paths.items():
+            parts = urlsplit(url)
+            content_type = 'application/json' if path.endswith('.json.gz') else 'text/html; charset=utf-8'
+            routes[f"/{parts.netloc}{parts.path}"] = (content_type, read_fixture(path))
+    return routes
+
+
+class FakeServer:
+    """
+    Threaded fake HTTP server with a network profile.
+
+    latency, jitter: seconds added before every response (jitter is +/-)
+    error_rate:      share of requests answered with a 503
+    rate_limit_rate: share of requests answered with a 429 and Retry-After: 1
+    timeout_rate:    share of requests that hang for hang seconds
+    """
+
+    def __init__(self, port=0, latency=0.0, jitter=0.0, error_rate=0.0, rate_limit_rate=0.0,
+                 timeout_rate=0.0, hang=30.0, seed=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.timeout_rate = timeout_rate
+        self.hang = hang
+        self.seed = seed
+        self.routes = load_routes()
+        self.counts = {}
+        self._lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                server.handle(self)
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        self.httpd.daemon_threads = True
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.httpd.server_port}"
+
+    def _roll(self, path):
+        """Deterministic dice for the nth request to a path"""
+        with self._lock:
+            n = self.counts.get(path, 0)
+            self.counts[path] = n + 1
+        return random.Random(f"{self.seed}:{path}:{n}")
+
+    def handle(self, request):
+        path = urlsplit(request.path).path
+        rng = self._roll(path)
+
+        time.sleep(max(self.latency + rng.uniform(-self.jitter, self.jitter), 0))
+
+        roll = rng.random()
+        if roll < self.timeout_rate:
+            time.sleep(self.hang)
+            return
+        roll -= self.timeout_rate
+
+        if roll < self.rate_limit_rate:
+            self._send(request, 429, 'text/plain', b'Too Many Requests', {'Retry-After': '1'})
+            return
+        roll -= self.rate_limit_rate
+
+        if roll < self.error_rate:
+            self._send(request, 503, 'text/plain', b'Service Unavailable')
+            return
+
+        if path not in self.routes:
+            self._send(request, 404, 'text/plain', b'Not Found')
+            return
+
+        content_type, body = self.routes[path]
+        self._send(request, 200, content_type, body)
+
+    def _send(self, request, status, content_type, body, headers=None):
+        try:
+            request.send_response(status)
+            request.send_header('Content-Type', content_type)
+            request.send_header('Content-Length', str(len(body)))
+            for key, value in (headers or {}).items():
+                request.send_header(key, value)
+            request.end_headers()
+            request.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # The client gave up (timeout), nothing to do
+
+    def start(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def add_profile_arguments(parser):
+    """Network profile options shared with the pipeline benchmark"""
+    parser.add_argument('--latency', type=float, default=0.3, help='seconds per response (default %(default)s)')
+    parser.add_argument('--jitter', type=float, default=0.1, help='+/- seconds of jitter (default %(default)s)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='share of 503 responses')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='share of 429 responses')
+    parser.add_argument('--timeout-rate', type=float, default=0.0, help='share of requests that hang')
+    parser.add_argument('--hang', type=float, default=30.0, help='seconds a hung request hangs (default %(default)s)')
+    parser.add_argument('--seed', type=int, default=0, help='seed for which requests misbehave')
+
+
+def server_from_args(args, port=0):
+    return FakeServer(port, args.latency, args.jitter, args.error_rate, args.rate_limit_rate,
+                      args.timeout_rate, args.hang, args.seed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--port', type=int, default=8765)
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    server = server_from_args(args, args.port)
+    print(f"🧪 Serving {len(server.routes)} recorded sources at {server.url}")
+    print(f"   export SCRAPE_BASE_URL={server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Filter benchmark: the fused single-pass apply_all_filters against the
+multi-pass version it replaced.
+
+Builds synthetic records with the platform / status / mode mix the
+scrapers produce (and some duplicates). The old version runs on plain
+dicts, as it did before records.Hackathon existed; the fused one on the
+Hackathon records the pipeline hands it now, and on the same plain dicts
+(converting them is then part of its time). Reports the best time of
+each per size.
+
+    python -m benchmarks.filters
+    python -m benchmarks.filters --sizes 10000 100000
+"""
+import argparse
+import gc
+import random
+import time
+
+import dedupe
+from filters import apply_all_filters
+from records import Hackathon
+
+PLATFORMS = ['Devpost', 'Unstop', 'HackerEarth', 'MLH', 'Kaggle', 'LeetCode', 'Codeforces', 'CodeChef',
+             'GitHub', 'GeeksforGeeks', 'TechGig', 'HackerRank', 'Devfolio', 'Other']
+# Most scrapers already write 'Live' / 'Upcoming'; the rest pass the site's own
+# spelling through, and those LIVE records are the ones the filter has to copy
+STATUSES = ['Live'] * 10 + ['Upcoming'] * 4 + ['upcoming', 'open', 'ongoing', 'CODING', 'Closed', '']
+MODES = ['Online', 'Online', 'Offline', 'Hybrid']
+
+# Share of records that repeat an earlier one
+DUPLICATE_RATE = 0.1
+
+
+def synthetic_records(count, seed=0):
+    """count Hackathon records, about DUPLICATE_RATE of them duplicates"""
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        if records and rng.random() < DUPLICATE_RATE:
+            records.append(Hackathon.from_dict(rng.choice(records).to_dict()))
+            continue
+        platform = rng.choice(PLATFORMS)
+        records.append(Hackathon(
+            name=f"{platform} Hackathon {i}",
+            platform=platform,
+            registration_link=f"https://example.com/{platform.lower()}/{i}",
+            mode=rng.choice(MODES),
+            prize_pool=rng.choice(['N/A', '$1,000', '₹50,000']),
+            fresher_friendly=rng.random() < 0.8,
+            status=rng.choice(STATUSES),
+            organizer=platform,
+        ))
+    return records
+
+
+def legacy_apply_all_filters(hackathons, live_only=True, fresher_only=False, remove_dupes=True):
+    """apply_all_filters as it was before the series, on plain dicts: one pass per filter, then a full sort"""
+    def is_live(hack):
+        status = hack.get('status', '').lower()
+        if status in ['live', 'open', 'active', 'ongoing', 'coding']:
+            hack['status'] = 'Live'
+            return True
+        elif status in ['upcoming', 'closed', 'ended', 'finished', 'completed', 'before']:
+            return False
+        elif not status:
+            if hack.get('platform') in ['GitHub', 'Unstop']:
+                hack['status'] = 'Live'
+                return True
+        return False
+
+    filtered = hackathons
+    if remove_dupes:
+        seen = set()
+        unique = []
+        for hack in filtered:
+            key = f"{hack.get('name', '')}||{hack.get('registration_link', '')}"
+            if key not in seen:
+                seen.add(key)
+                unique.append(hack)
+        filtered = unique
+    if live_only:
+        filtered = [hack for hack in filtered if is_live(hack)]
+    if fresher_only:
+        filtered = [h for h in filtered if h.get('fresher_friendly', True)]
+    return sorted(filtered, key=lambda x: x.get('platform', ''))
+
+
+def plain_dicts(records):
+    return [hack.to_dict() for hack in records]
+
+
+def best_time(func, size, repeats, prepare=None):
+    """
+    Best time of func over fresh records each run (the old version
+    rewrites statuses in place), turned into its input by prepare first
+    """
+    best, result = float('inf'), None
+    for _ in range(repeats):
+        # Drop the previous run's records first, so they don't weigh on this run's garbage collections
+        result = records = None
+        records = synthetic_records(size)
+        if prepare is not None:
+            records = prepare(records)
+        gc.collect()
+        start = time.perf_counter()
+        result = func(records, live_only=True, fresher_only=True)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--repeats', type=int, default=3, help='runs per implementation, best is reported')
+    args = parser.parse_args()
+    # Exact duplicates only, like the old version; near duplicates have their own benchmark (benchmarks.dedupe)
+    dedupe.DEDUPE_MODE = 'exact'
+
+    print(f"\n📊 FILTER BENCHMARK (live + fresher filters, best of {args.repeats})\n")
+    print(f"{'':>20}{'old, dicts':>12}{'fused, records':>24}{'fused, dicts':>22}")
+    print(f"{'records':>10}{'kept':>10}{'s':>12}{'s':>12}{'speedup':>12}{'s':>12}{'speedup':>10}")
+
+    for size in args.sizes:
+        legacy, legacy_result = best_time(legacy_apply_all_filters, size, args.repeats, plain_dicts)
+        fused, fused_result = best_time(apply_all_filters, size, args.repeats)
+        converted, converted_result = best_time(apply_all_filters, size, args.repeats, plain_dicts)
+
+        expected = [dict(h) for h in legacy_result]
+        if [dict(h) for h in fused_result] != expected or [dict(h) for h in converted_result] != expected:
+            raise SystemExit(f"❌ {size} records: the implementations disagree")
+
+        print(f"{size:>10}{len(fused_result):>10}{legacy:>12.3f}{fused:>12.3f}{legacy / fused:>11.1f}x"
+              f"{converted:>12.3f}{legacy / converted:>9.1f}x")
+    print()
+
+
+if __name__ == "__main__":
+    main()
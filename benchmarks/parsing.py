@@ -0,0 +1,131 @@
+"""
+Parse benchmark: original html.parser path vs lxml + card strainers.
+
+Feeds a synthetic, realistically heavy listing page for every HTML source
+through the real scraper methods and reports parse time and peak memory
+for both parse modes.
+
+    python -m benchmarks.parsing
+"""
+import contextlib
+import io
+import json
+import time
+import tracemalloc
+
+import parsing
+from fetcher import OfflineFetcher
+from scrapers import HackathonScraper
+from india_scrapers import IndiaHackathonScraper
+
+CARDS_PER_PAGE = 30
+REPEATS = 5
+
+
+class CannedFetcher(OfflineFetcher):
+    """Offline fetcher answering every URL with the same page"""
+
+    def __init__(self, content):
+        super().__init__()
+        self.content = content
+
+    def stored(self, url):
+        return 200, self.content, None
+
+
+def page_chrome(body):
+    """Wrap cards in the kind of markup real listing pages carry around them"""
+    nav = ''.join(f'<li><a href="/nav/{i}" class="nav-link">Menu item {i}</a></li>' for i in range(200))
+    footer = ''.join(
+        f'<div class="footer-col"><span>Link group {i}</span><a href="/f/{i}">More</a></div>' for i in range(300)
+    )
+    script = '<script>window.__STATE__ = ' + json.dumps({'items': list(range(8000))}) + ';</script>'
+    return (
+        f'<!DOCTYPE html><html><head><title>Listing</title>{script}</head><body>'
+        f'<header><ul>{nav}</ul></header><main>{body}</main><footer>{footer}</footer></body></html>'
+    ).encode('utf-8')
+
+
+def cards(template):
+    return ''.join(template.format(i=i) for i in range(CARDS_PER_PAGE))
+
+
+# (name, scraper class, method, page)
+SOURCES = [
+    ('Devpost', HackathonScraper, 'scrape_devpost', page_chrome(cards(
+        '<div class="hackathon-tile"><h2>Devpost Hack {i}</h2><a href="/hackathons/{i}">Join</a>'
+        '<p class="tagline">Build something great {i}</p></div>'))),
+    ('Unstop', HackathonScraper, 'scrape_unstop', page_chrome(cards(
+        '<div class="opportunity-card"><h3>Unstop Challenge {i}</h3><a href="/hackathons/u{i}">Apply</a></div>'))),
+    ('MLH', HackathonScraper, 'scrape_mlh', page_chrome(cards(
+        '<div class="event"><h3>MLH Hack {i}</h3><a href="https://mlh.io/e/{i}">Go</a>'
+        '<img alt="MLH Hack {i}" src="/i.png"></div>'))),
+    ('HackerEarth', HackathonScraper, 'scrape_hackerearth', page_chrome(cards(
+        '<div class="challenge-card"><div class="challenge-name">HE Challenge {i}</div>'
+        '<a href="/challenges/{i}">Open</a></div>'))),
+    ('CodeChef', HackathonScraper, 'scrape_codechef', page_chrome(
+        '<h3>Present Contests</h3><table class="dataTable"><tr><th>Code</th></tr>' + cards(
+            '<tr><td>HACK{i}</td><td><a href="/HACK{i}">Hackathon {i}</a></td><td>1 Jan</td><td>2 Jan</td></tr>')
+        + '</table>')),
+    ('Kaggle', HackathonScraper, 'scrape_kaggle', page_chrome(cards(
+        '<div class="competition-tile"><div class="competition-tile__title">Kaggle Comp {i}</div>'
+        '<a href="/competitions/c{i}">View</a><div class="competition-tile__prize">$1,000</div></div>'))),
+    ('LeetCode', HackathonScraper, 'scrape_leetcode', page_chrome(cards(
+        '<div class="contest-card"><div class="contest-title">Weekly Contest {i}</div>'
+        '<div class="contest-time">Sunday 8:00</div></div>'))),
+    ('GeeksforGeeks', HackathonScraper, 'scrape_gfg', page_chrome(cards(
+        '<div class="event_card"><div class="event_head">GfG Event {i}</div><a href="/events/{i}">Go</a>'
+        '<div class="event_timings">Today</div></div>'))),
+    ('TechGig', IndiaHackathonScraper, 'scrape_techgig', page_chrome(cards(
+        '<div class="challenge-card"><h3>TechGig Challenge {i}</h3><a href="/challenge/{i}">Go</a></div>'))),
+    ('HackerRank', IndiaHackathonScraper, 'scrape_hackerrank', page_chrome(cards(
+        '<a href="/contests/contest-{i}">HackerRank Contest {i}</a>'))),
+]
+
+
+def run_source(scraper_class, method, page):
+    scraper = scraper_class(fetcher=CannedFetcher(page))
+    with contextlib.redirect_stdout(io.StringIO()):
+        getattr(scraper, method)()
+    return scraper.hackathons
+
+
+def measure(scraper_class, method, page, mode):
+    """Best-of-N wall time and peak traced memory for one source in one mode"""
+    parsing.PARSE_MODE = mode
+
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        records = run_source(scraper_class, method, page)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    run_source(scraper_class, method, page)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return best, peak, records
+
+
+def main():
+    original_mode = parsing.PARSE_MODE
+    print(f"\n📊 PARSE BENCHMARK ({CARDS_PER_PAGE} cards per page, best of {REPEATS})\n")
+    print(f"{'Source':<15}{'KB':>6}{'full ms':>10}{'fast ms':>10}{'speedup':>9}"
+          f"{'full MB':>9}{'fast MB':>9}  same records")
+
+    try:
+        for name, scraper_class, method, page in SOURCES:
+            full_time, full_peak, full_records = measure(scraper_class, method, page, 'full')
+            fast_time, fast_peak, fast_records = measure(scraper_class, method, page, 'fast')
+
+            print(f"{name:<15}{len(page) / 1024:>6.0f}{full_time * 1000:>10.1f}{fast_time * 1000:>10.1f}"
+                  f"{full_time / fast_time:>8.1f}x{full_peak / 2**20:>9.1f}{fast_peak / 2**20:>9.1f}"
+                  f"  {'✅' if full_records == fast_records else '❌'}")
+    finally:
+        parsing.PARSE_MODE = original_mode
+    print()
+
+
+if __name__ == "__main__":
+    main()
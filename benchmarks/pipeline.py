@@ -0,0 +1,87 @@
+"""
+End-to-end pipeline benchmark against the local stand-in server.
+
+Runs what main.main does (scrape every source, add the manual entries,
+filter for LIVE, dedupe), minus the Notion writes, with all traffic sent
+to benchmarks.fake_server. The scrape runs sequentially and in parallel
+under the same network profile and the wall time of each is reported.
+Detail pages aren't enriched: the stand-in doesn't serve them, and both
+modes must do the same work.
+
+    python -m benchmarks.pipeline
+    python -m benchmarks.pipeline --latency 0.8 --jitter 0.4 --error-rate 0.1 --rate-limit-rate 0.05
+    HACKATHON_EXTRACT_MODE=process python -m benchmarks.pipeline   # parse in extractor processes
+"""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+from itertools import chain
+
+import enrichment
+import storage
+from benchmarks.fake_server import add_profile_arguments, server_from_args
+from filters import iter_filtered
+from india_scrapers import IndiaHackathonScraper
+from instrumentation import load_reports
+from manual_sources import get_manual_hackathons
+from orchestrator import MAX_WORKERS, iter_hackathons
+from scrapers import HackathonScraper
+
+
+def run_pipeline(max_workers, budget):
+    """One main.main-equivalent run; returns (seconds, LIVE hackathons, run report)"""
+    # Fresh cache dir: no conditional GETs, reused pages or open breakers from earlier runs
+    storage.CACHE_DIR = tempfile.mkdtemp(prefix='hackathon-pipeline-')
+
+    start = time.monotonic()
+    with contextlib.redirect_stdout(io.StringIO()):
+        scraped = chain(get_manual_hackathons(),
+                        iter_hackathons([HackathonScraper, IndiaHackathonScraper], max_workers, budget))
+        live = list(iter_filtered(scraped, live_only=True, fresher_only=False, remove_dupes=True))
+    seconds = time.monotonic() - start
+
+    return seconds, live, load_reports(1)[0]
+
+
+def describe(report):
+    """Count of sources per outcome, e.g. '10 ok, 2 failed'"""
+    outcomes = {}
+    for span in report['sources']:
+        outcomes[span['outcome']] = outcomes.get(span['outcome'], 0) + 1
+    return ', '.join(f"{count} {outcome}" for outcome, count in sorted(outcomes.items()))
+
+
+def main():
+    enrichment.ENRICH_MAX_PAGES = 0
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_profile_arguments(parser)
+    parser.add_argument('--workers', type=int, default=MAX_WORKERS, help='parallel workers (default %(default)s)')
+    parser.add_argument('--budget', type=int, default=90, help='run deadline in seconds (default %(default)s)')
+    parser.add_argument('--repeats', type=int, default=3, help='runs per mode, best is reported (default %(default)s)')
+    args = parser.parse_args()
+
+    print(f"\n📊 PIPELINE BENCHMARK (latency {args.latency}s ±{args.jitter}s, errors {args.error_rate:.0%}, "
+          f"429s {args.rate_limit_rate:.0%}, hangs {args.timeout_rate:.0%}, best of {args.repeats})\n")
+    print(f"{'Mode':<22}{'wall s':>8}{'LIVE':>6}{'requests':>10}  sources")
+
+    with server_from_args(args) as server:
+        os.environ['SCRAPE_BASE_URL'] = server.url
+        try:
+            timings = {}
+            for mode, workers in (('sequential', 1), (f'parallel ({args.workers})', args.workers)):
+                runs = [run_pipeline(workers, args.budget) for _ in range(args.repeats)]
+                seconds, live, report = min(runs, key=lambda run: run[0])
+                timings[mode] = seconds
+                print(f"{mode:<22}{seconds:>8.2f}{len(live):>6}{report['requests']:>10}  {describe(report)}")
+        finally:
+            os.environ.pop('SCRAPE_BASE_URL', None)
+
+    sequential, parallel = timings.values()
+    print(f"\n⚡ Parallel is {sequential / parallel:.1f}x faster end to end\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Search benchmark: /api/search query latency against the size of the snapshot.
+
+Indexes synthetic hackathons named like the listings' ("Google Climate
+Buildathon 2025"), then times typical queries, from a two-letter prefix
+(the broadest one that expands, the worst case) to several words, and
+incremental syncs of the next scrape: new record objects, the same
+content or 1% of it changed.
+
+    python -m benchmarks.search
+    python -m benchmarks.search --sizes 10000 50000
+"""
+import argparse
+import random
+import time
+
+from benchmarks.dedupe import HOSTS, KINDS, THEMES
+from benchmarks.filters import synthetic_records
+from records import as_records
+from search import SearchIndex
+
+QUERIES = ['go', 'fl', 'clim', 'hackathon', 'google ai', 'iit bombay robotics 2025', 'unstop', 'zzz']
+
+
+def named_records(size, seed=0):
+    rng = random.Random(seed)
+    return [hack.replace(name=f"{rng.choice(HOSTS)} {rng.choice(THEMES)} {rng.choice(KINDS)} {rng.randrange(2015, 2027)}",
+                         organizer=rng.choice(HOSTS), registration_link=f"{hack['registration_link']}-{i}")
+            for i, hack in enumerate(synthetic_records(size, seed))]
+
+
+def best_ms(func, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 50_000])
+    parser.add_argument('--repeats', type=int, default=20, help='runs per query, best is reported')
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        records = named_records(size)
+        index = SearchIndex()
+        start = time.perf_counter()
+        index.sync(records)
+        build = time.perf_counter() - start
+
+        # Every scrape builds new records, even for pages that didn't change
+        rescraped = as_records([dict(hack) for hack in records])
+        start = time.perf_counter()
+        index.sync(rescraped)
+        unchanged = time.perf_counter() - start
+
+        changed = as_records([dict(hack) for hack in records])
+        for i in random.Random(1).sample(range(size), max(size // 100, 1)):
+            changed[i] = changed[i].replace(name=f"{changed[i]['name']} Edition")
+        start = time.perf_counter()
+        index.sync(changed)
+        resync = time.perf_counter() - start
+
+        print(f"\n📊 SEARCH BENCHMARK: {size} records (index built in {build:.2f}s, re-scraped and "
+              f"re-synced in {unchanged * 1000:.0f} ms unchanged, {resync * 1000:.0f} ms with 1% changed)\n")
+        print(f"{'query':>28}{'matches':>10}{'first page ms':>15}{'page 5 ms':>11}")
+        for query in QUERIES:
+            total = index.search(query)[1]
+            first = best_ms(lambda: index.search(query), args.repeats)
+            fifth = best_ms(lambda: index.search(query, page=5), args.repeats)
+            print(f"{query!r:>28}{total:>10}{first:>15.2f}{fifth:>11.2f}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
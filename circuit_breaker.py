@@ -0,0 +1,91 @@
+import threading
+import time
+from storage import cache_path, load_json, save_json
+
+# Consecutive failed runs before a source is switched off
+FAILURE_THRESHOLD = 3
+
+# How long an open breaker waits before probing again; doubles on every
+# failed probe up to MAX_COOLDOWN (seconds)
+BASE_COOLDOWN = 6 * 3600
+MAX_COOLDOWN = 48 * 3600
+
+
+class CircuitBreaker:
+    """
+    Persisted per-source circuit breaker.
+
+    closed:    the source runs normally, consecutive failures are counted
+    open:      after FAILURE_THRESHOLD failures the source is not fetched at
+               all and its last-known-good records are served instead
+    half-open: once the cooldown expires one probe run is allowed; success
+               closes the breaker, failure re-opens it with a longer cooldown
+    """
+
+    def __init__(self, path=None):
+        self.path = path or cache_path('circuit_breakers.json')
+        self._lock = threading.Lock()
+        self.states = load_json(self.path, {})
+
+    def _state(self, name):
+        return self.states.setdefault(name, {
+            'failures': 0,
+            'trips': 0,
+            'retry_at': None,
+            'last_good': None,
+            'last_good_at': None,
+        })
+
+    def allow(self, name):
+        """Whether the source should be fetched this run"""
+        with self._lock:
+            state = self._state(name)
+            if state['retry_at'] is None:
+                return True
+            # Half-open: the cooldown is over, let one probe through
+            return time.time() >= state['retry_at']
+
+    def is_open(self, name):
+        state = self.states.get(name)
+        return bool(state and state['retry_at'] is not None)
+
+    def last_good(self, name):
+        """Records from the last successful run of a source"""
+        state = self.states.get(name) or {}
+        return [dict(record) for record in state.get('last_good') or []]
+
+    def _reload(self):
+        # Other processes save their sources to the same file: start from the
+        # copy on disk so their updates are kept, not overwritten by ours
+        self.states = load_json(self.path, self.states)
+
+    def record_success(self, name, records):
+        with self._lock:
+            self._reload()
+            state = self._state(name)
+            if state['retry_at'] is not None:
+                print(f"🔌 {name}: Probe succeeded, circuit closed again\n")
+            state.update({
+                'failures': 0,
+                'trips': 0,
+                'retry_at': None,
+                'last_good': [dict(record) for record in records],
+                'last_good_at': time.time(),
+            })
+            save_json(self.path, self.states)
+
+    def record_failure(self, name):
+        with self._lock:
+            self._reload()
+            state = self._state(name)
+            state['failures'] += 1
+
+            if state['retry_at'] is not None or state['failures'] >= FAILURE_THRESHOLD:
+                # Open, or re-open after a failed probe with a longer cooldown
+                cooldown = min(BASE_COOLDOWN * 2 ** state['trips'], MAX_COOLDOWN)
+                state['trips'] += 1
+                state['retry_at'] = time.time() + cooldown
+                print(f"🔌 {name}: {state['failures']} failures in a row, "
+                      f"circuit open for {cooldown / 3600:.0f}h\n")
+
+            save_json(self.path, self.states)
@@ -0,0 +1,122 @@
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from instrumentation import propagate_span
+
+# Pages of one source in flight at once (the per-host delay still spaces them out)
+PAGE_WORKERS = int(os.getenv('CRAWL_PAGE_WORKERS', 2))
+
+# Caps applied on top of every source's own page/item budget
+MAX_PAGES = int(os.getenv('CRAWL_MAX_PAGES', 20))
+MAX_ITEMS = int(os.getenv('CRAWL_MAX_ITEMS', 500))
+
+
+class Frontier:
+    """
+    Bounded set of URLs still to fetch in a run.
+    Admits at most max_urls URLs and never the same URL twice; seen can be
+    shared so different sources don't fetch the same page either.
+    """
+
+    def __init__(self, max_urls, seen=None):
+        self.max_urls = max_urls
+        self.admitted = 0
+        self.seen = seen if seen is not None else set()
+        self.queue = deque()
+        self._lock = threading.Lock()
+
+    def push(self, url):
+        """Queue a URL; False if it was already seen or the budget is used up"""
+        with self._lock:
+            if url in self.seen or self.admitted >= self.max_urls:
+                return False
+            self.seen.add(url)
+            self.admitted += 1
+            self.queue.append(url)
+            return True
+
+    def pop(self):
+        with self._lock:
+            return self.queue.popleft() if self.queue else None
+
+    def exhausted(self):
+        with self._lock:
+            return self.admitted >= self.max_urls
+
+
+def _run_inline(func, *args):
+    """Run func now, wrapped in a Future like ThreadPoolExecutor.submit would return"""
+    future = Future()
+    try:
+        future.set_result(func(*args))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+def crawl(page_urls, fetch_page, max_pages, max_items, seen=None):
+    """
+    Fetch successive listing pages with up to PAGE_WORKERS in flight.
+
+    page_urls yields page URLs in order (page 1, 2, ...), fetch_page(url)
+    returns that page's records, or None if it failed. Results are consumed
+    in page order; the crawl stops at the first failed, empty or all-duplicate
+    page, or when max_pages / max_items is reached. Records are deduped on
+    their registration link.
+    Returns (records, pages fetched).
+    """
+    frontier = Frontier(min(max_pages, MAX_PAGES), seen)
+    max_items = min(max_items, MAX_ITEMS)
+    page_urls = iter(page_urls)
+    fetch_page = propagate_span(fetch_page)
+
+    records = []
+    links = set()
+    pages = 0
+    in_flight = deque()
+
+    # Single-page sources don't need a pool
+    workers = min(PAGE_WORKERS, frontier.max_urls)
+    pool = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    submit = pool.submit if pool else _run_inline
+    try:
+        while True:
+            # Keep the next few pages in flight while this one is extracted
+            while len(in_flight) < workers and not frontier.exhausted():
+                url = next(page_urls, None)
+                if url is None:
+                    break
+                if frontier.push(url):
+                    in_flight.append(submit(fetch_page, frontier.pop()))
+
+            if not in_flight:
+                break
+
+            try:
+                page_records = in_flight.popleft().result()
+            except Exception as e:
+                print(f"   ⚠️  Page fetch failed: {e}")
+                page_records = None
+            if page_records is None:
+                break
+            pages += 1
+
+            new = [record for record in page_records if record.get('registration_link') not in links]
+            if not new:
+                break
+            for record in new:
+                links.add(record.get('registration_link'))
+            records.extend(new)
+
+            if len(records) >= max_items:
+                break
+    finally:
+        # Pages fetched speculatively past the end are simply dropped
+        for future in in_flight:
+            future.cancel()
+        if pool:
+            pool.shutdown(wait=False)
+
+    return records[:max_items], pages
@@ -1,8 +1,11 @@
 from flask import Flask, render_template_string, jsonify, request
 from scrapers import HackathonScraper
 from india_scrapers import IndiaHackathonScraper
+from orchestrator import scrape_all
 from manual_sources import get_manual_hackathons
 from filters import apply_all_filters
+import records
+from stats import HackathonStats
 from datetime import datetime
 import json
 
@@ -11,20 +14,15 @@ app = Flask(__name__)
 # Store hackathons in memory
 cached_hackathons = []
 last_updated = None
+# Counters over cached_hackathons, kept in step with it
+stats = HackathonStats()
 
 def get_all_hackathons():
     """Fetch all hackathons from all sources"""
     global cached_hackathons, last_updated
     
-    hackathons = []
-    
-    # Scrape international
-    scraper = HackathonScraper()
-    hackathons.extend(scraper.get_all_hackathons())
-    
-    # Scrape India
-    india_scraper = IndiaHackathonScraper()
-    hackathons.extend(india_scraper.get_all_india_hackathons())
+    # Scrape international and India platforms in parallel
+    hackathons = scrape_all([HackathonScraper, IndiaHackathonScraper])
     
     # Add manual
     hackathons.extend(get_manual_hackathons())
@@ -32,6 +30,7 @@ def get_all_hackathons():
     # Apply filters
     hackathons = apply_all_filters(hackathons)
     
+    stats.sync(hackathons)
     cached_hackathons = hackathons
     last_updated = datetime.now()
     
@@ -591,37 +590,33 @@ def get_hackathons_api():
     else:
         hackathons = cached_hackathons
     
-    # Calculate stats
-    platforms = set(h.get('platform', '') for h in hackathons)
-    live_count = len([h for h in hackathons if h.get('status', '').lower() == 'live'])
-    fresher_count = len([h for h in hackathons if h.get('fresher_friendly', False)])
+    # Precomputed by stats.sync when the hackathons were loaded
+    counts = stats.snapshot()
     
-    return jsonify({
+    return app.response_class(records.dumps({
         'hackathons': hackathons,
         'total': len(hackathons),
-        'platform_count': len(platforms),
-        'live_count': live_count,
-        'fresher_count': fresher_count,
+        'platform_count': counts['platforms'],
+        'live_count': counts['live'],
+        'fresher_count': counts['fresher_friendly'],
         'last_updated': last_updated.isoformat() if last_updated else datetime.now().isoformat()
-    })
+    }), mimetype='application/json')
 
 @app.route('/api/refresh', methods=['POST'])
 def refresh_hackathons():
     """Refresh hackathons from all sources"""
     hackathons = get_all_hackathons()
     
-    platforms = set(h.get('platform', '') for h in hackathons)
-    live_count = len([h for h in hackathons if h.get('status', '').lower() == 'live'])
-    fresher_count = len([h for h in hackathons if h.get('fresher_friendly', False)])
+    counts = stats.snapshot()
     
-    return jsonify({
+    return app.response_class(records.dumps({
         'hackathons': hackathons,
         'total': len(hackathons),
-        'platform_count': len(platforms),
-        'live_count': live_count,
-        'fresher_count': fresher_count,
+        'platform_count': counts['platforms'],
+        'live_count': counts['live'],
+        'fresher_count': counts['fresher_friendly'],
         'last_updated': datetime.now().isoformat()
-    })
+    }), mimetype='application/json')
 
 @app.route('/api/stats')
 def get_stats():
@@ -631,18 +626,14 @@ def get_stats():
     if not cached_hackathons:
         return jsonify({'error': 'No data loaded'})
     
-    platform_counts = {}
-    for hack in cached_hackathons:
-        platform = hack.get('platform', 'Unknown')
-        platform_counts[platform] = platform_counts.get(platform, 0) + 1
-    
+    counts = stats.snapshot()
     return jsonify({
-        'total': len(cached_hackathons),
-        'by_platform': platform_counts,
+        'total': counts['total'],
+        'by_platform': counts['by_platform'],
         'by_mode': {
-            'Online': len([h for h in cached_hackathons if h.get('mode') == 'Online']),
-            'Offline': len([h for h in cached_hackathons if h.get('mode') == 'Offline']),
-            'Hybrid': len([h for h in cached_hackathons if h.get('mode') == 'Hybrid'])
+            'Online': counts['online'],
+            'Offline': counts['offline'],
+            'Hybrid': counts['hybrid']
         }
     })
 
@@ -0,0 +1,266 @@
+import os
+import re
+import zlib
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from records import FIELDS, MISSING, as_record
+
+# 'fuzzy': also merge near duplicates across sources (same event under a
+# variant of its name or link); 'exact': only drop identical name + link
+DEDUPE_MODE = os.getenv('HACKATHON_DEDUPE', 'fuzzy')
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = frozenset(('ref', 'source', 'src', 'fbclid', 'gclid', 'lang'))
+TRACKING_PREFIXES = ('utm_', 'mc_')
+
+# Two names are the same event if their trigram sets overlap this much
+# (Jaccard), or if the shorter one (at least MIN_CONTAINED trigrams, and an
+# edition number or year) lies almost entirely inside the longer
+# ("Flipkart GRiD 6.0" vs "Flipkart GRiD 6.0 - Software Development Track",
+# but not "AI Hackathon" vs "AI Hackathon Season Two")
+NAME_SIMILARITY = 0.7
+NAME_CONTAINMENT = 0.9
+MIN_CONTAINED = 8
+
+# Records with the same canonical link only need names this close
+SAME_LINK_CONTAINMENT = 0.5
+
+# Names the scrapers fall back to when a card has none: they say nothing
+# about which event it is, so records named like this only merge exactly
+FALLBACK_NAMES = frozenset(('mlh event', 'unstop challenge', 'leetcode contest', 'gfg event',
+                            'techgig challenge', 'hackerrank contest'))
+
+# MinHash LSH: BANDS bands of ROWS hashes each; names with a trigram
+# Jaccard around (1 / BANDS) ** (1 / ROWS) or more usually share a band
+MINHASH_BANDS = 6
+MINHASH_ROWS = 3
+
+# Names are also bucketed by their first words, which catches a long name
+# extending a short one better than MinHash does
+PREFIX_WORDS = 2
+
+# A bucket holding more names than this (a prefix everyone shares) only
+# compares newcomers against its first BUCKET_LIMIT, which keeps the index
+# linear however many records come in
+BUCKET_LIMIT = 20
+
+# A newcomer is compared against at most this many records of a cluster
+# (exact duplicates aren't counted), for the same reason
+CLUSTER_LIMIT = 8
+
+# The longest value wins for these fields when records merge ('₹50,00,000'
+# vs '₹50,00,000 + PPO Opportunities'); other fields are only filled in
+LONGEST_WINS = ('prize_pool', 'eligibility', 'location', 'organizer')
+
+_WORD = re.compile(r'[^\W_]+')
+_SIGNATURE_SIZE = MINHASH_BANDS * MINHASH_ROWS
+# crc32 values are split into this many consecutive ranges, one per signature slot
+_SLOT_RANGE = -(-(1 << 32) // _SIGNATURE_SIZE)
+
+
+def canonical_url(url):
+    """
+    url reduced to what identifies the page: no scheme, www., default port,
+    trailing slash, fragment or tracking parameters, and the remaining
+    parameters sorted. None for anything that isn't an http(s) link.
+    """
+    if not isinstance(url, str) or not url.strip().lower().startswith('http'):
+        return None
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return None
+    host = parts.hostname or ''
+    if host.startswith('www.'):
+        host = host[4:]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    query = sorted((key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+                   if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES))
+    canonical = host + parts.path.rstrip('/')
+    return f"{canonical}?{urlencode(query)}" if query else canonical
+
+
+class Fingerprint:
+    """What the index compares a record by: its words, name trigrams, numbers, organizer and link"""
+
+    __slots__ = ('cluster', 'words', 'shingles', 'numbers', 'organizer', 'link', 'host', 'own_site')
+
+    def __init__(self, hack, cluster):
+        self.cluster = cluster
+        self.words = _WORD.findall((hack.get('name') or '').lower())
+        name = ' '.join(self.words)
+        if name in FALLBACK_NAMES:
+            self.words = []
+            name = ''
+        padded = f" {name} "
+        self.shingles = frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+        # "GRiD 6.0" and "GRiD 5.0" look alike but aren't the same event
+        self.numbers = frozenset(word for word in self.words if word.isdigit())
+        self.organizer = frozenset(_WORD.findall((hack.get('organizer') or '').lower()))
+        self.link = canonical_url(hack.get('registration_link'))
+        self.host = self.link.split('/', 1)[0] if self.link is not None else None
+        # Listed by the scraper of the site its link is on (platform 'Unstop', link on unstop.com)
+        platform = re.sub(r'[^a-z0-9]', '', (hack.get('platform') or '').lower())
+        self.own_site = bool(platform) and self.host is not None and platform in self.host
+
+    def minhash_bands(self):
+        """
+        The LSH bucket keys of the name (none for an empty name). They carry
+        the name's numbers too: "Hackathon 2024" and "Hackathon 2025" are
+        similar names that matches() would turn down anyway.
+        """
+        # One-permutation MinHash: each trigram hash lands in one of the
+        # signature's slots, which keeps its minimum; one pass over the
+        # trigrams instead of one per hash function
+        signature = [None] * _SIGNATURE_SIZE
+        for shingle in self.shingles:
+            slot, value = divmod(zlib.crc32(shingle.encode()), _SLOT_RANGE)
+            if signature[slot] is None or value < signature[slot]:
+                signature[slot] = value
+        numbers = tuple(sorted(self.numbers))
+        keys = []
+        for band in range(MINHASH_BANDS):
+            rows = signature[band * MINHASH_ROWS:(band + 1) * MINHASH_ROWS]
+            # A band no trigram fell in says nothing about the name
+            if rows.count(None) < MINHASH_ROWS:
+                keys.append((band, numbers, *rows))
+        return keys
+
+    def matches(self, other):
+        """Whether other names the same event"""
+        # Different organizers mean different events, whatever the names say
+        if self.organizer and other.organizer and not (
+                self.organizer <= other.organizer or other.organizer <= self.organizer):
+            return False
+
+        # A site's own listing has one page per event: two of its pages are
+        # two events (another source may still link to one of them)
+        if self.own_site and other.own_site and self.host == other.host and self.link != other.link:
+            return False
+
+        short, long = (self, other) if len(self.shingles) <= len(other.shingles) else (other, self)
+        if not short.shingles or not short.numbers <= long.numbers:
+            return False
+
+        shared = len(short.shingles & long.shingles)
+        contained = shared / len(short.shingles)
+        if self.link is not None and self.link == other.link:
+            return contained >= SAME_LINK_CONTAINMENT
+        if shared / (len(short.shingles) + len(long.shingles) - shared) >= NAME_SIMILARITY:
+            return True
+        return contained >= NAME_CONTAINMENT and len(short.shingles) >= MIN_CONTAINED and bool(short.numbers)
+
+
+class DuplicateIndex:
+    """
+    Incremental entity resolution for hackathons coming from several sources.
+
+    Each record added is compared only against the records it shares a
+    bucket with: the same canonical link, a MinHash LSH band of its name's
+    trigrams, or the same first words. Buckets are capped, so adding n
+    records costs O(n) comparisons rather than O(n^2), and records can be
+    added as they stream in. A record only joins a cluster if it matches
+    every record already in it (up to CLUSTER_LIMIT), so two tracks of one
+    event don't merge through the event's short name.
+    """
+
+    def __init__(self):
+        self.fingerprints = []
+        self.clusters = {}
+        self.exact = {}
+        self.buckets = {}
+
+    def add(self, hack):
+        """
+        Index a record. Returns the cluster it belongs to: the position of
+        the first record of the same event, or its own position if it's new.
+        """
+        hack = as_record(hack)
+        position = len(self.fingerprints)
+
+        cluster = self.exact.get(hack.dedupe_key)
+        fingerprint = Fingerprint(hack, position)
+        keys = self._bucket_keys(fingerprint)
+        if cluster is None:
+            cluster = self._find(fingerprint, keys)
+        if cluster is not None:
+            fingerprint.cluster = cluster
+
+        self.fingerprints.append(fingerprint)
+        members = self.clusters.setdefault(fingerprint.cluster, [])
+        # An exact duplicate matches whatever its first copy matches
+        if hack.dedupe_key not in self.exact and len(members) < CLUSTER_LIMIT:
+            members.append(fingerprint)
+        self.exact.setdefault(hack.dedupe_key, fingerprint.cluster)
+        for key in keys:
+            bucket = self.buckets.setdefault(key, [])
+            if len(bucket) < BUCKET_LIMIT:
+                bucket.append(position)
+        return fingerprint.cluster
+
+    def _bucket_keys(self, fingerprint):
+        # The link first: a record sharing it is the likeliest match
+        keys = [('link', fingerprint.link)] if fingerprint.link is not None else []
+        if fingerprint.words:
+            keys.append(('prefix', *fingerprint.words[:PREFIX_WORDS]))
+        keys += fingerprint.minhash_bands()
+        return keys
+
+    def _find(self, fingerprint, keys):
+        """
+        The first cluster, of the records sharing a bucket with fingerprint,
+        whose every record (up to CLUSTER_LIMIT) matches it; None if there's none
+        """
+        checked = set()
+        for key in keys:
+            for position in self.buckets.get(key, ()):
+                cluster = self.fingerprints[position].cluster
+                if cluster in checked:
+                    continue
+                checked.add(cluster)
+                if all(fingerprint.matches(member) for member in self.clusters[cluster]):
+                    return cluster
+        return None
+
+
+def merge_records(records):
+    """
+    One record out of the records of one event. The most complete one is
+    kept (name, link, platform and status stay together); its missing
+    fields are filled from the others, and LONGEST_WINS fields take the
+    most detailed value any of them has. The records are left untouched.
+    """
+    if len(records) == 1:
+        return records[0]
+
+    def filled(hack):
+        return sum(1 for value in hack.values() if value not in MISSING)
+
+    primary = max(records, key=filled)
+    changes = {}
+    fields = list(FIELDS) + [key for hack in records for key in (hack.extra or ())]
+    for field in dict.fromkeys(fields):
+        values = [hack.get(field) for hack in records if hack.get(field) not in MISSING]
+        if not values:
+            continue
+        if field in LONGEST_WINS and all(isinstance(value, str) for value in values):
+            best = max(values, key=len)
+        else:
+            best = primary.get(field) if primary.get(field) not in MISSING else values[0]
+        if best != primary.get(field):
+            changes[field] = best
+    return primary.replace(**changes) if changes else primary
+
+
+def merge_duplicates(hackathons):
+    """
+    hackathons with every group of records for the same event merged into
+    one (see merge_records), in the order each event first appeared.
+    """
+    index = DuplicateIndex()
+    clusters = {}
+    for hack in hackathons:
+        hack = as_record(hack)
+        clusters.setdefault(index.add(hack), []).append(hack)
+    return [merge_records(records) for records in clusters.values()]
@@ -0,0 +1,219 @@
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from urllib.parse import urlparse
+
+from fetcher import ResponseCache
+from instrumentation import propagate_span
+from parsing import make_soup
+from records import MISSING
+from storage import cache_path
+
+# Detail pages fetched at the same time across all sources
+ENRICH_WORKERS = int(os.getenv('ENRICH_WORKERS', 4))
+
+# Detail pages fetched per run at most; the rest wait for the next run
+ENRICH_MAX_PAGES = int(os.getenv('ENRICH_MAX_PAGES', 100))
+
+# Detail pages fetched per host per run; the per-host delay makes each one cost seconds
+ENRICH_MAX_PER_HOST = int(os.getenv('ENRICH_MAX_PER_HOST', 5))
+
+# Seconds a source waits for its detail pages; pages still loading after
+# that are cached for the next run instead
+ENRICH_WAIT = int(os.getenv('ENRICH_WAIT', 5))
+
+# Seconds close() waits for detail pages still loading, so they make it
+# into the saved cache before the session they use is closed
+ENRICH_CLOSE_WAIT = int(os.getenv('ENRICH_CLOSE_WAIT', 2))
+
+# A detail page is not refetched at all within this many seconds
+ENRICH_TTL = int(os.getenv('ENRICH_TTL', 24 * 3600))
+
+DETAIL_TIMEOUT = 10
+
+# Fields a detail page can fill in
+DETAIL_FIELDS = ('deadline', 'prize_pool', 'eligibility', 'team_size')
+
+_DATE = r'([A-Z][a-z]{2,8}\.? \d{1,2},? \d{4}|\d{1,2}(?:st|nd|rd|th)? [A-Z][a-z]{2,8},? \d{4}|\d{4}-\d{2}-\d{2})'
+DEADLINE_PATTERN = re.compile(
+    r'(?:deadline|last date|registrations? close[sd]?|submissions? (?:close|due)|ends? on)\W{0,5}' + _DATE, re.I)
+PRIZE_PATTERN = re.compile(
+    r'((?:\$|₹|€|£|USD|INR|Rs\.?)\s?\d[\d,]*(?:\.\d+)?(?:\s?(?:k|K|lakhs?|Lakhs?|L|crores?|Cr))?)')
+TEAM_PATTERN = re.compile(r'team(?:s| size)?\s*(?:of|:)?\s*(?:up to\s*)?(\d+\s*(?:-|–|to)\s*\d+|\d+)\s*(?:members|people)?',
+                          re.I)
+ELIGIBILITY_PATTERN = re.compile(r'([^.\n]*(?:eligib|open to)[^.\n]*)', re.I)
+
+
+def _json_ld_end_date(soup):
+    """endDate of the first schema.org Event in the page's JSON-LD, if any"""
+    for script in soup.find_all('script', type='application/ld+json'):
+        try:
+            data = json.loads(script.string or '')
+        except ValueError:
+            continue
+        items = data if isinstance(data, list) else data.get('@graph', [data])
+        for item in items:
+            if isinstance(item, dict) and item.get('endDate'):
+                return str(item['endDate'])[:10]
+    return None
+
+
+def extract_details(content):
+    """Deadline, prize, eligibility and team size found on a detail page"""
+    soup = make_soup(content)
+    try:
+        end_date = _json_ld_end_date(soup)
+        for tag in soup(['script', 'style', 'noscript']):
+            tag.decompose()
+        text = ' '.join(soup.get_text(' ').split())
+    finally:
+        soup.decompose()
+
+    details = {}
+    deadline = DEADLINE_PATTERN.search(text)
+    if deadline or end_date:
+        details['deadline'] = deadline.group(1) if deadline else end_date
+
+    prize = PRIZE_PATTERN.search(text)
+    if prize:
+        details['prize_pool'] = prize.group(1).strip()
+
+    eligibility = ELIGIBILITY_PATTERN.search(text)
+    if eligibility:
+        details['eligibility'] = eligibility.group(1).strip()[:200]
+
+    team = TEAM_PATTERN.search(text)
+    if team:
+        details['team_size'] = re.sub(r'\s+', '', team.group(1)).replace('to', '-').replace('–', '-')
+
+    return details
+
+
+def needs_details(hack):
+    """Whether a record is missing anything a detail page could fill in"""
+    link = hack.get('registration_link') or ''
+    return link.startswith('http') and any(hack.get(field) in MISSING for field in DETAIL_FIELDS)
+
+
+class Enricher:
+    """
+    Fills in deadline / prize / eligibility / team size from each
+    hackathon's detail page.
+
+    Detail pages are fetched on one bounded pool shared by every source in
+    the run, through the run's fetcher (per-host delay), within a per-run
+    and per-host page budget. A source waits at most ENRICH_WAIT seconds
+    for its details; pages still loading then are cached for the next
+    run, so a cold cache fills in over a few runs. Results are kept in
+    .cache/detail_cache.json keyed by URL together with the page's
+    validators and content hash: pages seen within ENRICH_TTL are not
+    fetched at all, older ones are revalidated and only re-extracted when
+    their content changed.
+    """
+
+    def __init__(self, fetcher, cache=None, max_pages=None, deadline=None, extractor=None):
+        self.fetcher = fetcher
+        # Detail pages are parsed in extractor processes when there is a pool
+        self.extract = extractor.extract_details if extractor is not None else extract_details
+        self.cache = cache or ResponseCache(cache_path('detail_cache.json'))
+        self.max_pages = ENRICH_MAX_PAGES if max_pages is None else max_pages
+        # time.monotonic() value by which every source must have its records back
+        self.deadline = deadline
+        self.fetched = 0
+        self.per_host = {}
+        self._lock = threading.Lock()
+        self.pool = ThreadPoolExecutor(max_workers=ENRICH_WORKERS)
+        # Detail page fetches submitted and not finished yet
+        self._in_flight = set()
+
+    def _cached(self, url):
+        entry = self.cache.current(url)
+        if entry and entry['records'] and time.time() - entry.get('stored_at', 0) < ENRICH_TTL:
+            return entry['records'][0]
+        return None
+
+    def _take_budget(self, url):
+        """Whether one more detail page may be fetched for url"""
+        if self.deadline is not None and time.monotonic() + DETAIL_TIMEOUT >= self.deadline:
+            return False
+        host = urlparse(url).netloc
+        with self._lock:
+            if self.fetched >= self.max_pages or self.per_host.get(host, 0) >= ENRICH_MAX_PER_HOST:
+                return False
+            self.fetched += 1
+            self.per_host[host] = self.per_host.get(host, 0) + 1
+            return True
+
+    def details(self, url):
+        """Details for one URL, from cache when fresh or unchanged; None if unavailable"""
+        cached = self._cached(url)
+        if cached is not None:
+            return cached
+        if not self._take_budget(url):
+            return None
+
+        try:
+            response = self.fetcher.get(url, conditional=True, cache=self.cache, timeout=DETAIL_TIMEOUT)
+        except Exception:
+            return None
+
+        unchanged = self.cache.unchanged_records(url, response)
+        if unchanged:
+            details = unchanged[0]
+        elif response.status_code == 200:
+            details = self.extract(response.content)
+        else:
+            return None
+
+        # Also refreshes stored_at, so an unchanged page isn't revalidated again within the TTL
+        self.cache.store(url, response, [details], save=False)
+        return details
+
+    def enrich(self, hackathons, skip=()):
+        """
+        Copies of hackathons with missing fields filled in from their
+        detail pages (none fetched for the links in skip)
+        """
+        urls = list(dict.fromkeys(hack['registration_link'] for hack in hackathons
+                                  if needs_details(hack) and hack['registration_link'] not in skip))
+        if not urls:
+            return hackathons
+
+        futures = {url: self.pool.submit(propagate_span(self.details), url) for url in urls}
+        with self._lock:
+            self._in_flight.update(futures.values())
+        for future in futures.values():
+            future.add_done_callback(self._finished)
+        timeout = ENRICH_WAIT
+        if self.deadline is not None:
+            timeout = max(min(timeout, self.deadline - time.monotonic()), 0)
+        wait(futures.values(), timeout=timeout)
+        self.cache.save()
+
+        details = {url: future.result() for url, future in futures.items()
+                   if future.done() and not future.cancelled() and future.exception() is None}
+
+        enriched = []
+        for hack in hackathons:
+            found = details.get(hack.get('registration_link')) or {}
+            missing = {field: value for field, value in found.items() if hack.get(field) in MISSING}
+            enriched.append(dict(hack, **missing) if missing else hack)
+        return enriched
+
+    def _finished(self, future):
+        with self._lock:
+            self._in_flight.discard(future)
+
+    def close(self):
+        """
+        Drop detail pages not started yet, give the ones loading up to
+        ENRICH_CLOSE_WAIT seconds to finish, and keep what was fetched.
+        """
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            in_flight = list(self._in_flight)
+        wait(in_flight, timeout=ENRICH_CLOSE_WAIT)
+        self.cache.save()
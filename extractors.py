@@ -0,0 +1,95 @@
+import contextlib
+import importlib
+import io
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import json_sources
+from enrichment import extract_details
+from fetcher import OfflineFetcher
+from instrumentation import RunReport, record_cards, record_parse
+
+# 'thread': parse every page on the thread that fetched it (the default)
+# 'process': fetch on the run's threads, parse on a pool of extractor processes
+EXTRACT_MODE = os.getenv('HACKATHON_EXTRACT_MODE', 'thread')
+
+# Extractor processes in 'process' mode
+EXTRACT_WORKERS = int(os.getenv('EXTRACT_WORKERS', os.cpu_count() or 1))
+
+
+def _scrape_listing(module, class_name, source_name, url, status, content, content_type):
+    """
+    Worker side: run a source's scraper method on a listing body fetched
+    by the parent. Returns (records, links of the hardcoded ones, printed
+    output, cards, parse seconds).
+    """
+    scraper_class = getattr(importlib.import_module(module), class_name)
+    source = scraper_class.source(source_name)
+    scraper = scraper_class(fetcher=OfflineFetcher({url: (status, content, content_type)}))
+
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        with RunReport().span(source_name) as span:
+            getattr(scraper, source['method'])()
+    return scraper.hackathons, scraper.static_links, output.getvalue(), span['cards'], span['parse_seconds']
+
+
+class ExtractorPool:
+    """
+    Pool of extractor processes for CPU-bound parsing.
+
+    Fetching stays on the run's threads (shared session, per-host delay,
+    response cache); only raw bodies cross to the worker processes and only
+    plain record dicts come back, so parsing isn't serialised by the GIL
+    and scales with the cores available. Workers are spawned rather than
+    forked because the parent is full of running threads.
+    """
+
+    def __init__(self, workers=EXTRACT_WORKERS):
+        self.pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+
+    def handles(self, source):
+        """
+        Whether a source's parsing can move to the pool: HTML listings only.
+        JSON-first sources are left on their thread, json.loads is cheap.
+        """
+        if not source.get('cards'):
+            return False
+        return not (source.get('api') and json_sources.SOURCE_MODE == 'json')
+
+    def scrape(self, scraper, source):
+        """Fetch a source's listing here, extract it in a worker, add the records to scraper"""
+        fetcher = scraper.fetcher
+        url = source['url']
+        try:
+            response = fetcher.get(url, conditional=True, timeout=source['timeout'])
+
+            records = fetcher.cache.unchanged_records(url, response)
+            if records is not None:
+                scraper.hackathons.extend(records)
+                print(f"♻️  {source['name']}: Page unchanged, reused {len(records)} hackathons\n")
+                return
+
+            module, class_name = type(scraper).__module__, type(scraper).__name__
+            records, static_links, output, cards, parse_seconds = self.pool.submit(
+                _scrape_listing, module, class_name, source['name'], url,
+                response.status_code, response.content, response.headers.get('Content-Type')).result()
+        except Exception as e:
+            print(f"❌ {source['name']} error: {e}\n")
+            return
+
+        print(output, end='')
+        record_cards(cards)
+        record_parse(parse_seconds)
+        scraper.hackathons.extend(records)
+        scraper.static_links.update(static_links)
+        if response.status_code == 200:
+            fetcher.cache.store(url, response, records)
+
+    def extract_details(self, content):
+        """enrichment.extract_details, run in a worker"""
+        return self.pool.submit(extract_details, content).result()
+
+    def close(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
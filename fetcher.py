@@ -0,0 +1,544 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import urlencode, urlparse, urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from storage import cache_path, load_json, save_json
+from archive import ARCHIVE_MODE, PageArchive
+from latency import TIMEOUT_MODE, LatencyTracker
+from instrumentation import record_fetch
+
+# Minimum gap between two requests to the same host (seconds)
+HOST_DELAY = 2
+
+# Keep-alive connections kept open per host
+MAX_CONNECTIONS_PER_HOST = 4
+
+# Retry 429/5xx responses and connection errors with exponential backoff
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Longest a Retry-After (or backoff) is waited out before retrying, run deadline or not
+MAX_RETRY_WAIT = 10
+
+# Requests that may be waiting on a hedged duplicate at once
+HEDGE_WORKERS = 8
+
+# Version of what is extracted from a page (scrapers.py, extractors.py and
+# the detail page parsing in enrichment.py). Bump it with every change
+# there: cached records from another version are not reused, even when the
+# page itself hasn't changed.
+EXTRACTOR_VERSION = 1
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,application/json;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+}
+
+
+def _accept_encoding():
+    """Only advertise brotli when urllib3 can actually decode it"""
+    try:
+        import brotli  # noqa: F401
+        return 'gzip, deflate, br'
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+            return 'gzip, deflate, br'
+        except ImportError:
+            return 'gzip, deflate'
+
+
+def page_url(url, params=None):
+    """url with params encoded into its query string, the way requests would send it"""
+    if not params:
+        return url
+    return f"{url}{'&' if '?' in url else '?'}{urlencode(params, doseq=True)}"
+
+
+def content_hash(body):
+    """Fingerprint of a response body"""
+    return hashlib.sha256(body).hexdigest()
+
+
+def _close_response(future):
+    """Done-callback releasing the connection of a hedged request that lost the race"""
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+class DeadlineRetry(Retry):
+    """
+    Retry that never waits past the run deadline: a server's Retry-After
+    or the backoff is cut to MAX_RETRY_WAIT and to the time left, and
+    nothing is retried once the deadline has passed. Only the statuses in
+    status_forcelist are retried, with or without a Retry-After.
+    """
+
+    def __init__(self, *args, deadline=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # time.monotonic() value after which no request may still be running
+        self.deadline = deadline
+
+    def new(self, **kwargs):
+        retry = super().new(**kwargs)
+        retry.deadline = self.deadline
+        return retry
+
+    def _capped(self, seconds):
+        if self.deadline is not None:
+            seconds = min(seconds, self.deadline - time.monotonic())
+        return max(min(seconds, MAX_RETRY_WAIT), 0)
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            return False
+        return status_code in self.status_forcelist and super().is_retry(method, status_code, has_retry_after)
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else self._capped(retry_after)
+
+    def get_backoff_time(self):
+        return self._capped(super().get_backoff_time())
+
+
+class HostThrottle:
+    """Per-host politeness delay shared by all scrapers in a run"""
+
+    def __init__(self, delay=HOST_DELAY):
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._host_locks = {}
+        self._last_request = {}
+
+    def _host_lock(self, host):
+        with self._lock:
+            if host not in self._host_locks:
+                self._host_locks[host] = threading.Lock()
+            return self._host_locks[host]
+
+    def wait(self, url):
+        """Block until it is polite to hit this URL's host again"""
+        host = urlparse(url).netloc.lower()
+
+        # Requests to the same host queue up behind each other,
+        # requests to different hosts never wait on each other
+        with self._host_lock(host):
+            last = self._last_request.get(host)
+            if last is not None:
+                remaining = self.delay - (time.monotonic() - last)
+                if remaining > 0:
+                    time.sleep(remaining)
+            self._last_request[host] = time.monotonic()
+
+
+class ResponseCache:
+    """
+    On-disk cache of listing pages keyed by URL.
+    Keeps the ETag / Last-Modified validators and a hash of the last body
+    together with the records extracted from it, so an unchanged page
+    (a 304, or a 200 with an identical body) can skip parsing entirely.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or cache_path('http_cache.json')
+        self._lock = threading.Lock()
+        self.entries = load_json(self.path, {})
+        # URLs stored by this process and not saved yet
+        self._changed = set()
+
+    def current(self, url):
+        """The cache entry for url, None if it has no records from this EXTRACTOR_VERSION"""
+        entry = self.entries.get(url)
+        if not entry or entry.get('records') is None or entry.get('extractor_version') != EXTRACTOR_VERSION:
+            return None
+        return entry
+
+    def conditional_headers(self, url):
+        """
+        If-None-Match / If-Modified-Since headers for a cached URL (none when
+        its records are outdated, so the full page comes back to parse)
+        """
+        entry = self.current(url)
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def unchanged_records(self, url, response):
+        """
+        Records extracted last time, if this response shows the page is unchanged.
+        Returns None when the page has to be parsed again.
+        """
+        entry = self.current(url)
+        if not entry:
+            return None
+
+        if response.status_code == 304:
+            unchanged = True
+        elif response.status_code == 200:
+            unchanged = entry.get('content_hash') == content_hash(response.content)
+        else:
+            unchanged = False
+
+        if not unchanged:
+            return None
+        return [dict(record) for record in entry['records']]
+
+    def store(self, url, response, records, save=True):
+        """
+        Remember a response's validators, body hash and what was extracted from it.
+        A 304 keeps the validators and hash it confirmed. With save=False the
+        caller writes the cache out later with save().
+        """
+        with self._lock:
+            if response.status_code == 304 and url in self.entries:
+                entry = dict(self.entries[url])
+            else:
+                entry = {
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'content_hash': content_hash(response.content),
+                }
+            entry['records'] = [dict(record) for record in records]
+            entry['extractor_version'] = EXTRACTOR_VERSION
+            entry['stored_at'] = time.time()
+            self.entries[url] = entry
+            self._changed.add(url)
+            if save:
+                self._save()
+
+    def save(self):
+        with self._lock:
+            self._save()
+
+    def _save(self):
+        """
+        Add this process's entries to the cache on disk (other processes may
+        have saved theirs meanwhile); the newest entry for a URL wins
+        """
+        if not self._changed:
+            return
+        entries = load_json(self.path, {})
+        for url in self._changed:
+            entry = self.entries[url]
+            if entry['stored_at'] >= entries.get(url, {}).get('stored_at', 0):
+                entries[url] = entry
+        save_json(self.path, entries)
+        self.entries = entries
+        self._changed = set()
+
+
+class HttpFetcher:
+    """
+    Shared HTTP layer for all scrapers in a run.
+    One pooled keep-alive session with retries, compression and
+    per-host politeness, plus timing for every request.
+    """
+
+    def __init__(self, throttle=None, cache=None, deadline=None, max_per_host=MAX_CONNECTIONS_PER_HOST,
+                 base_url=None, archive=None, latency=None, hedge_urls=()):
+        self.throttle = throttle or HostThrottle()
+        self.cache = cache or ResponseCache()
+        # Per-host latency history behind adaptive timeouts and hedging
+        self.latency = latency or (LatencyTracker() if TIMEOUT_MODE == 'adaptive' else None)
+        # Listing URLs of critical sources: a request to one still running
+        # after the host's p95 gets a duplicate, and the first answer wins
+        self.hedge_urls = set(hedge_urls)
+        self.hedged = 0
+        self._hedge_pool = ThreadPoolExecutor(max_workers=HEDGE_WORKERS)
+        # Every page body fetched is kept for offline re-extraction (see reextract.py)
+        self.archive = archive or (PageArchive() if ARCHIVE_MODE == 'on' else None)
+        # time.monotonic() value after which no request may still be running
+        self.deadline = deadline
+        self.timings = []
+        self._timings_lock = threading.Lock()
+        # Listing pages already queued this run, shared by every source's crawl
+        self.seen_urls = set()
+        # Stand-in server every request is sent to instead (e.g. benchmarks.fake_server)
+        self.base_url = base_url or os.getenv('SCRAPE_BASE_URL')
+        if self.base_url:
+            # All hosts share the stand-in's one connection pool
+            max_per_host *= 8
+
+        self.session = self._session(RETRY_STATUSES, max_per_host)
+        # For callers that handle rate limiting themselves (see get)
+        self._own_429_session = self._session(tuple(status for status in RETRY_STATUSES if status != 429),
+                                              max_per_host)
+
+    def _session(self, retry_statuses, max_per_host):
+        """A pooled keep-alive session retrying retry_statuses and connection errors"""
+        retry = DeadlineRetry(
+            total=MAX_RETRIES,
+            backoff_factor=BACKOFF_FACTOR,
+            status_forcelist=retry_statuses,
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+            deadline=self.deadline,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=max_per_host,
+            pool_block=True,
+            max_retries=retry,
+        )
+
+        session = requests.Session()
+        session.headers.update(DEFAULT_HEADERS)
+        session.headers['Accept-Encoding'] = _accept_encoding()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def get(self, url, conditional=False, own_429=False, cache=None, **kwargs):
+        """
+        GET a URL through the shared session, recording how long it took
+        and archiving what came back. With conditional=True, replays the
+        validators cached in cache (the listing cache by default) so an
+        unchanged page comes back as a bodyless 304. With own_429=True a
+        429 comes straight back instead of being retried, for callers that
+        back off on their own.
+        """
+        cache = cache or self.cache
+        if conditional:
+            headers = dict(kwargs.pop('headers', None) or {})
+            headers.update(cache.conditional_headers(url))
+            kwargs['headers'] = headers
+
+        self.throttle.wait(url)
+
+        host = urlparse(url).netloc.lower()
+        hedge_after = None
+        if self.latency is not None:
+            kwargs['timeout'] = self.latency.timeout(host, kwargs.get('timeout'))
+            if url.split('?')[0] in self.hedge_urls and not kwargs.get('stream'):
+                hedge_after = self.latency.hedge_after(host)
+
+        capped = False
+        if self.deadline is not None:
+            remaining = self.deadline - time.monotonic()
+            if remaining <= 0:
+                raise requests.Timeout(f"Run deadline reached before fetching {url}")
+            # Never let one request outlive the run budget
+            capped = not kwargs.get('timeout') or remaining < kwargs['timeout']
+            kwargs['timeout'] = min(kwargs.get('timeout') or remaining, remaining)
+
+        session = self._own_429_session if own_429 else self.session
+        start = time.monotonic()
+        status = None
+        size = 0
+        try:
+            if hedge_after is not None:
+                response = self._hedged_get(session, url, hedge_after, **kwargs)
+            else:
+                response = session.get(self._target(url), **kwargs)
+            status = response.status_code
+            if kwargs.get('stream'):
+                # Body not read yet, the caller may stop early
+                size = int(response.headers.get('Content-Length') or 0)
+            else:
+                size = len(response.content)
+        finally:
+            seconds = time.monotonic() - start
+            record_fetch(status, seconds, size)
+            # A request cut short by the run deadline says nothing about the host
+            if self.latency is not None and (status is not None or not capped):
+                self.latency.record(host, seconds)
+            with self._timings_lock:
+                self.timings.append({
+                    'url': url,
+                    'status': status,
+                    'seconds': round(seconds, 3),
+                    'bytes': size,
+                })
+
+        # Streamed bodies are read by the caller and never archived
+        if self.archive is not None and not kwargs.get('stream'):
+            self._archive(url, kwargs.get('params'), response, cache)
+        return response
+
+    def _hedged_get(self, session, url, hedge_after, **kwargs):
+        """
+        GET url, sending one duplicate if the first request hasn't
+        answered within hedge_after seconds. The duplicate waits its turn
+        with the host throttle like any other request. The first successful
+        answer wins; the other request is left to finish and closed.
+        """
+        target = self._target(url)
+        first = self._hedge_pool.submit(session.get, target, **kwargs)
+        done, pending = wait([first], timeout=hedge_after)
+        if done:
+            return first.result()
+
+        self.throttle.wait(url)
+        # The first request may have answered while the throttle held the duplicate back
+        if first.done():
+            return first.result()
+
+        with self._timings_lock:
+            self.hedged += 1
+        pending = {first, self._hedge_pool.submit(session.get, target, **kwargs)}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    error = future.exception()
+                    continue
+                for loser in pending:
+                    loser.add_done_callback(_close_response)
+                return future.result()
+        raise error
+
+    def _archive(self, url, params, response, cache):
+        """
+        Archive a response body; a 304 points at the unchanged body
+        archived before, found by its hash in cache (the one whose
+        validators were sent)
+        """
+        try:
+            content_type = response.headers.get('Content-Type')
+            if response.status_code == 200:
+                self.archive.add(page_url(url, params), response.content, content_type)
+            elif response.status_code == 304:
+                entry = cache.entries.get(url) or {}
+                self.archive.add(page_url(url, params), content_type=content_type, digest=entry.get('content_hash'))
+        except OSError as e:
+            print(f"⚠️  Could not archive {url}: {e}")
+
+    def _target(self, url):
+        """Where a request for url really goes: url itself, or <base_url>/<host><path>"""
+        if not self.base_url:
+            return url
+        parts = urlsplit(url)
+        target = f"{self.base_url.rstrip('/')}/{parts.netloc}{parts.path}"
+        return f"{target}?{parts.query}" if parts.query else target
+
+    def failed(self, url):
+        """Whether the last request made to this URL errored or got a 4xx/5xx"""
+        with self._timings_lock:
+            for timing in reversed(self.timings):
+                if timing['url'] == url:
+                    return timing['status'] is None or timing['status'] >= 400
+        return False
+
+    def summary(self):
+        """One-line summary of all requests made so far"""
+        total_bytes = sum(t['bytes'] for t in self.timings)
+        failed = len([t for t in self.timings if t['status'] is None])
+        slowest = max(self.timings, key=lambda t: t['seconds'], default=None)
+
+        line = f"🌐 {len(self.timings)} requests, {total_bytes / 1024:.0f} KB downloaded, {failed} failed"
+        if self.hedged:
+            line += f", {self.hedged} hedged"
+        if slowest:
+            line += f", slowest {urlparse(slowest['url']).netloc} ({slowest['seconds']:.1f}s)"
+        return line
+
+    def close(self):
+        if self.latency is not None:
+            self.latency.save()
+        self._hedge_pool.shutdown(wait=False)
+        self.session.close()
+        self._own_429_session.close()
+        if self.archive is not None:
+            try:
+                self.archive.prune()
+            except OSError as e:
+                print(f"⚠️  Could not prune the page archive: {e}")
+
+
+class StoredResponse:
+    """Just enough of requests.Response to run a scraper on a body already in hand"""
+
+    def __init__(self, url, status_code, content, content_type=None):
+        self.url = url
+        self.status_code = status_code
+        self.content = content or b''
+        self.headers = {'Content-Type': content_type} if content_type else {}
+        self.encoding = None
+        if content_type and 'charset=' in content_type:
+            self.encoding = content_type.split('charset=')[-1].split(';')[0].strip()
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+    def json(self):
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        for i in range(0, len(self.content), chunk_size):
+            chunk = self.content[i:i + chunk_size]
+            yield chunk.decode(self.encoding or 'utf-8') if decode_unicode else chunk
+
+    def close(self):
+        pass
+
+
+class NoCache:
+    """Response cache that never short-circuits, so every body is parsed"""
+
+    def __init__(self):
+        self.entries = {}
+
+    def current(self, url):
+        return None
+
+    def conditional_headers(self, url):
+        return {}
+
+    def unchanged_records(self, url, response):
+        return None
+
+    def store(self, url, response, records, save=True):
+        pass
+
+    def save(self):
+        pass
+
+
+class OfflineFetcher:
+    """
+    Stand-in for HttpFetcher that never touches the network.
+    Answers every request from bodies, {url with query: (status, content,
+    content type)}, and with a 404 for anything not in it.
+    """
+
+    def __init__(self, bodies=None):
+        self.bodies = bodies or {}
+        self.cache = NoCache()
+        self.seen_urls = set()
+
+    def stored(self, url):
+        """(status, content, content type) for a URL, None if there is none"""
+        return self.bodies.get(url)
+
+    def get(self, url, conditional=False, **kwargs):
+        url = page_url(url, kwargs.get('params'))
+        stored = self.stored(url)
+        if stored is None:
+            return StoredResponse(url, 404, b'')
+        return StoredResponse(url, *stored)
+
+    def failed(self, url):
+        stored = self.stored(url)
+        return stored is None or stored[0] >= 400
+
+    def close(self):
+        pass
+
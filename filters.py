@@ -1,37 +1,47 @@
 from datetime import datetime, timedelta
+import dedupe
+from records import UNSET, Hackathon, as_record, as_records
+from stats import HackathonStats
+
+# Statuses that mean registrations are open
+LIVE_STATUSES = frozenset(['live', 'open', 'active', 'ongoing', 'coding'])
+
+# Platforms whose listings are live when they carry no status at all
+LIVE_BY_DEFAULT = frozenset(['GitHub', 'Unstop'])
+
+def is_live(hack):
+    """
+    Decide whether a single hackathon is LIVE.
+    Upcoming, closed and unknown statuses are not; the hackathon itself is
+    left untouched (see as_live).
+    """
+    status = as_record(hack).status_key
+    
+    # Only keep if status is explicitly LIVE
+    if status in LIVE_STATUSES:
+        return True
+    # If no status, check platform defaults
+    if not status:
+        # These platforms usually have live content
+        return hack.get('platform') in LIVE_BY_DEFAULT
+    
+    # Skip upcoming, closed and unknown statuses
+    return False
+
+def as_live(hack):
+    """A LIVE hackathon with its status standardized to 'Live' (a copy if it was spelled otherwise)"""
+    return hack if hack.get('status') == 'Live' else hack.replace(status='Live')
 
 def filter_live_hackathons(hackathons):
     """
     Filter to show ONLY LIVE hackathons
     Remove all upcoming and closed ones
     """
-    live_hackathons = []
-    
-    for hack in hackathons:
-        status = hack.get('status', '').lower()
-        
-        # Only keep if status is explicitly LIVE
-        if status in ['live', 'open', 'active', 'ongoing', 'coding']:
-            hack['status'] = 'Live'  # Standardize to 'Live'
-            live_hackathons.append(hack)
-        # Skip upcoming and closed
-        elif status in ['upcoming', 'closed', 'ended', 'finished', 'completed', 'before']:
-            continue
-        # If no status, check platform defaults
-        elif not status:
-            # These platforms usually have live content
-            if hack.get('platform') in ['GitHub', 'Unstop']:
-                hack['status'] = 'Live'
-                live_hackathons.append(hack)
-            else:
-                # Skip if unknown status
-                continue
-    
-    return live_hackathons
+    return [as_live(hack) for hack in as_records(hackathons) if is_live(hack)]
 
 def filter_upcoming_hackathons(hackathons):
     """Get only upcoming hackathons"""
-    return [h for h in hackathons if h.get('status', '').lower() in ['upcoming', 'before']]
+    return [h for h in as_records(hackathons) if h.status_key in ['upcoming', 'before']]
 
 def filter_fresher_friendly(hackathons):
     """Filter only fresher-friendly hackathons"""
@@ -47,16 +57,27 @@ def filter_by_mode(hackathons, mode):
     """Filter hackathons by mode (Online/Offline/Hybrid)"""
     if not mode:
         return hackathons
-    return [h for h in hackathons if h.get('mode', '').lower() == mode.lower()]
+    mode = mode.lower()
+    return [h for h in as_records(hackathons) if h.mode_key == mode]
+
+def duplicate_key(hack):
+    """Unique key of a hackathon: name and link"""
+    return as_record(hack).dedupe_key
 
 def remove_duplicates(hackathons):
-    """Remove duplicate hackathons based on name and link"""
+    """
+    Remove duplicate hackathons based on name and link.
+    In 'fuzzy' mode (HACKATHON_DEDUPE) the same event listed by several
+    sources under variants of its name or link is merged into one record.
+    """
+    if dedupe.DEDUPE_MODE == 'fuzzy':
+        return dedupe.merge_duplicates(hackathons)
+    
     seen = set()
     unique = []
     
-    for hack in hackathons:
-        # Create unique key
-        key = f"{hack.get('name', '')}||{hack.get('registration_link', '')}"
+    for hack in as_records(hackathons):
+        key = hack.dedupe_key
         if key not in seen:
             seen.add(key)
             unique.append(hack)
@@ -74,46 +95,98 @@ def sort_hackathons(hackathons, sort_by='name'):
     else:
         return sorted(hackathons, key=lambda x: x.get('name', ''))
 
-def apply_all_filters(hackathons, live_only=True, fresher_only=False, remove_dupes=True):
-    """Apply all filters at once"""
-    filtered = hackathons
-    
-    # First remove duplicates
-    if remove_dupes:
-        filtered = remove_duplicates(filtered)
-    
-    # Then filter by status (LIVE only)
-    if live_only:
-        filtered = filter_live_hackathons(filtered)
+def apply_all_filters(hackathons, live_only=True, fresher_only=False, remove_dupes=True, platforms=None, mode=None):
+    """
+    Apply all filters at once, in a single pass.
+    Dedupes, keeps LIVE / fresher-friendly / platform / mode matches and
+    returns them sorted by platform. Records are bucketed per platform as
+    they pass, so the only sort is over the handful of platform names.
+    Input records are never modified.
+    """
+    # Near duplicates across sources need clustering first (see remove_duplicates)
+    if remove_dupes and dedupe.DEDUPE_MODE == 'fuzzy':
+        hackathons = dedupe.merge_duplicates(hackathons)
     
-    # Then filter by fresher friendly
-    if fresher_only:
-        filtered = filter_fresher_friendly(filtered)
+    seen = set()
+    platforms = set(platforms) if platforms else None
+    mode = mode.lower() if mode else None
+    by_platform = {}
     
-    # Sort by platform for better organization
-    filtered = sort_hackathons(filtered, sort_by='platform')
+    for hack in hackathons:
+        if type(hack) is not Hackathon:
+            hack = as_record(hack)
+        # Slots are read directly (UNSET when missing): this loop runs once per record
+        platform = hack.platform
+        if platform is UNSET:
+            platform = ''
+        
+        # First remove duplicates (a duplicate counts even if it's filtered out)
+        if remove_dupes:
+            key = hack.dedupe_key
+            if key in seen:
+                continue
+            seen.add(key)
+        
+        # Then filter by status (LIVE only); is_live / as_live, inlined
+        if live_only:
+            status = hack.status_key
+            if status not in LIVE_STATUSES and (status or platform not in LIVE_BY_DEFAULT):
+                continue
+            if hack.status != 'Live':
+                hack = hack.replace(status='Live')
+        
+        # An unset fresher_friendly counts as fresher-friendly
+        if fresher_only and hack.fresher_friendly is not UNSET and not hack.fresher_friendly:
+            continue
+        if platforms is not None and platform not in platforms:
+            continue
+        if mode is not None and hack.mode_key != mode:
+            continue
+        
+        # Sort by platform for better organization (stable within a platform)
+        bucket = by_platform.get(platform)
+        if bucket is None:
+            bucket = by_platform[platform] = []
+        bucket.append(hack)
     
+    filtered = []
+    for platform in sorted(by_platform):
+        filtered.extend(by_platform[platform])
     return filtered
 
-def get_statistics(hackathons):
-    """Get statistics about hackathons"""
-    stats = {
-        'total': len(hackathons),
-        'live': len([h for h in hackathons if h.get('status', '').lower() == 'live']),
-        'upcoming': len([h for h in hackathons if h.get('status', '').lower() == 'upcoming']),
-        'platforms': len(set(h.get('platform', '') for h in hackathons)),
-        'fresher_friendly': len([h for h in hackathons if h.get('fresher_friendly', False)]),
-        'online': len([h for h in hackathons if h.get('mode', '').lower() == 'online']),
-        'offline': len([h for h in hackathons if h.get('mode', '').lower() == 'offline']),
-        'hybrid': len([h for h in hackathons if h.get('mode', '').lower() == 'hybrid'])
-    }
+def iter_filtered(hackathons, live_only=True, fresher_only=False, remove_dupes=True):
+    """
+    Streaming version of apply_all_filters.
+    Takes any iterable (e.g. orchestrator.iter_hackathons) and yields
+    hackathons as they pass, without sorting.
+    Near duplicates ('fuzzy' mode) can't be merged into a hackathon that
+    was already yielded, so only the first record of each event is kept.
+    """
+    seen = set()
+    index = dedupe.DuplicateIndex() if dedupe.DEDUPE_MODE == 'fuzzy' else None
     
-    # Platform breakdown
-    platform_counts = {}
     for hack in hackathons:
-        platform = hack.get('platform', 'Unknown')
-        platform_counts[platform] = platform_counts.get(platform, 0) + 1
-    
-    stats['by_platform'] = platform_counts
-    
-    return stats
\ No newline at end of file
+        hack = as_record(hack)
+        if remove_dupes and index is not None:
+            position = len(index.fingerprints)
+            if index.add(hack) != position:
+                continue
+        elif remove_dupes:
+            key = hack.dedupe_key
+            if key in seen:
+                continue
+            seen.add(key)
+        
+        if live_only:
+            if not is_live(hack):
+                continue
+            hack = as_live(hack)
+        
+        if fresher_only and not hack.get('fresher_friendly', True):
+            continue
+        
+        yield hack
+
+def get_statistics(hackathons):
+    """Get statistics about hackathons (all counters in one pass, see stats.HackathonStats)"""
+    return HackathonStats(hackathons).snapshot()
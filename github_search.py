@@ -0,0 +1,126 @@
+import json
+import os
+import threading
+import time
+from storage import cache_path, load_json, save_json
+
+# Search results are reused for this long by every process on the host (seconds)
+CACHE_TTL = int(os.getenv('GITHUB_CACHE_TTL', 3600))
+
+# GitHub's maximum page size for search
+MAX_PER_PAGE = 100
+
+_lock = threading.Lock()
+
+
+def _compact(repo):
+    """Keep only the repository fields the scraper uses"""
+    return {
+        'name': repo.get('name') or '',
+        'description': repo.get('description') or '',
+        'html_url': repo.get('html_url') or '',
+        'owner': (repo.get('owner') or {}).get('login') or '',
+    }
+
+
+class GitHubSearch:
+    """
+    Rate-limit-aware client for GitHub repository search.
+
+    The search quota is per IP, so the web workers, the scheduler and the
+    dashboard all draw from the same 10 (or 30 with a token) requests per
+    minute. Results and the rate-limit window are therefore kept in one
+    on-disk cache that every process reads before touching the API.
+    """
+
+    def __init__(self, fetcher, url, path=None):
+        self.fetcher = fetcher
+        self.url = url
+        self.path = path or cache_path('github_search.json')
+
+    def _headers(self):
+        headers = {'Accept': 'application/vnd.github+json'}
+        # Optional: raises the search limit from 10 to 30 requests/minute
+        token = os.getenv('GITHUB_TOKEN')
+        if token:
+            headers['Authorization'] = f"Bearer {token}"
+        return headers
+
+    def search(self, params, max_items, timeout=15):
+        """Up to max_items repositories for a query, from cache when possible"""
+        key = json.dumps(dict(params, max_items=max_items), sort_keys=True)
+        cache = load_json(self.path, {'queries': {}, 'reset_at': 0})
+        entry = cache['queries'].get(key)
+        now = time.time()
+
+        if entry and now - entry['fetched_at'] < CACHE_TTL:
+            print(f"   ♻️  Using cached search results ({(now - entry['fetched_at']) / 60:.0f} min old)")
+            return entry['items']
+
+        if now < cache.get('reset_at', 0):
+            print(f"   ⏳ Rate limit exhausted for another {cache['reset_at'] - now:.0f}s, using cached results")
+            return entry['items'] if entry else []
+
+        items, reset_at = self._fetch_pages(params, max_items, timeout)
+
+        with _lock:
+            # Another process may have written in the meantime
+            cache = load_json(self.path, {'queries': {}, 'reset_at': 0})
+            if reset_at:
+                cache['reset_at'] = reset_at
+            if items is not None:
+                cache['queries'][key] = {'fetched_at': time.time(), 'items': items}
+            save_json(self.path, cache)
+
+        if items is None:
+            return entry['items'] if entry else []
+        return items
+
+    def _fetch_pages(self, params, max_items, timeout):
+        """
+        Page through the search API.
+        Returns (items or None if nothing could be fetched, rate-limit reset time or None).
+        """
+        per_page = min(max_items, MAX_PER_PAGE)
+        items = []
+        reset_at = None
+        page = 1
+
+        while len(items) < max_items:
+            response = self.fetcher.get(
+                self.url,
+                params=dict(params, per_page=per_page, page=page),
+                headers=self._headers(),
+                timeout=timeout,
+                own_429=True,
+            )
+            remaining = response.headers.get('X-RateLimit-Remaining')
+            reset = response.headers.get('X-RateLimit-Reset')
+
+            if response.status_code in (403, 429):
+                # Back off until GitHub says the window resets
+                retry_after = response.headers.get('Retry-After')
+                if retry_after:
+                    reset_at = time.time() + int(retry_after)
+                else:
+                    reset_at = int(reset) if reset else time.time() + 60
+                print(f"   ⚠️  GitHub rate limit hit, backing off for {reset_at - time.time():.0f}s")
+                break
+
+            if response.status_code != 200:
+                print(f"   ⚠️  GitHub: Status code {response.status_code}")
+                break
+
+            batch = response.json().get('items', [])
+            items.extend(_compact(repo) for repo in batch)
+
+            if remaining is not None and int(remaining) == 0:
+                reset_at = int(reset) if reset else time.time() + 60
+                break
+            if len(batch) < per_page:
+                break
+            page += 1
+
+        if not items and page == 1:
+            return None, reset_at
+        return items[:max_items], reset_at
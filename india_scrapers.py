@@ -1,27 +1,66 @@
-import requests
-from bs4 import BeautifulSoup
-import time
+from fetcher import HttpFetcher
+from instrumentation import record_cards
+from parsing import make_soup, find_cards
+from orchestrator import scrape_all
+
+# Card elements each source looks for; in fast parse mode only these get built
+TECHGIG_CARDS = [
+    ('div', {'class': 'challenge-card'}),
+]
+
+HACKERRANK_CARDS = [
+    ('div', {'class': 'contest-card'}),
+    ('a', {'href': lambda href: '/contests/' in href}),
+]
+
 
 class IndiaHackathonScraper:
     """Scraper specifically for Indian hackathon platforms"""
     
-    def __init__(self):
+    # Source registry: what each scraper fetches and how much it may spend.
+    # priority 1 = always worth running, 3 = first to go when the run is short on time
+    SOURCES = [
+        {'name': 'TechGig', 'method': 'scrape_techgig', 'priority': 2,
+         'url': 'https://www.techgig.com/challenge', 'cards': TECHGIG_CARDS,
+         'timeout': 15, 'max_items': 10},
+        {'name': 'HackerRank', 'method': 'scrape_hackerrank', 'priority': 2,
+         'url': 'https://www.hackerrank.com/contests', 'cards': HACKERRANK_CARDS,
+         'timeout': 15, 'max_items': 10},
+        # Static entries, nothing to fetch
+        {'name': 'Skillenza', 'method': 'scrape_skillenza', 'priority': 1, 'timeout': 0},
+        {'name': 'DPhi', 'method': 'scrape_dphi', 'priority': 1, 'timeout': 0},
+    ]
+    
+    def __init__(self, fetcher=None):
         self.hackathons = []
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
+        # Links of the hardcoded fallback records added (no detail page worth fetching)
+        self.static_links = set()
+        # Shared pooled session (keep-alive, retries, compression)
+        self.fetcher = fetcher or HttpFetcher()
+    
+    @classmethod
+    def source(cls, name):
+        """Registry entry of a source"""
+        return next(source for source in cls.SOURCES if source['name'] == name)
+    
+    def _add_static(self, records):
+        """Add hardcoded fallback records"""
+        self.hackathons.extend(records)
+        self.static_links.update(hack['registration_link'] for hack in records)
     
     def scrape_techgig(self):
         """Scrape TechGig hackathons"""
+        source = self.source('TechGig')
         print("🔍 Scraping TechGig...")
         try:
-            url = "https://www.techgig.com/challenge"
-            response = requests.get(url, headers=self.headers, timeout=15)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            url = source['url']
+            response = self.fetcher.get(url, timeout=source['timeout'])
+            soup = make_soup(response.content, source['cards'])
             
-            challenges = soup.find_all('div', class_='challenge-card')
+            challenges = find_cards(soup, source['cards'])
             
-            for challenge in challenges[:10]:
+            record_cards(min(len(challenges), source['max_items']))
+            for challenge in challenges[:source['max_items']]:
                 try:
                     title_elem = challenge.find('h3') or challenge.find('h4')
                     title = title_elem.text.strip() if title_elem else "TechGig Challenge"
@@ -45,6 +84,7 @@ class IndiaHackathonScraper:
                 except:
                     continue
             
+            soup.decompose()  # Free the tree as soon as records are out
             print(f"✅ TechGig: Found {len([h for h in self.hackathons if h['platform'] == 'TechGig'])} hackathons\n")
             
         except Exception as e:
@@ -52,19 +92,22 @@ class IndiaHackathonScraper:
     
     def scrape_hackerrank(self):
         """Scrape HackerRank contests"""
+        source = self.source('HackerRank')
         print("🔍 Scraping HackerRank...")
         try:
-            url = "https://www.hackerrank.com/contests"
-            response = requests.get(url, headers=self.headers, timeout=15)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            url = source['url']
+            response = self.fetcher.get(url, timeout=source['timeout'])
+            soup = make_soup(response.content, source['cards'])
             
-            # Find contest sections
-            contest_sections = soup.find_all('div', class_='contest-card')
+            # Contest sections, or contest links if there are none (one pass)
+            cards = find_cards(soup, source['cards'])
+            contest_sections = [card for card in cards if card.name == 'div']
             
             if not contest_sections:
                 # Alternative: find by links
-                contest_links = soup.find_all('a', href=lambda x: x and '/contests/' in str(x))
-                for link in contest_links[:10]:
+                contest_links = cards
+                record_cards(min(len(contest_links), source['max_items']))
+                for link in contest_links[:source['max_items']]:
                     try:
                         name = link.text.strip() or "HackerRank Contest"
                         
@@ -89,6 +132,7 @@ class IndiaHackathonScraper:
                     except:
                         continue
             
+            soup.decompose()  # Free the tree as soon as records are out
             print(f"✅ HackerRank: Found {len([h for h in self.hackathons if h['platform'] == 'HackerRank'])} contests\n")
             
         except Exception as e:
@@ -109,7 +153,7 @@ class IndiaHackathonScraper:
                     'status': 'Live'
                 }
             ]
-            self.hackathons.extend(manual_skillenza)
+            self._add_static(manual_skillenza)
             print(f"✅ Skillenza: Added {len(manual_skillenza)} known challenges\n")
             
         except Exception as e:
@@ -131,26 +175,17 @@ class IndiaHackathonScraper:
                     'organizer': 'DPhi Tech'
                 }
             ]
-            self.hackathons.extend(manual_dphi)
+            self._add_static(manual_dphi)
             print(f"✅ DPhi: Added {len(manual_dphi)} known challenges\n")
             
         except Exception as e:
             print(f"❌ DPhi error: {e}\n")
     
     def get_all_india_hackathons(self):
-        """Run all India-specific scrapers"""
+        """Run all India-specific scrapers in parallel"""
         print("\n🇮🇳 Scraping India-specific platforms...\n")
         
-        self.scrape_techgig()
-        time.sleep(2)
-        
-        self.scrape_hackerrank()
-        time.sleep(2)
-        
-        self.scrape_skillenza()
-        time.sleep(2)
-        
-        self.scrape_dphi()
+        self.hackathons.extend(scrape_all([IndiaHackathonScraper]))
         
         print(f"✅ India scrapers: Found {len(self.hackathons)} total\n")
-        return self.hackathons
\ No newline at end of file
+        return self.hackathons
@@ -0,0 +1,148 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from storage import cache_path, load_json, save_json
+
+# How many run reports are kept on disk for /health/runs
+REPORTS_KEPT = int(os.getenv('RUN_REPORTS_KEPT', 20))
+
+# The span of the source running on this thread, if any
+_current = threading.local()
+_span_lock = threading.Lock()
+_reports_lock = threading.Lock()
+
+
+def _active_span():
+    return getattr(_current, 'span', None)
+
+
+def propagate_span(func):
+    """Wrap func so it charges the caller's span when run on another thread"""
+    span = _active_span()
+
+    def run(*args, **kwargs):
+        # Run inline on the caller's own thread, the span it had must survive
+        previous = _active_span()
+        _current.span = span
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _current.span = previous
+
+    return run
+
+
+def record_fetch(status, seconds, size):
+    """Charge one HTTP request to the source running on this thread"""
+    span = _active_span()
+    if span is None:
+        return
+    # A source may fetch pages on several threads at once
+    with _span_lock:
+        span['requests'] += 1
+        span['bytes'] += size
+        span['fetch_seconds'] += seconds
+        span['http_status'] = status
+
+
+def record_parse(seconds):
+    """Charge time spent building a parse tree to the running source"""
+    span = _active_span()
+    if span is not None:
+        with _span_lock:
+            span['parse_seconds'] += seconds
+
+
+def record_cards(count):
+    """Count candidate cards a source tried to turn into records"""
+    span = _active_span()
+    if span is not None:
+        with _span_lock:
+            span['cards'] += count
+
+
+class RunReport:
+    """
+    Timing spans for every source in one scrape run.
+
+    Each span covers requests made, bytes downloaded, the last HTTP status,
+    fetch latency, parse time, extraction time (what is left of the span),
+    items extracted and candidate cards dropped on the way.
+    """
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.spans = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name):
+        """Time one source; the dict yielded can be given an outcome and item count"""
+        span = {
+            'source': name,
+            'outcome': 'ok',
+            'requests': 0,
+            'bytes': 0,
+            'http_status': None,
+            'fetch_seconds': 0.0,
+            'parse_seconds': 0.0,
+            'extract_seconds': 0.0,
+            'total_seconds': 0.0,
+            'cards': 0,
+            'items': 0,
+            'dropped': 0,
+        }
+        previous = _active_span()
+        _current.span = span
+        start = time.monotonic()
+        try:
+            yield span
+        except Exception:
+            span['outcome'] = 'crashed'
+            raise
+        finally:
+            _current.span = previous
+            span['total_seconds'] = time.monotonic() - start
+            span['extract_seconds'] = max(span['total_seconds'] - span['fetch_seconds'] - span['parse_seconds'], 0)
+            span['dropped'] = max(span['cards'] - span['items'], 0)
+            for key in ('fetch_seconds', 'parse_seconds', 'extract_seconds', 'total_seconds'):
+                span[key] = round(span[key], 3)
+            with self._lock:
+                self.spans.append(span)
+
+    def to_dict(self, source_names=()):
+        """
+        JSON-ready report. Sources listed in source_names that never
+        finished (cut off by the run deadline) are reported as such.
+        """
+        with self._lock:
+            spans = list(self.spans)
+        finished = {span['source'] for span in spans}
+        spans.extend({'source': name, 'outcome': 'unfinished'} for name in source_names if name not in finished)
+
+        return {
+            'started_at': self.started_at,
+            'seconds': round(time.time() - self.started_at, 3),
+            'requests': sum(span.get('requests', 0) for span in spans),
+            'bytes': sum(span.get('bytes', 0) for span in spans),
+            'items': sum(span.get('items', 0) for span in spans),
+            'sources': spans,
+        }
+
+    def save(self, source_names=(), path=None):
+        """Append this run to the on-disk report history, keeping the last REPORTS_KEPT"""
+        path = path or cache_path('run_reports.json')
+        report = self.to_dict(source_names)
+        with _reports_lock:
+            reports = load_json(path, [])
+            reports.append(report)
+            save_json(path, reports[-REPORTS_KEPT:])
+        print(f"📝 Run report saved ({len(report['sources'])} sources, {report['seconds']:.1f}s)")
+        return report
+
+
+def load_reports(limit=REPORTS_KEPT, path=None):
+    """Most recent run reports, newest first"""
+    reports = load_json(path or cache_path('run_reports.json'), [])
+    return list(reversed(reports[-limit:])) if limit > 0 else []
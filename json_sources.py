@@ -0,0 +1,119 @@
+import os
+import re
+import time
+
+# 'json': use a platform's JSON listing when it has one, HTML when that fails
+# 'html': always scrape the HTML pages (the original behaviour)
+SOURCE_MODE = os.getenv('HACKATHON_SOURCE_MODE', 'json')
+
+LEETCODE_QUERY = '{ upcomingContests { title titleSlug startTime duration } }'
+
+
+def _strip_tags(text):
+    return re.sub(r'<[^>]+>', '', text or '').strip()
+
+
+def devpost_records(data):
+    """Hackathons from devpost.com/api/hackathons"""
+    records = []
+    for item in data.get('hackathons', []):
+        state = item.get('open_state')
+        if state not in ('open', 'upcoming'):
+            continue
+        location = (item.get('displayed_location') or {}).get('location') or 'Online'
+        records.append({
+            'name': item['title'].strip(),
+            'platform': 'Devpost',
+            'registration_link': item.get('url', ''),
+            'mode': 'Online' if location.lower() == 'online' else 'Offline',
+            'location': location,
+            'prize_pool': _strip_tags(item.get('prize_amount')) or 'N/A',
+            'event_date': item.get('submission_period_dates', ''),
+            'organizer': item.get('organization_name') or 'Devpost',
+            'fresher_friendly': True,
+            'status': 'Live' if state == 'open' else 'Upcoming',
+        })
+    return records
+
+
+def unstop_records(data):
+    """Open hackathons from Unstop's public opportunity search"""
+    records = []
+    for item in (data.get('data') or {}).get('data', []):
+        link = item.get('public_url') or item.get('seo_url') or ''
+        if link and not link.startswith('http'):
+            link = f"https://unstop.com/{link.lstrip('/')}"
+        cash = sum(prize.get('cash') or 0 for prize in item.get('prizes') or [])
+        records.append({
+            'name': item['title'].strip(),
+            'platform': 'Unstop',
+            'registration_link': link,
+            'organizer': (item.get('organisation') or {}).get('name') or 'Unstop',
+            'mode': (item.get('region') or 'online').title(),
+            'prize_pool': f"₹{cash:,}" if cash else 'N/A',
+            'event_date': (item.get('end_date') or '')[:10],
+            'fresher_friendly': True,
+            'status': 'Live',
+        })
+    return records
+
+
+def kaggle_records(data):
+    """Competitions from Kaggle's competitions/list API"""
+    records = []
+    for item in data if isinstance(data, list) else []:
+        link = item.get('ref') or ''
+        if link and not link.startswith('http'):
+            link = f"https://www.kaggle.com/competitions/{link}"
+        title = item.get('title', '').strip()
+        if not title or not link:
+            continue
+        records.append({
+            'name': f"Kaggle: {title[:100]}",
+            'platform': 'Kaggle',
+            'registration_link': link,
+            'mode': 'Online',
+            'prize_pool': item.get('reward') or 'Knowledge & Experience',
+            'event_date': (item.get('deadline') or '')[:10],
+            'fresher_friendly': True,
+            'status': 'Live',
+            'organizer': item.get('organizationName') or 'Kaggle',
+        })
+    return records
+
+
+def leetcode_records(data):
+    """Upcoming contests from LeetCode's GraphQL API"""
+    records = []
+    for item in ((data.get('data') or {}).get('upcomingContests') or []):
+        records.append({
+            'name': item['title'],
+            'platform': 'LeetCode',
+            'registration_link': f"https://leetcode.com/contest/{item.get('titleSlug', '')}",
+            'mode': 'Online',
+            'event_date': time.strftime('%Y-%m-%d %H:%M', time.gmtime(item['startTime'])),
+            'fresher_friendly': True,
+            'status': 'Upcoming',
+            'organizer': 'LeetCode',
+        })
+    return records
+
+
+def hackerearth_records(data):
+    """Ongoing and upcoming challenges from HackerEarth's events feed"""
+    records = []
+    for item in data.get('response', []):
+        status = item.get('status')
+        name = (item.get('title') or '').strip()
+        if status not in ('ONGOING', 'UPCOMING') or not name or 'hiring' in name.lower():
+            continue
+        records.append({
+            'name': name,
+            'platform': 'HackerEarth',
+            'registration_link': item.get('url', ''),
+            'mode': 'Online',
+            'event_date': (item.get('start_timestamp') or '')[:10],
+            'fresher_friendly': True,
+            'status': 'Live' if status == 'ONGOING' else 'Upcoming',
+        })
+    return records
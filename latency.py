@@ -0,0 +1,79 @@
+import math
+import os
+import threading
+
+from storage import cache_path, load_json, save_json
+
+# 'adaptive': derive each host's timeout from its latency history
+# 'fixed': always use the timeout the scraper asked for
+TIMEOUT_MODE = os.getenv('HACKATHON_TIMEOUT_MODE', 'adaptive')
+
+# Latency samples kept per host, and how many are needed before they're trusted
+SAMPLES_KEPT = 50
+MIN_SAMPLES = 5
+
+# Adaptive timeout: TIMEOUT_FACTOR x the host's p99, never below MIN_TIMEOUT
+# and never above what the scraper asked for (seconds)
+TIMEOUT_FACTOR = 3
+MIN_TIMEOUT = 3
+
+
+def percentile(samples, q):
+    """q-th percentile (0-100) of samples, nearest-rank"""
+    ordered = sorted(samples)
+    rank = max(math.ceil(q / 100 * len(ordered)) - 1, 0)
+    return ordered[rank]
+
+
+class LatencyTracker:
+    """
+    Per-host response times, persisted across runs in .cache/latency.json.
+
+    Every request's latency is recorded (a request that timed out counts
+    with the time it waited, so a host that hangs pushes its own timeout
+    up rather than down). The percentiles give each host a timeout that
+    fits how it actually behaves, and the p95 after which a request to a
+    critical source is hedged.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or cache_path('latency.json')
+        self._lock = threading.Lock()
+        self.samples = load_json(self.path, {})
+        # Samples taken this run, merged into whatever is on disk at save time
+        self.new = {}
+
+    def record(self, host, seconds):
+        with self._lock:
+            self.samples.setdefault(host, []).append(round(seconds, 3))
+            self.samples[host] = self.samples[host][-SAMPLES_KEPT:]
+            self.new.setdefault(host, []).append(round(seconds, 3))
+
+    def _history(self, host):
+        with self._lock:
+            samples = list(self.samples.get(host, ()))
+        return samples if len(samples) >= MIN_SAMPLES else None
+
+    def timeout(self, host, requested):
+        """Timeout for a request to host; requested is the ceiling (and the fallback)"""
+        samples = self._history(host)
+        if samples is None or requested is None:
+            return requested
+        return min(max(percentile(samples, 99) * TIMEOUT_FACTOR, MIN_TIMEOUT), requested)
+
+    def hedge_after(self, host):
+        """Seconds after which a duplicate request is worth sending (the host's p95), None if unknown"""
+        samples = self._history(host)
+        return percentile(samples, 95) if samples else None
+
+    def save(self):
+        """Add this run's samples to the history on disk (other processes may have added theirs)"""
+        with self._lock:
+            if not self.new:
+                return
+            samples = load_json(self.path, {})
+            for host, new in self.new.items():
+                samples[host] = (samples.get(host, []) + new)[-SAMPLES_KEPT:]
+            save_json(self.path, samples)
+            self.samples = samples
+            self.new = {}
@@ -4,10 +4,13 @@ from dotenv import load_dotenv
 from datetime import datetime
 from scrapers import HackathonScraper
 from india_scrapers import IndiaHackathonScraper
+from orchestrator import iter_hackathons
 from manual_sources import get_manual_hackathons
-from filters import apply_all_filters, get_statistics
+from filters import iter_filtered, duplicate_key
+from stats import HackathonStats
 from simple_notifier import SimpleNotifier
 import time
+from itertools import chain
 
 # Load environment variables
 load_dotenv()
@@ -117,7 +120,7 @@ class NotionUpdater:
         
         for hackathon in hackathons:
             # Create unique identifier
-            key = f"{hackathon.get('name', '')}||{hackathon.get('registration_link', '')}"
+            key = duplicate_key(hackathon)
             
             # Check if exists
             if key in existing:
@@ -154,36 +157,39 @@ def main(send_notification=True):
     print("   HACKATHON SCRAPER & NOTION UPDATER")
     print("🎯"*30 + "\n")
     
-    # Step 1: Scrape international hackathons
-    print("STEP 1: Scraping international hackathon platforms...\n")
-    scraper = HackathonScraper()
-    hackathons = scraper.get_all_hackathons()
-    
-    # Step 2: Scrape India-specific platforms
-    print("\nSTEP 2: Scraping India-specific platforms...\n")
-    india_scraper = IndiaHackathonScraper()
-    india_hackathons = india_scraper.get_all_india_hackathons()
-    hackathons.extend(india_hackathons)
-    
-    # Step 3: Add manual hackathons (only LIVE ones)
-    print("\nSTEP 3: Adding manually curated LIVE hackathons...\n")
+    # Step 1-3: Stream every source into one pipeline
+    print("STEP 1: Scraping international hackathon platforms...")
+    print("STEP 2: Scraping India-specific platforms...")
+    print("STEP 3: Adding manually curated LIVE hackathons...\n")
     manual_hacks = get_manual_hackathons()
-    print(f"➕ Added {len(manual_hacks)} manually curated LIVE hackathons")
-    hackathons.extend(manual_hacks)
+    print(f"➕ Added {len(manual_hacks)} manually curated LIVE hackathons\n")
+    
+    found = HackathonStats()       # Everything scraped, before filtering
+    live_stats = HackathonStats()  # The LIVE hackathons below
+    hackathons = []                # LIVE hackathons that reached Notion
+    
+    def scraped():
+        # Manual entries are ready right away, scraped ones follow source by source
+        for hack in chain(manual_hacks, iter_hackathons([HackathonScraper, IndiaHackathonScraper])):
+            found.add(hack)
+            yield hack
+    
+    def live():
+        for hack in iter_filtered(scraped(), live_only=True, fresher_only=False, remove_dupes=True):
+            hackathons.append(hack)
+            live_stats.add(hack)
+            yield hack
+    
+    # Step 4 + 5: Filter and write to Notion while slower sources are still scraping
+    print("STEP 4: Filtering for LIVE hackathons only...")
+    print("STEP 5: Adding LIVE hackathons to Notion as they arrive...\n")
+    updater = NotionUpdater()
+    added, skipped, failed, new_hackathons = updater.update_database(live())
     
     # Show statistics before filtering
-    print(f"\n📊 Total hackathons found (before filtering): {len(hackathons)}")
-    
-    # Step 4: Apply filters - ONLY LIVE HACKATHONS
-    print("\nSTEP 4: Filtering for LIVE hackathons only...\n")
-    
-    # Get stats before filtering
-    stats_before = get_statistics(hackathons)
+    stats_before = found.snapshot()
+    print(f"\n📊 Total hackathons found (before filtering): {stats_before['total']}")
     print(f"   Before filtering: {stats_before['live']} Live, {stats_before['upcoming']} Upcoming")
-    
-    # Apply strict LIVE filter
-    hackathons = apply_all_filters(hackathons, live_only=True, fresher_only=False, remove_dupes=True)
-    
     print(f"📊 Total LIVE hackathons after filtering: {len(hackathons)}\n")
     
     if not hackathons:
@@ -191,18 +197,9 @@ def main(send_notification=True):
         print("💡 TIP: Check if any hackathons are currently accepting registrations!\n")
         return
     
-    # Step 5: Update Notion
-    print("\nSTEP 5: Adding LIVE hackathons to Notion...\n")
-    updater = NotionUpdater()
-    added, skipped, failed, new_hackathons = updater.update_database(hackathons)
-    
     # Step 6: Platform breakdown
     print("\n📊 PLATFORM BREAKDOWN (LIVE HACKATHONS):\n")
-    platform_counts = {}
-    for hack in hackathons:
-        platform = hack.get('platform', 'Unknown')
-        platform_counts[platform] = platform_counts.get(platform, 0) + 1
-    
+    platform_counts = live_stats.snapshot()['by_platform']
     for platform, count in sorted(platform_counts.items(), key=lambda x: x[1], reverse=True):
         print(f"   {platform}: {count} LIVE hackathons")
     
@@ -1,9 +1,11 @@
+from records import as_records
+
 def get_manual_hackathons():
     """
     Manually curated LIVE hackathons - Updated February 2025
     Only includes hackathons that are currently accepting registrations
     """
-    return [
+    return as_records([
         {
             'name': 'Google Solution Challenge 2025',
             'platform': 'Other',
@@ -104,14 +106,14 @@ def get_manual_hackathons():
             'fresher_friendly': True,
             'status': 'Live',  # Registration for local events open
         }
-    ]
+    ])
 
 def get_upcoming_hackathons():
     """
     Upcoming hackathons (NOT YET LIVE - Don't include these in LIVE filter)
     Keep for reference only
     """
-    return [
+    return as_records([
         {
             'name': 'HackMIT 2025',
             'platform': 'MLH',
@@ -140,6 +142,6 @@ def get_upcoming_hackathons():
             'fresher_friendly': True,
             'status': 'Upcoming',  # Opens in Fall 2025
         }
-    ]
+    ])
 
 # For the main scraper, only use get_manual_hackathons() which returns LIVE hackathons
\ No newline at end of file
@@ -0,0 +1,224 @@
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from fetcher import HttpFetcher
+from circuit_breaker import CircuitBreaker
+from enrichment import Enricher
+from extractors import EXTRACT_MODE, ExtractorPool
+from instrumentation import RunReport
+from records import as_records
+
+# Upper bound on sources scraped at the same time
+MAX_WORKERS = 8
+
+# Wall-clock budget for a full scrape (seconds)
+RUN_DEADLINE = int(os.getenv('SCRAPE_DEADLINE', 90))
+
+
+def iter_sources(sources, max_workers=MAX_WORKERS, deadline=None):
+    """
+    Run (name, callable) sources concurrently on a bounded thread pool.
+    Yields (name, records) pairs as soon as each source finishes.
+    With a deadline (time.monotonic() value), stops waiting for sources
+    still running by then; sources that finished are always yielded.
+    """
+    if not sources:
+        return
+
+    pool = ThreadPoolExecutor(max_workers=min(max_workers, len(sources)))
+    try:
+        futures = {pool.submit(func): name for name, func in sources}
+        pending = set(futures)
+
+        # The deadline bounds the sources, not the consumer: however long the
+        # consumer takes between yields, a source that has finished is handed over
+        while pending:
+            done = {future for future in pending if future.done()}
+            if not done:
+                timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    late = [futures[future] for future in pending]
+                    print(f"⏰ Run deadline reached, not waiting for: {', '.join(late)}\n")
+                    break
+            pending -= done
+
+            # Several may have finished while the consumer was busy: hand them over in source order
+            for future in [future for future in futures if future in done]:
+                name = futures[future]
+                try:
+                    records = future.result() or []
+                except Exception as e:
+                    print(f"❌ {name} crashed: {e}\n")
+                    records = []
+                yield name, records
+    finally:
+        # Don't block on stragglers, their requests are bounded by the deadline anyway
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def run_sources(sources, max_workers=MAX_WORKERS, deadline=None):
+    """
+    Run sources like iter_sources, but wait for all of them.
+    Returns (name, records) pairs in the order the sources were given,
+    no matter which source finished first.
+    """
+    results = dict(iter_sources(sources, max_workers, deadline))
+    return [(name, results.get(name, [])) for name, func in sources]
+
+
+def has_budget(source, deadline):
+    """
+    Whether there is still time to run a source.
+    Priority 1 sources run as long as any time is left, the rest need
+    their full timeout to fit in what remains of the run.
+    """
+    remaining = deadline - time.monotonic()
+    if source['priority'] == 1:
+        return remaining > 0
+    return remaining >= source.get('timeout', 0)
+
+
+def critical_urls(scraper_classes):
+    """Listing and API URLs of priority 1 sources, whose slow requests get hedged"""
+    urls = set()
+    for scraper_class in scraper_classes:
+        for source in scraper_class.SOURCES:
+            if source['priority'] == 1:
+                urls.update(url for url in (source.get('url'), (source.get('api') or {}).get('url')) if url)
+    return urls
+
+
+def build_sources(scraper_classes, fetcher, deadline=None, breaker=None, report=None, enricher=None,
+                  extractor=None):
+    """
+    Turn the scraper classes' source registries into runnable sources,
+    highest priority first.
+    Every source gets its own scraper instance so results never interleave,
+    but they all share one fetcher so connections are reused and
+    per-host delays still apply. Sources whose circuit breaker is open
+    serve their last-known-good records without being fetched.
+    Every source runs inside a timing span of the run report, and its
+    records are filled in from their detail pages when an enricher is given.
+    Sources return records.Hackathon records.
+    With an extractor pool, HTML listings are fetched here and parsed in
+    the pool's processes.
+    """
+    report = report or RunReport()
+    entries = []
+    for scraper_class in scraper_classes:
+        for source in scraper_class.SOURCES:
+            entries.append((scraper_class, source))
+
+    # Stable sort: registry order is kept within a priority
+    entries.sort(key=lambda entry: entry[1]['priority'])
+
+    sources = []
+    for scraper_class, source in entries:
+        def run(scraper_class=scraper_class, source=source):
+            with report.span(source['name']) as span:
+                if deadline is not None and not has_budget(source, deadline):
+                    print(f"⏭️  {source['name']}: Skipped, run budget used up (deferred to next run)\n")
+                    span['outcome'] = 'skipped'
+                    return []
+
+                if breaker is not None and not breaker.allow(source['name']):
+                    records = breaker.last_good(source['name'])
+                    print(f"🔌 {source['name']}: Circuit open, serving {len(records)} last-known-good hackathons\n")
+                    span['outcome'] = 'circuit_open'
+                    return as_records(records)
+
+                scraper = scraper_class(fetcher=fetcher)
+                if extractor is not None and extractor.handles(source):
+                    extractor.scrape(scraper, source)
+                else:
+                    getattr(scraper, source['method'])()
+                span['items'] = len(scraper.hackathons)
+                records = scraper.hackathons
+                # Sources without a listing only serve hardcoded records: no detail pages to fetch
+                if enricher is not None and source.get('url'):
+                    records = enricher.enrich(records, skip=scraper.static_links)
+
+                failed = bool(source.get('url')) and fetcher.failed(source['url'])
+                if failed:
+                    span['outcome'] = 'failed'
+
+                # A source cut off by the run deadline says nothing about its health
+                out_of_time = deadline is not None and time.monotonic() >= deadline
+
+                if breaker is not None and not out_of_time:
+                    if failed:
+                        breaker.record_failure(source['name'])
+                        if breaker.is_open(source['name']):
+                            return as_records(breaker.last_good(source['name']))
+                    else:
+                        breaker.record_success(source['name'], records)
+
+                return as_records(records)
+
+        sources.append((source['name'], run))
+
+    return sources
+
+
+def scrape_all(scraper_classes, max_workers=MAX_WORKERS, budget=RUN_DEADLINE):
+    """Scrape every source of the given scraper classes in parallel, within budget seconds"""
+    print("\n" + "="*60)
+    print(f"🚀 SCRAPING ALL SOURCES IN PARALLEL ({max_workers} workers, {budget}s budget)")
+    print("="*60 + "\n")
+
+    start = time.monotonic()
+    deadline = start + budget
+    fetcher = HttpFetcher(deadline=deadline, hedge_urls=critical_urls(scraper_classes))
+    extractor = ExtractorPool() if EXTRACT_MODE == 'process' else None
+    enricher = Enricher(fetcher, deadline=deadline, extractor=extractor)
+    report = RunReport()
+    try:
+        sources = build_sources(scraper_classes, fetcher, deadline, CircuitBreaker(), report, enricher, extractor)
+        results = run_sources(sources, max_workers, deadline)
+    finally:
+        enricher.close()
+        if extractor is not None:
+            extractor.close()
+        fetcher.close()
+
+    hackathons = []
+    for name, records in results:
+        hackathons.extend(records)
+
+    print("="*60)
+    print(fetcher.summary())
+    report.save([name for name, func in sources])
+    print(f"✅ SCRAPING COMPLETE: Found {len(hackathons)} total hackathons "
+          f"in {time.monotonic() - start:.1f}s")
+    print("="*60 + "\n")
+
+    return hackathons
+
+
+def iter_scraped(scraper_classes, max_workers=MAX_WORKERS, budget=RUN_DEADLINE):
+    """Yield (source name, records) for each source as soon as it finishes"""
+    deadline = time.monotonic() + budget
+    fetcher = HttpFetcher(deadline=deadline, hedge_urls=critical_urls(scraper_classes))
+    extractor = ExtractorPool() if EXTRACT_MODE == 'process' else None
+    enricher = Enricher(fetcher, deadline=deadline, extractor=extractor)
+    report = RunReport()
+    sources = build_sources(scraper_classes, fetcher, deadline, CircuitBreaker(), report, enricher, extractor)
+    try:
+        yield from iter_sources(sources, max_workers, deadline)
+    finally:
+        print(fetcher.summary())
+        report.save([name for name, func in sources])
+        enricher.close()
+        if extractor is not None:
+            extractor.close()
+        fetcher.close()
+
+
+def iter_hackathons(scraper_classes, max_workers=MAX_WORKERS, budget=RUN_DEADLINE):
+    """
+    Stream hackathons source by source as they arrive.
+    Lets filtering and the Notion writer start before the slowest source is done.
+    """
+    for name, records in iter_scraped(scraper_classes, max_workers, budget):
+        yield from records
@@ -0,0 +1,149 @@
+import json
+import os
+import time
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from instrumentation import record_parse
+
+try:
+    import lxml  # noqa: F401
+    FAST_PARSER = 'lxml'
+except ImportError:
+    FAST_PARSER = 'html.parser'
+
+# 'fast': lxml, only building the card elements a scraper asks for
+# 'full': html.parser over the whole document (the original behaviour)
+PARSE_MODE = os.getenv('HACKATHON_PARSE_MODE', 'fast')
+
+
+def _attr_matches(attr, expected, value):
+    """Match one attribute the same way BeautifulSoup's find_all does"""
+    if value is None:
+        return False
+    if callable(expected):
+        return bool(expected(value))
+    if attr == 'class' and ' ' not in expected:
+        # class is multi-valued: match any single class name
+        classes = value.split() if isinstance(value, str) else value
+        return expected in classes
+    if isinstance(value, list):
+        value = ' '.join(value)
+    return expected == value
+
+
+class CardStrainer(SoupStrainer):
+    """
+    Only build the parts of a page that match one of a scraper's card selectors.
+
+    Selectors are (tag name, {attribute: value or predicate}) pairs, e.g.
+    ('div', {'class': 'hackathon-tile'}) or ('a', {'href': lambda h: '/contests/' in h}).
+    A matching element is kept with everything inside it, the rest of the
+    page is never turned into Tag objects. Several selectors cost one pass.
+    """
+
+    def __init__(self, selectors):
+        super().__init__()
+        self.selectors = selectors
+
+    def matches(self, name, attrs):
+        for tag_name, expected_attrs in self.selectors:
+            if tag_name != name:
+                continue
+            if all(_attr_matches(attr, expected, attrs.get(attr)) for attr, expected in expected_attrs.items()):
+                return True
+        return False
+
+    # BeautifulSoup >= 4.13
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        return self.matches(name, attrs or {})
+
+    def allow_string_creation(self, string):
+        return False
+
+    # BeautifulSoup < 4.13
+    def search_tag(self, markup_name=None, markup_attrs={}):
+        if hasattr(markup_name, 'attrs'):
+            markup_name, markup_attrs = markup_name.name, markup_name.attrs
+        return self.matches(markup_name, dict(markup_attrs or {}))
+
+
+def make_soup(content, selectors=None):
+    """
+    Parse a listing page.
+    In fast mode, only elements matching the given card selectors are built.
+    Call soup.decompose() once the records are extracted.
+    """
+    start = time.monotonic()
+    if PARSE_MODE == 'full' or not selectors:
+        soup = BeautifulSoup(content, 'html.parser' if PARSE_MODE == 'full' else FAST_PARSER)
+    else:
+        soup = BeautifulSoup(content, FAST_PARSER, parse_only=CardStrainer(selectors))
+    record_parse(time.monotonic() - start)
+    return soup
+
+
+def find_cards(soup, selectors):
+    """
+    Cards matched by the highest-priority selector that matches anything.
+
+    Selectors are the same (tag name, attributes) pairs make_soup takes, in
+    priority order: ('div', {'class': 'hackathon-tile'}) first and
+    ('article', {}) as the fallback gives the tiles if there are any and the
+    articles otherwise. Every selector is checked in one walk of the tree
+    instead of one find_all per fallback.
+    """
+    by_name = {}
+    for index, (tag_name, expected_attrs) in enumerate(selectors):
+        by_name.setdefault(tag_name, []).append((index, expected_attrs))
+
+    matches = [[] for _ in selectors]
+    best = len(selectors)
+
+    for element in soup.descendants:
+        if not isinstance(element, Tag):
+            continue
+        for index, expected_attrs in by_name.get(element.name, ()):
+            if index > best:
+                break  # A higher-priority selector already matched, this one can't win
+            if all(_attr_matches(attr, expected, element.attrs.get(attr))
+                   for attr, expected in expected_attrs.items()):
+                matches[index].append(element)
+                best = min(best, index)
+
+    return matches[best] if best < len(selectors) else []
+
+
+def iter_json_items(chunks, key):
+    """
+    Incrementally yield the items of the JSON array stored under key,
+    e.g. the contests in {"status": "OK", "result": [...]}.
+    chunks is an iterable of text (response.iter_content(decode_unicode=True)),
+    so the caller can stop early without downloading or decoding the rest.
+    """
+    decoder = json.JSONDecoder()
+    marker = f'"{key}"'
+    buffer = ''
+    in_array = False
+
+    for chunk in chunks:
+        buffer += chunk
+
+        if not in_array:
+            start = buffer.find(marker)
+            bracket = buffer.find('[', start + len(marker)) if start >= 0 else -1
+            if bracket < 0:
+                continue
+            buffer = buffer[bracket + 1:]
+            in_array = True
+
+        while True:
+            buffer = buffer.lstrip(' \t\r\n,')
+            if not buffer:
+                break
+            if buffer[0] == ']':
+                return
+            try:
+                item, end = decoder.raw_decode(buffer)
+            except ValueError:
+                break  # Item not complete yet, wait for the next chunk
+            yield item
+            buffer = buffer[end:]
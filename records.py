@@ -0,0 +1,197 @@
+import json
+import sys
+from collections.abc import MutableMapping
+from operator import attrgetter
+
+# Fields every stage knows about; anything else a source adds goes to extra
+FIELDS = (
+    'name', 'platform', 'registration_link', 'mode', 'location', 'prize_pool', 'event_date',
+    'deadline', 'organizer', 'fresher_friendly', 'status', 'eligibility', 'team_size',
+)
+_FIELD_SET = frozenset(FIELDS)
+
+# A handful of distinct values repeated on every record: one shared string each
+INTERNED = frozenset(('platform', 'status', 'mode'))
+
+# Fields the precomputed keys are derived from
+_KEYED = frozenset(('status', 'mode'))
+
+# Values that mean a source had nothing for a field
+MISSING = (None, '', 'N/A')
+
+
+class _Unset:
+    """Marks a field the record doesn't have (a key missing from the dict)"""
+
+    def __repr__(self):
+        return '<unset>'
+
+
+UNSET = _Unset()
+
+
+class Hackathon(MutableMapping):
+    """
+    One hackathon, as passed between scrapers, filters, Notion, the apps
+    and the notifiers.
+
+    A slotted record instead of a dict: platform / status / mode are
+    interned, the lowercase status and mode are computed once when they
+    change rather than by every filter, and the JSON form is cached until
+    the record changes. It still reads and writes like the dict it
+    replaces (get, [], in, keys, items, dict()), so existing callers keep
+    working.
+    """
+
+    __slots__ = FIELDS + ('extra', 'status_key', 'mode_key', '_json')
+
+    def __init__(self, **fields):
+        for field in FIELDS:
+            setattr(self, field, UNSET)
+        self.extra = None
+        for key, value in fields.items():
+            self._set(key, value)
+        self._derive()
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+    def _set(self, key, value):
+        if key in INTERNED and type(value) is str:
+            value = sys.intern(value)
+        if key in _FIELD_SET:
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def _derive(self, keyed=_KEYED):
+        if 'status' in keyed:
+            self.status_key = sys.intern((self.get('status') or '').lower())
+        if 'mode' in keyed:
+            self.mode_key = sys.intern((self.get('mode') or '').lower())
+        self._json = None
+
+    @property
+    def dedupe_key(self):
+        """Unique key of the record: name and link"""
+        name, link = self.name, self.registration_link
+        return f"{'' if name is UNSET else name}||{'' if link is UNSET else link}"
+
+    def __getitem__(self, key):
+        value = getattr(self, key) if key in _FIELD_SET else (self.extra or {}).get(key, UNSET)
+        if value is UNSET:
+            raise KeyError(key)
+        return value
+
+    def get(self, key, default=None):
+        if key in _FIELD_SET:
+            value = getattr(self, key)
+            return default if value is UNSET else value
+        return self.extra.get(key, default) if self.extra else default
+
+    def __contains__(self, key):
+        if key in _FIELD_SET:
+            return getattr(self, key) is not UNSET
+        return bool(self.extra) and key in self.extra
+
+    def __setitem__(self, key, value):
+        self._set(key, value)
+        if key in _KEYED:
+            self._derive()
+        else:
+            self._json = None
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        if key in _FIELD_SET:
+            setattr(self, key, UNSET)
+        else:
+            del self.extra[key]
+        self._derive()
+
+    def __iter__(self):
+        for field in FIELDS:
+            if getattr(self, field) is not UNSET:
+                yield field
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self):
+        return sum(1 for field in FIELDS if getattr(self, field) is not UNSET) + len(self.extra or ())
+
+    def __reduce__(self):
+        # Pickled as its fields, so records can cross process boundaries
+        return Hackathon.from_dict, (self.to_dict(),)
+
+    def __repr__(self):
+        return f"Hackathon({self.to_dict()!r})"
+
+    def replace(self, **changes):
+        """A copy of the record with some fields changed; the record itself is left alone"""
+        # Slot to slot rather than through a dict: filters copy thousands of records
+        new = object.__new__(Hackathon)
+        (new.name, new.platform, new.registration_link, new.mode, new.location, new.prize_pool,
+         new.event_date, new.deadline, new.organizer, new.fresher_friendly, new.status,
+         new.eligibility, new.team_size, new.extra, new.status_key, new.mode_key) = _state(self)
+        new._json = None
+        if new.extra:
+            new.extra = dict(new.extra)
+        for key, value in changes.items():
+            new._set(key, value)
+        # Only the keys of fields that changed are recomputed
+        new._derive(changes)
+        return new
+
+    def to_dict(self):
+        return {key: self[key] for key in self}
+
+    def to_json(self):
+        """The record as JSON text, encoded once until the record changes"""
+        if self._json is None:
+            self._json = json.dumps(self.to_dict(), ensure_ascii=False)
+        return self._json
+
+
+# Everything a copy carries over, in slot order (the cached JSON is rebuilt on demand)
+_STATE = FIELDS + ('extra', 'status_key', 'mode_key')
+_state = attrgetter(*_STATE)
+
+
+def as_record(hack):
+    """hack as a Hackathon (itself if it already is one)"""
+    return hack if isinstance(hack, Hackathon) else Hackathon.from_dict(hack)
+
+
+def as_records(hackathons):
+    return [as_record(hack) for hack in hackathons]
+
+
+def records_json(hackathons):
+    """JSON array of hackathons, reusing each record's cached JSON"""
+    return '[' + ', '.join(as_record(hack).to_json() for hack in hackathons) + ']'
+
+
+def dumps(payload):
+    """
+    JSON text of a response payload dict. Lists of hackathons in it are
+    written from the records' cached JSON instead of being encoded again.
+    """
+    parts = []
+    for key, value in payload.items():
+        if isinstance(value, list) and value and isinstance(value[0], Hackathon):
+            encoded = records_json(value)
+        else:
+            encoded = json.dumps(value, ensure_ascii=False, default=_plain)
+        parts.append(f"{json.dumps(key)}: {encoded}")
+    return '{' + ', '.join(parts) + '}'
+
+
+def _plain(value):
+    """json.dumps fallback for hackathons nested deeper in a payload"""
+    if isinstance(value, Hackathon):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
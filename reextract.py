@@ -0,0 +1,169 @@
+"""
+Re-extract archived pages with the current scraper code.
+
+Every page the scrapers fetch is kept in .cache/archive/ (see archive.py).
+This replays archived runs through the scraper methods as they are now,
+one (run, source) pair per task on a process pool, without touching the
+network: check a selector fix against the pages that broke it, or
+backfill records for past runs.
+
+    python reextract.py                          # latest run, every source
+    python reextract.py --all --source Devpost   # every archived run of one source
+    python reextract.py --all --output backfill.json
+"""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import github_search
+import json_sources
+import storage
+from archive import PageArchive
+from enrichment import Enricher
+from fetcher import NoCache, OfflineFetcher
+from india_scrapers import IndiaHackathonScraper
+from scrapers import HackathonScraper
+
+SCRAPER_CLASSES = {cls.__name__: cls for cls in (HackathonScraper, IndiaHackathonScraper)}
+
+
+class ArchiveFetcher(OfflineFetcher):
+    """OfflineFetcher answering every request with what the same URL returned in one archived run"""
+
+    def __init__(self, archive, pages):
+        super().__init__()
+        self.archive = archive
+        self.pages = pages
+
+    def stored(self, url):
+        entry = self.pages.get(url)
+        content = self.archive.read(entry['hash']) if entry else None
+        if content is None:
+            return None
+        return 200, content, entry.get('content_type')
+
+
+def source_urls(source):
+    """Listing and JSON API URLs of a source (without query strings)"""
+    return [url for url in (source.get('url'), (source.get('api') or {}).get('url')) if url]
+
+
+def plan(runs, names=None):
+    """(run id, scraper class name, source name) for every source with pages archived in a run"""
+    tasks = []
+    for run_id, pages in runs.items():
+        fetched = {url.split('?')[0] for url in pages}
+        for class_name, scraper_class in SCRAPER_CLASSES.items():
+            for source in scraper_class.SOURCES:
+                if names and source['name'] not in names:
+                    continue
+                if any(url in fetched for url in source_urls(source)):
+                    tasks.append((run_id, class_name, source['name']))
+    return tasks
+
+
+def _init_worker():
+    # Replays must not read or overwrite the live scrapers' state (GitHub
+    # cache, Codeforces state) or reuse each other's
+    storage.CACHE_DIR = tempfile.mkdtemp(prefix='hackathon-replay-')
+    github_search.CACHE_TTL = 0
+
+
+def replay(archive_root, run_id, class_name, source_name, pages):
+    """
+    Run one source's scraper method against a run's archived pages, then
+    fill in details from the detail pages archived in the same run.
+    Returns (run id, source name, records, error).
+    """
+    scraper_class = SCRAPER_CLASSES[class_name]
+    source = scraper_class.source(source_name)
+    fetcher = ArchiveFetcher(PageArchive(archive_root), pages)
+
+    # Replay the JSON API when the run got that far, HTML otherwise
+    api = source.get('api')
+    api_fetched = api and any(url.split('?')[0] == api['url'] for url in pages)
+    json_sources.SOURCE_MODE = 'json' if api_fetched else 'html'
+    if api_fetched:
+        for name in api.get('auth_env', ()):
+            # Credentials were needed to fetch the pages, not to replay them
+            os.environ.setdefault(name, 'archive')
+
+    enricher = Enricher(fetcher, cache=NoCache())
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            scraper = scraper_class(fetcher=fetcher)
+            getattr(scraper, source['method'])()
+            records = scraper.hackathons
+            if source.get('url'):
+                records = enricher.enrich(records, skip=scraper.static_links)
+        return run_id, source_name, records, None
+    except Exception as e:
+        return run_id, source_name, [], str(e)
+    finally:
+        enricher.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--run', action='append', help='archived run id to replay (repeatable, default latest)')
+    parser.add_argument('--all', action='store_true', help='replay every archived run')
+    parser.add_argument('--source', action='append', help='only replay this source (repeatable)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='processes (default %(default)s)')
+    parser.add_argument('--output', help='write {run: {source: records}} to this JSON file')
+    parser.add_argument('--archive', help='archive directory (default .cache/archive)')
+    args = parser.parse_args()
+
+    archive = PageArchive(args.archive)
+    runs = archive.runs()
+    if not runs:
+        print(f"📭 Nothing archived in {archive.root}")
+        return
+
+    if args.all:
+        selected = runs
+    elif args.run:
+        selected = {run_id: runs[run_id] for run_id in args.run if run_id in runs}
+        for run_id in set(args.run) - set(selected):
+            print(f"⚠️  No archived run {run_id}")
+    else:
+        latest = list(runs)[-1]
+        selected = {latest: runs[latest]}
+
+    tasks = plan(selected, args.source)
+    print(f"\n🔁 Re-extracting {len(tasks)} source snapshots from {len(selected)} run(s) "
+          f"on {args.workers} processes\n")
+
+    start = time.monotonic()
+    results = {}
+    errors = 0
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker) as pool:
+        futures = [pool.submit(replay, archive.root, run_id, class_name, source_name, selected[run_id])
+                   for run_id, class_name, source_name in tasks]
+        for future in as_completed(futures):
+            run_id, source_name, records, error = future.result()
+            results.setdefault(run_id, {})[source_name] = records
+            if error:
+                errors += 1
+                print(f"❌ {run_id} {source_name}: {error}")
+    seconds = time.monotonic() - start
+
+    print(f"{'Run':<24}{'Source':<20}{'records':>8}")
+    for run_id in sorted(results):
+        for source_name, records in sorted(results[run_id].items()):
+            print(f"{run_id:<24}{source_name:<20}{len(records):>8}")
+
+    total = sum(len(records) for sources in results.values() for records in sources.values())
+    print(f"\n✅ {total} records from {len(tasks)} snapshots in {seconds:.1f}s"
+          f" ({total / seconds if seconds else 0:.0f} records/s), {errors} failed\n")
+
+    if args.output:
+        storage.save_json(args.output, results)
+        print(f"💾 Saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,33 +1,226 @@
-import requests
-from bs4 import BeautifulSoup
+import os
 import time
 import json
+from itertools import count
+from crawler import crawl
+from fetcher import HttpFetcher, page_url
+from github_search import GitHubSearch
+import json_sources
+from json_sources import (devpost_records, unstop_records, kaggle_records, leetcode_records,
+                          hackerearth_records, LEETCODE_QUERY)
+from instrumentation import record_cards
+from parsing import make_soup, find_cards, iter_json_items
+from storage import cache_path, load_json, save_json
+from orchestrator import scrape_all
+
+# Card elements each source looks for; in fast parse mode only these get built
+DEVPOST_CARDS = [
+    ('div', {'class': 'hackathon-tile'}),
+    ('article', {}),
+]
+
+UNSTOP_CARDS = [
+    ('div', {'class': 'single_profile'}),
+    ('div', {'data-type': 'opportunity'}),
+    ('div', {'class': 'opportunity-card'}),
+]
+
+MLH_EVENTS = [
+    ('div', {'class': 'event'}),
+    ('a', {'href': lambda href: 'mlh.io' in href}),
+]
+
+HACKEREARTH_CARDS = [
+    ('div', {'class': 'challenge-card'}),
+]
+
+CODECHEF_TABLES = [
+    ('table', {'class': 'dataTable'}),
+]
+
+KAGGLE_CARDS = [
+    ('div', {'class': 'competition-tile'}),
+    ('a', {'href': lambda href: '/competitions/' in href}),
+]
+
+LEETCODE_CARDS = [
+    ('div', {'class': 'contest-card'}),
+]
+
+GFG_CARDS = [
+    ('div', {'class': 'event_card'}),
+]
+
+# Contest fields remembered between runs
+CODEFORCES_FIELDS = ['id', 'name', 'phase', 'startTimeSeconds', 'durationSeconds']
+
 
 class HackathonScraper:
-    def __init__(self):
+    # Source registry: what each scraper fetches and how much it may spend.
+    # priority 1 = always worth running, 3 = first to go when the run is short on time
+    SOURCES = [
+        {'name': 'Devpost', 'method': 'scrape_devpost', 'priority': 1,
+         'url': 'https://devpost.com/hackathons', 'cards': DEVPOST_CARDS,
+         'timeout': 15, 'max_items': 10,
+         'api': {'url': 'https://devpost.com/api/hackathons', 'params': {'status[]': ['open', 'upcoming']},
+                 'page_param': 'page', 'max_pages': 20, 'extract': devpost_records, 'max_items': 500}},
+        {'name': 'MLH', 'method': 'scrape_mlh', 'priority': 2,
+         'url': 'https://mlh.io/seasons/2025/events', 'cards': MLH_EVENTS,
+         'timeout': 15, 'max_items': 10},
+        {'name': 'HackerEarth', 'method': 'scrape_hackerearth', 'priority': 2,
+         'url': 'https://www.hackerearth.com/challenges/', 'cards': HACKEREARTH_CARDS,
+         'timeout': 15, 'max_items': 5,
+         'api': {'url': 'https://www.hackerearth.com/chrome-extension/events/',
+                 'extract': hackerearth_records, 'max_items': 200}},
+        {'name': 'Unstop', 'method': 'scrape_unstop', 'priority': 1,
+         'url': 'https://unstop.com/hackathons', 'cards': UNSTOP_CARDS,
+         'timeout': 15, 'max_items': 10,
+         'api': {'url': 'https://unstop.com/api/public/opportunity/search-result',
+                 'params': {'opportunity': 'hackathons', 'oppstatus': 'open', 'per_page': 50},
+                 'page_param': 'page', 'max_pages': 10, 'extract': unstop_records, 'max_items': 500}},
+        {'name': 'CodeChef', 'method': 'scrape_codechef', 'priority': 3,
+         'url': 'https://www.codechef.com/contests', 'cards': CODECHEF_TABLES,
+         'timeout': 15, 'max_items': 5},  # per contest table
+        {'name': 'Kaggle', 'method': 'scrape_kaggle', 'priority': 3,
+         'url': 'https://www.kaggle.com/competitions', 'cards': KAGGLE_CARDS,
+         'timeout': 15, 'max_items': 10,
+         # The Kaggle API needs an API token, without one the HTML page is used
+         'api': {'url': 'https://www.kaggle.com/api/v1/competitions/list',
+                 'page_param': 'page', 'max_pages': 5, 'auth_env': ('KAGGLE_USERNAME', 'KAGGLE_KEY'),
+                 'extract': kaggle_records, 'max_items': 100}},
+        {'name': 'LeetCode', 'method': 'scrape_leetcode', 'priority': 3,
+         'url': 'https://leetcode.com/contest/', 'cards': LEETCODE_CARDS,
+         'timeout': 15, 'max_items': 5,
+         'api': {'url': 'https://leetcode.com/graphql', 'params': {'query': LEETCODE_QUERY},
+                 'extract': leetcode_records, 'max_items': 20}},
+        {'name': 'Codeforces', 'method': 'scrape_codeforces', 'priority': 2,
+         'url': 'https://codeforces.com/api/contest.list', 'params': {'gym': 'false'},
+         'timeout': 15, 'max_items': 50},
+        {'name': 'GitHub', 'method': 'scrape_github', 'priority': 3,
+         'url': 'https://api.github.com/search/repositories',
+         'params': {'q': 'hackathon 2025 OR hackathon 2026', 'sort': 'updated', 'order': 'desc'},
+         'timeout': 15, 'max_items': 100},
+        {'name': 'GeeksforGeeks', 'method': 'scrape_gfg', 'priority': 3,
+         'url': 'https://practice.geeksforgeeks.org/events', 'cards': GFG_CARDS,
+         'timeout': 15, 'max_items': 8},
+    ]
+    
+    def __init__(self, fetcher=None):
         self.hackathons = []
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36'
-        }
+        # Links of the hardcoded fallback records added (no detail page worth fetching)
+        self.static_links = set()
+        # Shared pooled session (keep-alive, retries, compression)
+        self.fetcher = fetcher or HttpFetcher()
+    
+    @classmethod
+    def source(cls, name):
+        """Registry entry of a source"""
+        return next(source for source in cls.SOURCES if source['name'] == name)
+    
+    def _add_static(self, records):
+        """Add hardcoded fallback records"""
+        self.hackathons.extend(records)
+        self.static_links.update(hack['registration_link'] for hack in records)
+    
+    def _fetch_listing(self, platform, url, **kwargs):
+        """
+        Conditionally GET a listing page.
+        Returns None when the page is unchanged (a 304, or a body with the
+        same hash as last time) and the records extracted last time have
+        been reused instead of parsing it again.
+        """
+        response = self.fetcher.get(url, conditional=True, **kwargs)
+        
+        records = self.fetcher.cache.unchanged_records(url, response)
+        if records is not None:
+            self.hackathons.extend(records)
+            print(f"♻️  {platform}: Page unchanged, reused {len(records)} hackathons\n")
+            return None
+        
+        return response
+    
+    def _remember(self, platform, url, response):
+        """Cache this source's records against the page they came from"""
+        if response.status_code == 200:
+            records = [h for h in self.hackathons if h['platform'] == platform]
+            self.fetcher.cache.store(url, response, records)
+    
+    def _scrape_api(self, source):
+        """
+        JSON-first: fill in a source's records from its JSON listing,
+        following numbered pages within the source's page/item budget.
+        Returns False when there is no usable API response, so the caller
+        falls back to scraping the HTML page.
+        """
+        api = source.get('api')
+        if not api or json_sources.SOURCE_MODE != 'json':
+            return False
+        
+        platform = source['name']
+        kwargs = {'timeout': source['timeout']}
+        if api.get('auth_env'):
+            auth = tuple(os.getenv(name) for name in api['auth_env'])
+            if not all(auth):
+                return False
+            kwargs['auth'] = auth
+        
+        def fetch_page(url):
+            response = self.fetcher.get(url, conditional=True, **kwargs)
+            records = self.fetcher.cache.unchanged_records(url, response)
+            if records is not None:
+                return records  # Page unchanged since last run
+            if response.status_code != 200:
+                print(f"   ⚠️  {platform} API: Status code {response.status_code}")
+                return None
+            records = api['extract'](response.json())
+            record_cards(len(records))
+            self.fetcher.cache.store(url, response, records)
+            return records
+        
+        params = api.get('params') or {}
+        if api.get('page_param'):
+            page_urls = (page_url(api['url'], dict(params, **{api['page_param']: page})) for page in count(1))
+        else:
+            page_urls = [page_url(api['url'], params)]
+        
+        try:
+            records, pages = crawl(page_urls, fetch_page, api.get('max_pages', 1), api['max_items'],
+                                   seen=getattr(self.fetcher, 'seen_urls', None))
+        except Exception as e:
+            print(f"   ⚠️  {platform} API error: {e}, falling back to HTML")
+            return False
+        
+        if not records:
+            print(f"   ⚠️  {platform} API: No items, falling back to HTML")
+            return False
+        
+        for hackathon in records:
+            self.hackathons.append(hackathon)
+            print(f"   ✓ Found: {hackathon['name'][:50]}")
+        
+        print(f"✅ {platform}: Found {len(self.hackathons)} hackathons (JSON, {pages} pages)\n")
+        return True
     
     def scrape_devpost(self):
         """Scrape Devpost hackathons - using HTML instead of API"""
+        source = self.source('Devpost')
         print("🔍 Scraping Devpost...")
+        if self._scrape_api(source):
+            return
         try:
-            url = "https://devpost.com/hackathons"
-            response = requests.get(url, headers=self.headers, timeout=15)
+            url = source['url']
+            response = self._fetch_listing('Devpost', url, timeout=source['timeout'])
+            if response is None:
+                return
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = make_soup(response.content, source['cards'])
                 
-                # Find hackathon cards
-                cards = soup.find_all('div', class_='hackathon-tile')
+                # Hackathon tiles, or articles if there are none (one pass)
+                cards = find_cards(soup, source['cards'])
                 
-                if not cards:
-                    # Try alternative selector
-                    cards = soup.find_all('article')
-                
-                for card in cards[:10]:
+                record_cards(min(len(cards), source['max_items']))
+                for card in cards[:source['max_items']]:
                     try:
                         # Find title
                         title_elem = card.find('h2') or card.find('h3') or card.find('a', class_='title')
@@ -55,6 +248,8 @@ class HackathonScraper:
                     except:
                         continue
                 
+                soup.decompose()  # Free the tree as soon as records are out
+                self._remember('Devpost', url, response)
                 devpost_count = len([h for h in self.hackathons if h['platform'] == 'Devpost'])
                 print(f"✅ Devpost: Found {devpost_count} hackathons\n")
             else:
@@ -65,33 +260,22 @@ class HackathonScraper:
     
     def scrape_unstop(self):
         """Scrape Unstop hackathons - Alternative method with manual fallback"""
+        source = self.source('Unstop')
         print("🔍 Scraping Unstop...")
+        if self._scrape_api(source):
+            return
         try:
             # Try direct page scraping instead of API
-            url = "https://unstop.com/hackathons"
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=15)
+            url = source['url']
+            response = self._fetch_listing('Unstop', url, timeout=source['timeout'])
+            if response is None:
+                return
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Try to find hackathon cards in the HTML
-                cards = soup.find_all('div', class_='single_profile')
-                
-                if not cards:
-                    cards = soup.find_all('div', {'data-type': 'opportunity'})
+                soup = make_soup(response.content, source['cards'])
                 
-                if not cards:
-                    cards = soup.find_all('div', class_='opportunity-card')
+                # Try to find hackathon cards in the HTML, best selector first (one pass)
+                cards = find_cards(soup, source['cards'])
                 
                 if not cards:
                     # If no cards found, add known LIVE Unstop hackathons manually
@@ -148,14 +332,15 @@ class HackathonScraper:
                         }
                     ]
                     
+                    self._add_static(manual_unstop)
                     for hack in manual_unstop:
-                        self.hackathons.append(hack)
                         print(f"   ✓ Added: {hack['name'][:50]}")
                     
                     print(f"✅ Unstop: Added {len(manual_unstop)} LIVE hackathons\n")
                 else:
                     # Parse found cards
-                    for card in cards[:10]:
+                    record_cards(min(len(cards), source['max_items']))
+                    for card in cards[:source['max_items']]:
                         try:
                             name = card.find('h3').text.strip() if card.find('h3') else "Unstop Challenge"
                             link = card.find('a')['href'] if card.find('a') else ""
@@ -178,6 +363,9 @@ class HackathonScraper:
                     
                     unstop_count = len([h for h in self.hackathons if h['platform'] == 'Unstop'])
                     print(f"✅ Unstop: Found {unstop_count} hackathons\n")
+                
+                soup.decompose()  # Free the tree as soon as records are out
+                self._remember('Unstop', url, response)
             else:
                 print(f"⚠️  Unstop returned status: {response.status_code}")
                 print("   Adding LIVE Unstop hackathons manually...\n")
@@ -194,7 +382,7 @@ class HackathonScraper:
                         'status': 'Live'
                     }
                 ]
-                self.hackathons.extend(manual_unstop)
+                self._add_static(manual_unstop)
                 
         except Exception as e:
             print(f"❌ Unstop error: {e}")
@@ -212,25 +400,25 @@ class HackathonScraper:
                     'status': 'Live'
                 }
             ]
-            self.hackathons.extend(backup_hackathons)
+            self._add_static(backup_hackathons)
     
     def scrape_mlh(self):
         """Scrape MLH events"""
+        source = self.source('MLH')
         print("🔍 Scraping MLH...")
         try:
             # MLH Season page
-            url = "https://mlh.io/seasons/2025/events"
-            response = requests.get(url, headers=self.headers, timeout=15)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            url = source['url']
+            response = self._fetch_listing('MLH', url, timeout=source['timeout'])
+            if response is None:
+                return
+            soup = make_soup(response.content, source['cards'])
             
-            # Find all event containers
-            events = soup.find_all('div', class_='event')
+            # Event containers, or mlh.io links if there are none (one pass)
+            events = find_cards(soup, source['cards'])
             
-            if not events:
-                # Try finding by different selector
-                events = soup.find_all('a', href=lambda x: x and 'mlh.io' in str(x))
-            
-            for event in events[:10]:
+            record_cards(min(len(events), source['max_items']))
+            for event in events[:source['max_items']]:
                 try:
                     # Get event name
                     name_elem = event.find('h3') or event.find('h2')
@@ -264,6 +452,8 @@ class HackathonScraper:
                 except:
                     continue
             
+            soup.decompose()  # Free the tree as soon as records are out
+            self._remember('MLH', url, response)
             mlh_count = len([h for h in self.hackathons if h['platform'] == 'MLH'])
             print(f"✅ MLH: Found {mlh_count} hackathons\n")
             
@@ -272,16 +462,22 @@ class HackathonScraper:
     
     def scrape_hackerearth(self):
         """Scrape HackerEarth challenges"""
+        source = self.source('HackerEarth')
         print("🔍 Scraping HackerEarth...")
+        if self._scrape_api(source):
+            return
         try:
-            url = "https://www.hackerearth.com/challenges/"
-            response = requests.get(url, headers=self.headers, timeout=15)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            url = source['url']
+            response = self._fetch_listing('HackerEarth', url, timeout=source['timeout'])
+            if response is None:
+                return
+            soup = make_soup(response.content, source['cards'])
             
             # Find challenge cards
-            challenges = soup.find_all('div', class_='challenge-card')
+            challenges = find_cards(soup, source['cards'])
             
-            for challenge in challenges[:5]:
+            record_cards(min(len(challenges), source['max_items']))
+            for challenge in challenges[:source['max_items']]:
                 try:
                     title_elem = challenge.find('div', class_='challenge-name') or challenge.find('h5')
                     name = title_elem.text.strip() if title_elem else None
@@ -307,6 +503,8 @@ class HackathonScraper:
                 except:
                     continue
             
+            soup.decompose()  # Free the tree as soon as records are out
+            self._remember('HackerEarth', url, response)
             he_count = len([h for h in self.hackathons if h['platform'] == 'HackerEarth'])
             print(f"✅ HackerEarth: Found {he_count} hackathons\n")
             
@@ -315,19 +513,23 @@ class HackathonScraper:
     
     def scrape_codechef(self):
         """Scrape CodeChef hackathons and contests"""
+        source = self.source('CodeChef')
         print("🔍 Scraping CodeChef...")
         try:
-            url = "https://www.codechef.com/contests"
-            response = requests.get(url, headers=self.headers, timeout=15)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            url = source['url']
+            response = self._fetch_listing('CodeChef', url, timeout=source['timeout'])
+            if response is None:
+                return
+            soup = make_soup(response.content, source['cards'])
             
             # Find contest tables
-            contest_tables = soup.find_all('table', class_='dataTable')
+            contest_tables = find_cards(soup, source['cards'])
             
             for table in contest_tables[:2]:  # Future and Present contests
                 rows = table.find_all('tr')[1:]  # Skip header
                 
-                for row in rows[:5]:  # Limit to 5 per table
+                record_cards(min(len(rows), source['max_items']))
+                for row in rows[:source['max_items']]:  # Limit per table
                     try:
                         cols = row.find_all('td')
                         if len(cols) >= 4:
@@ -363,6 +565,8 @@ class HackathonScraper:
                     except:
                         continue
             
+            soup.decompose()  # Free the tree as soon as records are out
+            self._remember('CodeChef', url, response)
             cc_count = len([h for h in self.hackathons if h['platform'] == 'CodeChef'])
             print(f"✅ CodeChef: Found {cc_count} hackathons\n")
             
@@ -371,21 +575,23 @@ class HackathonScraper:
     
     def scrape_kaggle(self):
         """Scrape Kaggle competitions suitable for students"""
+        source = self.source('Kaggle')
         print("🔍 Scraping Kaggle...")
+        if self._scrape_api(source):
+            return
         try:
             # Kaggle competitions API endpoint
-            url = "https://www.kaggle.com/competitions"
-            response = requests.get(url, headers=self.headers, timeout=15)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find competition cards
-            competitions = soup.find_all('div', class_='competition-tile')
+            url = source['url']
+            response = self._fetch_listing('Kaggle', url, timeout=source['timeout'])
+            if response is None:
+                return
+            soup = make_soup(response.content, source['cards'])
             
-            if not competitions:
-                # Alternative selector
-                competitions = soup.find_all('a', href=lambda x: x and '/competitions/' in str(x))[:10]
+            # Competition cards, or competition links if there are none (one pass)
+            competitions = find_cards(soup, source['cards'])
             
-            for comp in competitions[:10]:
+            record_cards(min(len(competitions), source['max_items']))
+            for comp in competitions[:source['max_items']]:
                 try:
                     # Extract competition details
                     title_elem = comp.find('div', class_='competition-tile__title') or comp
@@ -419,6 +625,8 @@ class HackathonScraper:
                 except:
                     continue
             
+            soup.decompose()  # Free the tree as soon as records are out
+            self._remember('Kaggle', url, response)
             kaggle_count = len([h for h in self.hackathons if h['platform'] == 'Kaggle'])
             print(f"✅ Kaggle: Found {kaggle_count} competitions\n")
             
@@ -427,17 +635,23 @@ class HackathonScraper:
     
     def scrape_leetcode(self):
         """Scrape LeetCode contests and hackathons"""
+        source = self.source('LeetCode')
         print("🔍 Scraping LeetCode...")
+        if self._scrape_api(source):
+            return
         try:
             # LeetCode contest page
-            url = "https://leetcode.com/contest/"
-            response = requests.get(url, headers=self.headers, timeout=15)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            url = source['url']
+            response = self._fetch_listing('LeetCode', url, timeout=source['timeout'])
+            if response is None:
+                return
+            soup = make_soup(response.content, source['cards'])
             
             # Find upcoming contests
-            contest_cards = soup.find_all('div', class_='contest-card')
+            contest_cards = find_cards(soup, source['cards'])
             
-            for card in contest_cards[:5]:
+            record_cards(min(len(contest_cards), source['max_items']))
+            for card in contest_cards[:source['max_items']]:
                 try:
                     # Extract contest name
                     name_elem = card.find('div', class_='contest-title')
@@ -462,6 +676,8 @@ class HackathonScraper:
                 except:
                     continue
             
+            soup.decompose()  # Free the tree as soon as records are out
+            self._remember('LeetCode', url, response)
             lc_count = len([h for h in self.hackathons if h['platform'] == 'LeetCode'])
             print(f"✅ LeetCode: Found {lc_count} contests\n")
             
@@ -469,98 +685,152 @@ class HackathonScraper:
             print(f"❌ LeetCode error: {e}\n")
     
     def scrape_codeforces(self):
-        """Scrape Codeforces contests"""
+        """Scrape Codeforces contests incrementally from the contest.list API"""
+        source = self.source('Codeforces')
         print("🔍 Scraping Codeforces...")
+        state_path = cache_path('codeforces_state.json')
+        state = load_json(state_path, {'max_id': 0, 'contests': {}})
+        
         try:
-            # Codeforces API
-            url = "https://codeforces.com/api/contest.list"
-            response = requests.get(url, timeout=15)
+            # Codeforces API, gym contests filtered out server-side
+            url = source['url']
+            response = self.fetcher.get(url, params=source['params'], timeout=source['timeout'], stream=True)
             
             if response.status_code == 200:
-                data = response.json()
+                contests = self._read_open_contests(response)
+                new_count = len([c for c in contests if c['id'] > state['max_id']])
+                print(f"   📥 Read {len(contests)} open contests, {new_count} new since last run")
+                
+                state = {
+                    'max_id': max([state['max_id']] + [c['id'] for c in contests]),
+                    'contests': {str(c['id']): {field: c.get(field) for field in CODEFORCES_FIELDS} for c in contests},
+                }
+                save_json(state_path, state)
+            else:
+                print(f"⚠️  Codeforces: Status code {response.status_code}, using cached contests")
+                contests = self._carry_forward_contests(state)
                 
-                if data['status'] == 'OK':
-                    contests = data['result']
-                    
-                    # Filter contests
-                    for contest in contests[:10]:
-                        if contest['phase'] == 'BEFORE':  # Upcoming contests
-                            status = 'Upcoming'
-                        elif contest['phase'] == 'CODING':  # Live contests
-                            status = 'Live'
-                        else:
-                            continue
-                        
-                        hackathon = {
-                            'name': contest['name'],
-                            'platform': 'Codeforces',
-                            'registration_link': f"https://codeforces.com/contest/{contest['id']}",
-                            'mode': 'Online',
-                            'event_date': time.strftime('%Y-%m-%d %H:%M', time.gmtime(contest['startTimeSeconds'])),
-                            'fresher_friendly': True,
-                            'status': status,
-                            'organizer': 'Codeforces'
-                        }
-                        self.hackathons.append(hackathon)
-                        print(f"   ✓ Found: {contest['name'][:50]}")
-                    
-                    cf_count = len([h for h in self.hackathons if h['platform'] == 'Codeforces'])
-                    print(f"✅ Codeforces: Found {cf_count} contests\n")
-            
         except Exception as e:
-            print(f"❌ Codeforces error: {e}\n")
+            print(f"❌ Codeforces error: {e}")
+            print("   Using cached contests...")
+            contests = self._carry_forward_contests(state)
+        
+        # Filter contests
+        record_cards(min(len(contests), source['max_items']))
+        for contest in contests[:source['max_items']]:
+            try:
+                if contest['phase'] == 'BEFORE':  # Upcoming contests
+                    status = 'Upcoming'
+                elif contest['phase'] == 'CODING':  # Live contests
+                    status = 'Live'
+                else:
+                    continue
+                
+                hackathon = {
+                    'name': contest['name'],
+                    'platform': 'Codeforces',
+                    'registration_link': f"https://codeforces.com/contest/{contest['id']}",
+                    'mode': 'Online',
+                    'event_date': time.strftime('%Y-%m-%d %H:%M', time.gmtime(contest['startTimeSeconds'])),
+                    'fresher_friendly': True,
+                    'status': status,
+                    'organizer': 'Codeforces'
+                }
+                self.hackathons.append(hackathon)
+                print(f"   ✓ Found: {contest['name'][:50]}")
+            except:
+                continue
+        
+        cf_count = len([h for h in self.hackathons if h['platform'] == 'Codeforces'])
+        print(f"✅ Codeforces: Found {cf_count} contests\n")
+    
+    def _read_open_contests(self, response):
+        """
+        Stream contest.list and stop at the first finished contest.
+        The list is newest first, so upcoming and running contests all come
+        before the thousands of finished ones we never need to download.
+        """
+        contests = []
+        response.encoding = response.encoding or 'utf-8'
+        try:
+            for contest in iter_json_items(response.iter_content(16384, decode_unicode=True), 'result'):
+                if contest.get('phase') == 'FINISHED':
+                    break
+                contests.append(contest)
+        finally:
+            response.close()
+        return contests
+    
+    def _carry_forward_contests(self, state):
+        """
+        Contests remembered from the last run, with their phase moved on by
+        the clock (an upcoming contest whose start has passed is now running).
+        """
+        now = time.time()
+        contests = []
+        
+        for contest in state['contests'].values():
+            start = contest.get('startTimeSeconds')
+            if start is None:
+                continue
+            if now < start:
+                phase = 'BEFORE'
+            elif now < start + (contest.get('durationSeconds') or 0):
+                phase = 'CODING'
+            else:
+                continue
+            contests.append(dict(contest, phase=phase))
+        
+        contests.sort(key=lambda c: c['startTimeSeconds'], reverse=True)
+        return contests
     
     def scrape_github(self):
         """Scrape GitHub for hackathon repositories"""
+        source = self.source('GitHub')
         print("🔍 Scraping GitHub Hackathons...")
         try:
-            # Search GitHub for recent hackathon repos
-            url = "https://api.github.com/search/repositories"
-            params = {
-                'q': 'hackathon 2025 OR hackathon 2026',
-                'sort': 'updated',
-                'order': 'desc',
-                'per_page': 10
-            }
-            
-            response = requests.get(url, params=params, headers=self.headers, timeout=15)
+            # Search GitHub for recent hackathon repos (cached and rate-limit aware)
+            search = GitHubSearch(self.fetcher, source['url'])
+            repos = search.search(source['params'], source['max_items'], timeout=source['timeout'])
+            record_cards(len(repos))
+            
+            for repo in repos:
+                # Filter for actual hackathon events
+                if 'hackathon' in repo['name'].lower() or 'hackathon' in repo['description'].lower():
+                    hackathon = {
+                        'name': repo['name'].replace('-', ' ').replace('_', ' ').title(),
+                        'platform': 'GitHub',
+                        'registration_link': repo['html_url'],
+                        'mode': 'Online',
+                        'organizer': repo['owner'],
+                        'fresher_friendly': True,
+                        'status': 'Live'
+                    }
+                    self.hackathons.append(hackathon)
+                    print(f"   ✓ Found: {repo['name'][:50]}")
             
-            if response.status_code == 200:
-                data = response.json()
-                
-                for repo in data.get('items', []):
-                    # Filter for actual hackathon events
-                    if 'hackathon' in repo['name'].lower() or 'hackathon' in repo.get('description', '').lower():
-                        hackathon = {
-                            'name': repo['name'].replace('-', ' ').replace('_', ' ').title(),
-                            'platform': 'GitHub',
-                            'registration_link': repo['html_url'],
-                            'mode': 'Online',
-                            'organizer': repo['owner']['login'],
-                            'fresher_friendly': True,
-                            'status': 'Live'
-                        }
-                        self.hackathons.append(hackathon)
-                        print(f"   ✓ Found: {repo['name'][:50]}")
-                
-                gh_count = len([h for h in self.hackathons if h['platform'] == 'GitHub'])
-                print(f"✅ GitHub: Found {gh_count} hackathons\n")
+            gh_count = len([h for h in self.hackathons if h['platform'] == 'GitHub'])
+            print(f"✅ GitHub: Found {gh_count} hackathons\n")
             
         except Exception as e:
             print(f"❌ GitHub error: {e}\n")
     
     def scrape_gfg(self):
         """Scrape GeeksforGeeks contests and hackathons"""
+        source = self.source('GeeksforGeeks')
         print("🔍 Scraping GeeksforGeeks...")
         try:
-            url = "https://practice.geeksforgeeks.org/events"
-            response = requests.get(url, headers=self.headers, timeout=15)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            url = source['url']
+            response = self._fetch_listing('GeeksforGeeks', url, timeout=source['timeout'])
+            if response is None:
+                return
+            soup = make_soup(response.content, source['cards'])
             
             # Find event cards
-            events = soup.find_all('div', class_='event_card')
+            events = find_cards(soup, source['cards'])
             
-            for event in events[:8]:
+            record_cards(min(len(events), source['max_items']))
+            for event in events[:source['max_items']]:
                 try:
                     # Extract event details
                     title_elem = event.find('div', class_='event_head')
@@ -591,6 +861,8 @@ class HackathonScraper:
                 except:
                     continue
             
+            soup.decompose()  # Free the tree as soon as records are out
+            self._remember('GeeksforGeeks', url, response)
             gfg_count = len([h for h in self.hackathons if h['platform'] == 'GeeksforGeeks'])
             print(f"✅ GeeksforGeeks: Found {gfg_count} events\n")
             
@@ -598,46 +870,8 @@ class HackathonScraper:
             print(f"❌ GeeksforGeeks error: {e}\n")
     
     def get_all_hackathons(self):
-        """Run all scrapers"""
-        print("\n" + "="*60)
-        print("🚀 STARTING HACKATHON SCRAPING PROCESS")
-        print("="*60 + "\n")
-        
-        # Existing scrapers
-        self.scrape_devpost()
-        time.sleep(2)
-        
-        self.scrape_mlh()
-        time.sleep(2)
-        
-        self.scrape_hackerearth()
-        time.sleep(2)
-        
-        self.scrape_unstop()  # Updated scraper with manual fallback
-        time.sleep(2)
-        
-        # Additional scrapers
-        self.scrape_codechef()
-        time.sleep(2)
-        
-        self.scrape_kaggle()
-        time.sleep(2)
-        
-        self.scrape_leetcode()
-        time.sleep(2)
-        
-        self.scrape_codeforces()
-        time.sleep(2)
-        
-        self.scrape_github()
-        time.sleep(2)
-        
-        self.scrape_gfg()
-        
-        print("="*60)
-        print(f"✅ SCRAPING COMPLETE: Found {len(self.hackathons)} total hackathons")
-        print("="*60 + "\n")
-        
+        """Run all scrapers in parallel"""
+        self.hackathons.extend(scrape_all([HackathonScraper]))
         return self.hackathons
 
 
@@ -0,0 +1,192 @@
+import heapq
+import re
+import threading
+from bisect import bisect_left
+from itertools import islice
+from operator import attrgetter, itemgetter
+
+from records import as_record
+
+# Fields searched, and how much a word found in each counts towards the rank
+FIELD_WEIGHTS = (('name', 3), ('organizer', 2), ('platform', 1))
+
+# A query word matches the words it is a prefix of; a whole-word match ranks this much higher
+EXACT_BONUS = 2
+
+# A query word this short only matches whole words (the first keystroke,
+# "g", would otherwise match most of the index); a longer one expands to at
+# most MAX_EXPANSIONS words, the shortest first
+MIN_PREFIX = 2
+MAX_EXPANSIONS = 100
+
+# Results per page: the default and the most a client can ask for
+PER_PAGE = 20
+MAX_PER_PAGE = 100
+
+_WORD = re.compile(r'[^\W_]+')
+# Sorts after any character a word can continue with
+_LAST_CHAR = chr(0x10FFFF)
+
+
+def words(text):
+    return _WORD.findall(text.lower()) if isinstance(text, str) else []
+
+
+# The values of a record's searched fields (its slots, read directly):
+# two records with the same are indexed the same
+_indexed = attrgetter(*(field for field, _ in FIELD_WEIGHTS))
+
+
+def _weights(hack):
+    """{word: weight} of one record"""
+    weights = {}
+    for field, weight in FIELD_WEIGHTS:
+        for word in words(hack.get(field)):
+            weights[word] = weights.get(word, 0) + weight
+    return weights
+
+
+class SearchIndex:
+    """
+    Inverted index over the name, organizer and platform of a snapshot of
+    hackathons, for search as you type.
+
+    Every word maps to the hackathons containing it and its weight in each,
+    and the vocabulary is kept sorted, so a query word is looked up by
+    prefix with a binary search instead of a scan over every record.
+    sync() updates the index with only the records that changed between
+    snapshots. A published index is never modified, only replaced.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Serializes sync(): each builds on the index the previous one published
+        self._sync_lock = threading.Lock()
+        self.records = {}    # dedupe key -> record, in snapshot order
+        self.postings = {}   # word -> {dedupe key: weight}
+        self.vocabulary = []  # every word in postings, sorted
+
+    def sync(self, hackathons):
+        """
+        Make the index describe hackathons, the latest (deduplicated)
+        snapshot: records that left it are removed, new ones and the ones
+        whose searched fields changed re-indexed, the rest left as they
+        are. The new index is built aside (only the postings that change
+        are copied) and swapped in, so searches never wait on a sync.
+        """
+        current = {}
+        for hack in hackathons:
+            hack = as_record(hack)
+            current[hack.dedupe_key] = hack
+
+        with self._sync_lock:
+            records = self.records
+            removed = [key for key in records if key not in current]
+            # Every scrape builds new records: compare what is indexed, not the objects
+            changed = [key for key, hack in current.items() if key not in records or (
+                records[key] is not hack and _indexed(records[key]) != _indexed(hack))]
+
+            postings = dict(self.postings)
+            copied = set()
+            words_changed = False
+
+            def writable(word):
+                nonlocal words_changed
+                if word not in copied:
+                    copied.add(word)
+                    if word in postings:
+                        postings[word] = dict(postings[word])
+                posting = postings.get(word)
+                if posting is None:
+                    posting = postings[word] = {}
+                    words_changed = True
+                return posting
+
+            for key in removed + [key for key in changed if key in records]:
+                for word in _weights(records[key]):
+                    posting = writable(word)
+                    posting.pop(key, None)
+                    if not posting:
+                        # The last hackathon with this word is gone
+                        del postings[word]
+                        words_changed = True
+            for key in changed:
+                for word, weight in _weights(current[key]).items():
+                    writable(word)[key] = weight
+
+            vocabulary = sorted(postings) if words_changed else self.vocabulary
+            with self._lock:
+                # Results without a query come back in snapshot order
+                self.records = current
+                self.postings = postings
+                self.vocabulary = vocabulary
+
+    def _expand(self, prefix):
+        """The indexed words starting with prefix (at most MAX_EXPANSIONS, the shortest)"""
+        if len(prefix) < MIN_PREFIX:
+            return [prefix] if prefix in self.postings else []
+        start = bisect_left(self.vocabulary, prefix)
+        end = bisect_left(self.vocabulary, prefix + _LAST_CHAR, start)
+        if end - start <= MAX_EXPANSIONS:
+            return self.vocabulary[start:end]
+        return heapq.nsmallest(MAX_EXPANSIONS, self.vocabulary[start:end], key=len)
+
+    def _scores(self, query_words):
+        """{dedupe key: score} of the hackathons matching every query word"""
+        scores = None
+        # The rarest word first: it leaves the fewest candidates for the others
+        expanded = sorted(((word, self._expand(word)) for word in query_words),
+                          key=lambda item: sum(len(self.postings[match]) for match in item[1]))
+        for word, matches in expanded:
+            found = {}
+            for match in matches:
+                bonus = EXACT_BONUS if match == word else 1
+                posting = self.postings[match]
+                # Look the remaining candidates up when there are fewer of them than postings to walk
+                if scores is not None and len(scores) < len(posting):
+                    pairs = ((key, posting[key]) for key in scores if key in posting)
+                else:
+                    pairs = posting.items()
+                for key, weight in pairs:
+                    if scores is not None and key not in scores:
+                        continue
+                    score = weight * bonus
+                    if score > found.get(key, 0):
+                        found[key] = score
+            if scores is None:
+                scores = found
+            else:
+                scores = {key: scores[key] + score for key, score in found.items()}
+            if not scores:
+                break
+        return scores or {}
+
+    def search(self, query, page=1, per_page=PER_PAGE, platform=None, mode=None):
+        """
+        One page of the hackathons matching query, best match first:
+        (records, total matches). Every word of query must match the start
+        of a word in the name, organizer or platform. platform and mode,
+        if given, must match exactly (mode in any case).
+        """
+        query_words = words(query)
+        mode = mode.lower() if mode else None
+        page = max(page, 1)
+        per_page = min(max(per_page, 1), MAX_PER_PAGE)
+
+        with self._lock:
+            if query_words:
+                scores = self._scores(query_words)
+            else:
+                scores = dict.fromkeys(self.records, 0)
+            if platform or mode:
+                records = self.records
+                scores = {key: score for key, score in scores.items()
+                          if (not platform or records[key].get('platform') == platform)
+                          and (not mode or records[key].mode_key == mode)}
+
+            total = len(scores)
+            wanted = page * per_page
+            # Only the pages up to this one need ordering; ties keep the order they were indexed in
+            top = heapq.nlargest(wanted, scores.items(), key=itemgetter(1)) if query_words else \
+                list(islice(scores.items(), wanted))
+            return [self.records[key] for key, _ in top[wanted - per_page:]], total
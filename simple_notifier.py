@@ -13,7 +13,7 @@ class SimpleNotifier:
         notification_data = {
             "timestamp": datetime.now().isoformat(),
             "count": len(hackathons),
-            "hackathons": hackathons[:20]  # Save top 20
+            "hackathons": [dict(hack) for hack in hackathons[:20]]  # Save top 20
         }
         
         with open(self.log_file, 'w', encoding='utf-8') as f:
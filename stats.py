@@ -0,0 +1,139 @@
+import threading
+
+from records import UNSET, as_record, as_records
+
+# Modes with their own counter (the rest only show up in by_mode)
+MODES = ('online', 'offline', 'hybrid')
+
+
+def _counted(hack):
+    """What a record contributes to the counters"""
+    fresher = hack.fresher_friendly
+    return hack.status_key, hack.mode_key, hack.platform, fresher is not UNSET and bool(fresher)
+
+
+class HackathonStats:
+    """
+    Counters over a set of hackathons: totals, fresher friendly, per
+    status, per mode and per platform.
+
+    All counters are updated in one pass over the records added or
+    removed, so a snapshot that changes by a few records costs a few
+    updates rather than a rescan, and reading the numbers costs nothing:
+    snapshot() hands back the same dict until something changes.
+    """
+
+    def __init__(self, hackathons=()):
+        self._lock = threading.Lock()
+        self._reset()
+        hackathons = as_records(hackathons)
+        self._count(hackathons, 1)
+        if hackathons:
+            self._records = None
+
+    def _reset(self):
+        self.total = 0
+        self.fresher_friendly = 0
+        self.by_status = {}
+        self.by_mode = {}
+        self.by_platform = {}
+        # The records sync() compares the next snapshot against, by dedupe
+        # key (None once add / remove have changed the counts behind its back)
+        self._records = {}
+        self._snapshot = None
+
+    def _count(self, hackathons, step):
+        """Add step (1 or -1) to every counter of each of hackathons (records), in one pass"""
+        if not hackathons:
+            # Nothing changed: the snapshot stays valid
+            return
+        by_status, by_mode, by_platform = self.by_status, self.by_mode, self.by_platform
+        total = fresher = 0
+        for hack in hackathons:
+            total += 1
+            key = hack.status_key
+            by_status[key] = by_status.get(key, 0) + step
+            key = hack.mode_key
+            by_mode[key] = by_mode.get(key, 0) + step
+            key = hack.platform
+            if key is UNSET:
+                key = 'Unknown'
+            by_platform[key] = by_platform.get(key, 0) + step
+            # Slots are read directly; an unset fresher_friendly doesn't count
+            if hack.fresher_friendly is not UNSET and hack.fresher_friendly:
+                fresher += 1
+        self.total += total * step
+        self.fresher_friendly += fresher * step
+
+        if step < 0:
+            # A platform (or mode, or status) whose last hackathon went away no longer counts
+            for counts in (by_status, by_mode, by_platform):
+                for key in [key for key, count in counts.items() if not count]:
+                    del counts[key]
+        self._snapshot = None
+
+    def add(self, hack):
+        with self._lock:
+            self._count((as_record(hack),), 1)
+            self._records = None
+
+    def remove(self, hack):
+        """Take back a hackathon counted by add (the same record, or one equal to it)"""
+        with self._lock:
+            self._count((as_record(hack),), -1)
+            self._records = None
+
+    def sync(self, hackathons):
+        """
+        Make the counters describe hackathons, the latest (deduplicated)
+        snapshot: records that left it are removed, new or changed ones
+        added. Records the previous snapshot already had (the same record,
+        or a fresh one from a later scrape counting the same) are not
+        counted again.
+        """
+        current = {}
+        for hack in hackathons:
+            hack = as_record(hack)
+            current[hack.dedupe_key] = hack
+
+        with self._lock:
+            if self._records is None:
+                self._reset()
+            previous = self._records
+            removed, added = [], []
+            for key, old in previous.items():
+                new = current.get(key)
+                if new is None:
+                    removed.append(old)
+                elif new is not old and _counted(new) != _counted(old):
+                    removed.append(old)
+                    added.append(new)
+            added += [hack for key, hack in current.items() if key not in previous]
+            self._count(removed, -1)
+            self._count(added, 1)
+            self._records = current
+
+    def clear(self):
+        with self._lock:
+            self._reset()
+
+    def snapshot(self):
+        """
+        All counters in the shape filters.get_statistics returns. Built
+        once per change and shared between readers, so don't modify it.
+        """
+        with self._lock:
+            if self._snapshot is None:
+                stats = {
+                    'total': self.total,
+                    'live': self.by_status.get('live', 0),
+                    'upcoming': self.by_status.get('upcoming', 0),
+                    'platforms': len(self.by_platform),
+                    'fresher_friendly': self.fresher_friendly,
+                }
+                for mode in MODES:
+                    stats[mode] = self.by_mode.get(mode, 0)
+                stats['by_platform'] = dict(self.by_platform)
+                stats['by_mode'] = dict(self.by_mode)
+                self._snapshot = stats
+            return self._snapshot
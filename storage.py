@@ -0,0 +1,39 @@
+import json
+import os
+import tempfile
+
+# Everything the scrapers persist between runs lives here
+CACHE_DIR = os.getenv('HACKATHON_CACHE_DIR', '.cache')
+
+
+def cache_path(name):
+    """Path of a file inside the cache directory (created on demand)"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    return os.path.join(CACHE_DIR, name)
+
+
+def load_json(path, default):
+    """Read a JSON file, falling back to default if it is missing or corrupt"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def save_json(path, data):
+    """
+    Write a JSON file atomically.
+    Several processes (web workers, scheduler) share the cache directory,
+    so readers must never see a half-written file.
+    """
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise